@@ -1,3 +1,12 @@
+ALPHABET: str
+"""The 32 Polish letters in engine order: `Board.cells()` index `i` is `ALPHABET[i]`."""
+
+EMPTY_CELL: int
+"""`Board.cells()` value of an empty square (255)."""
+
+UNKNOWN_CELL: int
+"""`Board.cells()` value of a `'?'` tile, a blank of unknown letter (254)."""
+
 def set_num_threads(n: int) -> None:
     """Set how many threads parallel move generation uses.
 
@@ -12,6 +21,31 @@ def num_threads() -> int:
     """Number of threads parallel move generation will use (builds the pool on
     the first call if it does not exist yet)."""
 
+def play_games(
+    dawg: Dawg,
+    n: int,
+    policy: str = "greedy",
+    seed: int | None = None,
+    opponent: str | None = None,
+    parallel: bool = True,
+    no_play_limit: int = 2,
+) -> list[tuple[int, int, bool, list[str | None]]]:
+    """Play `n` whole games inside the engine and return one
+    `(p1_score, p2_score, p1_opened, moves)` per game.
+
+    `policy` (player 1) and `opponent` (player 2, default: `policy`) are
+    `"greedy"` — `SimplePlayer`'s best-scoring word — or `"strategic"` —
+    `StrategicPlayer`, which also exchanges moves under 6 points; anything
+    else raises `ValueError`. `moves` alternates from the opener: the word
+    played, `None` for an exchange, `""` for no action. Games end when a player
+    goes out or after `no_play_limit` consecutive no-action turns (2, the
+    simulate.py/web rule, by default; `graj` uses 4; below 1 raises
+    `ValueError`), with standard end-of-game rack scoring. Game `i` is seeded from `seed + i`, so a seeded
+    call is reproducible; without one it is seeded from the clock. With
+    `parallel`, games run concurrently on the move-generation pool.
+    Releases the GIL.
+    """
+
 class Dawg:
     """DAWG (Directed Acyclic Word Graph) dictionary loaded from a binary file.
 
@@ -20,7 +54,14 @@ class Dawg:
     move generation. Word lookups (`contains`) always use the compact DAWG.
     """
 
-    def __init__(self, path: str, gaddag_path: str | None = None) -> None:
+    def __init__(
+        self,
+        path: str,
+        gaddag_path: str | None = None,
+        compact: bool = False,
+        openings_path: str | None = None,
+        cache_size: int = 4096,
+    ) -> None:
         """Load a DAWG from a .bin file built with the `build` command.
 
         If `gaddag_path` is omitted, a sibling GADDAG is auto-loaded when
@@ -30,6 +71,25 @@ class Dawg:
         uses fast anchor-based generation; otherwise it falls back to the legacy
         DAWG pattern search. Pass an explicit `gaddag_path` to override, or leave
         both absent to run purely on the DAWG.
+
+        Files in the flat format (what `build`/`build-gaddag` write) are
+        memory-mapped rather than read, so construction is O(1) and worker
+        processes loading the same files share one copy of them.
+
+        With `compact=True`, graphs stored with wide (12-byte) edges are
+        repacked on load into 4-byte edges: a third of the memory for the
+        edge table, but a private heap copy instead of a shared mapping.
+        Files already written packed (`convert ... packed`) are mapped as-is.
+
+        An opening book (`build-openings`) is found the same way as the GADDAG
+        (`words/openings.bin`), or given as `openings_path`. It is memory-mapped,
+        and the opening move for a full rack without blanks is then looked up
+        instead of generated. Raises `OSError` if the book was built for another
+        lexicon.
+
+        `Board.get_best_words` results are cached in the `Dawg`, keyed by the
+        position and the rack, keeping the `cache_size` most recently used
+        entries (0 disables the cache). See `cache_stats`.
         """
 
     def contains(self, word: str) -> bool:
@@ -45,6 +105,32 @@ class Dawg:
         """Whether a GADDAG is loaded, i.e. whether `Board.get_best_words`
         uses the fast anchor-based generator rather than the legacy fallback."""
 
+    def has_openings(self) -> bool:
+        """Whether an opening book is loaded, i.e. whether the opening move for a
+        full rack without blanks is looked up rather than generated."""
+
+    def is_mapped(self) -> bool:
+        """Whether the DAWG (and GADDAG, if loaded) are served zero-copy from
+        memory-mapped flat files, shared through the page cache with every
+        other process that opened them. False if any was in the legacy
+        format and had to be decoded into a private heap copy."""
+
+    def cache_stats(self) -> tuple[int, int, int, int]:
+        """`(hits, misses, entries, capacity)` of the move cache. A hit is a
+        `get_best_words` call answered without generating: the same position
+        and rack (in any letter order) was asked before for at least `n` moves."""
+
+    def set_cache_size(self, capacity: int) -> None:
+        """Resize the move cache, evicting the least recently used entries
+        beyond `capacity`. 0 disables it."""
+
+    def clear_cache(self) -> None:
+        """Drop every cached result and reset the hit/miss counters."""
+
+    def is_compact(self) -> bool:
+        """Whether the DAWG (and GADDAG, if loaded) store packed 4-byte edges,
+        either on disk or because they were repacked with `compact=True`."""
+
     def search(self, pattern: str, letters: str) -> list[str]:
         """Find all words matching the pattern, using letters from the bag.
 
@@ -66,14 +152,43 @@ class Dawg:
             dawg.search("*",    "abcd?")  # all words buildable from these tiles
         """
 
+class LeaveModel:
+    """smart_player's `LeaveValueNet` as plain weights the engine evaluates
+    itself: dense layers with ReLU between them and one output, over
+    `model.encode_leave`'s inputs. Build it with `model.get_engine_model`."""
+
+    def __init__(self, alphabet: str, layers: list[tuple[list[list[float]], list[float]]]) -> None:
+        """`alphabet` is the model's tile order (`"".join(model.ALPHABET)`, `'?'`
+        for the blank). `layers` holds each `torch.nn.Linear`'s `(weight, bias)`
+        as nested lists, first layer first.
+
+        Raises `ValueError` if the alphabet isn't the 33 tiles of the bag, if the
+        first layer doesn't take the 39 leave inputs, if consecutive layers don't
+        chain, or if the last layer doesn't have exactly one output.
+        """
+
+    def evaluate(
+        self, leaves: list[str], unseen_tiles: int, board_features: tuple[float, float, float, float, float]
+    ) -> list[float]:
+        """Predicted value of each leave, for `unseen_tiles`
+        (`Board.unseen_total`) and `board_features` (`Board.features`).
+        Computed in `float32` like the torch model, so values can differ from
+        torch's only in the last bits."""
+
 class Board:
     """Scrabble board with a DAWG dictionary and a bag of letters."""
 
-    def __init__(self) -> None:
-        """Initialize an empty 15x15 board with a full standard tile bag."""
+    def __init__(self, seed: int | None = None) -> None:
+        """Initialize an empty 15x15 board with a full standard tile bag.
+
+        With a `seed` (0 to 2**64 - 1), every draw from the bag
+        (`give_letters`, `exchange_letters`) follows one reproducible stream:
+        the same seed and the same calls give the same tiles. Unseeded boards
+        draw from the clock.
+        """
 
     @staticmethod
-    def from_grid(board: list[list[str]]) -> Board:
+    def from_grid(board: list[list[str]], blanks: list[tuple[int, int]] = []) -> Board:
         """Construct a board pre-filled from a 15x15 grid of characters.
 
         Each cell can be:
@@ -83,11 +198,69 @@ class Board:
         The board must be exactly 15 rows of 15 columns each. Starts with a
         full standard tile bag, same as `Board()` -- letters already on the
         grid are not subtracted from it.
+
+        `blanks` lists the `(row, col)` cells whose letter is a blank, as
+        `blank_cells()` returns them; without it every letter is a real tile.
+        `from_grid(b.grid(), b.blank_cells())` rebuilds `b`'s position exactly.
         """
 
     def __str__(self) -> str:
         """Return a string representation of the board for printing."""
 
+    def features(self) -> tuple[float, float, float, float, float]:
+        """`(tw_open, dw_open, tl_open, dl_open, board_fill)`: the fraction of
+        triple-word, double-word, triple-letter and double-letter squares
+        still unoccupied (8/17/12/24 on the board; the centre counts as a
+        double word), and the fraction of all 225 squares occupied.
+
+        The board-context input of smart_player's leave model. Maintained by
+        `place_word`, so reading it is O(1).
+        """
+
+    def unseen_counts(self, rack: str) -> dict[str, int]:
+        """Tiles not on the board or in `rack` -- still in the bag or on an
+        opponent's rack -- as letter -> count, `'?'` for blanks. Letters with
+        none left are omitted. A blank on the board counts as a `'?'`
+        whatever letter it shows; rack letters beyond what is left are ignored.
+
+        The board keeps its per-letter tile counts up to date in `place_word`,
+        so this never scans the grid.
+        """
+
+    def unseen_total(self, rack: str) -> int:
+        """`sum(unseen_counts(rack).values())`: the unseen-tile count the leave
+        heuristics and smart_player's model take as game phase."""
+
+    def grid(self) -> list[list[str]]:
+        """The 15x15 grid as one-character strings, `'-'` for empty: the cells
+        `str(board)` prints, in the shape `from_grid` accepts, built without
+        formatting and re-parsing the string."""
+
+
+    def blank_cells(self) -> list[tuple[int, int]]:
+        """The `(row, col)` cells holding a blank tile, row-major.
+
+        `grid()` shows a blank as the letter it stands for; pass these to
+        `from_grid` with the grid to rebuild the same position.
+        """
+    def cells(self) -> bytes:
+        """The 225 squares row-major, one byte per square: `i < 32` for the
+        letter `ALPHABET[i]`, `EMPTY_CELL` for an empty square and
+        `UNKNOWN_CELL` for a `'?'`. A snapshot, not a live view --
+        `numpy.frombuffer(board.cells(), numpy.uint8).reshape(15, 15)` wraps it
+        without copying."""
+
+    def hash(self) -> int:
+        """64-bit Zobrist hash of the position: every tile, with its square and
+        whether it is a blank, plus whether the opening is still to be played.
+
+        `place_word` updates it incrementally, so reading it is O(1) -- key
+        caches and deduplication on it rather than on `str(board)`. Equal
+        positions hash equal across boards and processes, including boards
+        rebuilt with `from_grid(grid, blanks)` -- pass the blank cells, since a
+        blank showing a letter hashes differently from that letter's tile.
+        """
+
     def calculate_word_points(self, word: str, row: int, col: int, horizontal: bool, letters: str) -> int:
         """Calculate the points for placing a word at the given position and orientation.
 
@@ -95,11 +268,36 @@ class Board:
         The points are calculated based on letter values and board bonuses.
         """
 
-    def place_word(self, word: str, row: int, col: int, horizontal: bool) -> None:
+    def place_word(
+        self, word: str, row: int, col: int, horizontal: bool, blanks: list[int] = []
+    ) -> None:
         """Place a word on the board at the given position and orientation.
 
         The word must fit on the board and can only be placed on empty cells ('-').
         This method modifies the board state by filling in the letters of the word.
+
+        `blanks` lists the positions in `word` played with a blank tile: they
+        show their letter but score 0 in every later word through them. A '?' in
+        `word` is a blank of unknown letter. Raises ValueError for a character
+        that is not a tile, leaving the board unchanged.
+        """
+
+    def place_move(self, move: tuple[str, int, tuple[int, int, bool], list[str]]) -> None:
+        """Place a move exactly as `get_best_words`/`get_best_word` returned it.
+
+        Same as `place_word`, with `blanks` taken from the move's `used` list:
+        the new tiles it spends a '?' on are placed as blanks. Use this rather
+        than `place_word(word, row, col, horizontal)` for engine moves, or a
+        blank would score as a real letter from then on.
+        """
+
+    def rack_blanks(self, word: str, row: int, col: int, horizontal: bool, letters: str) -> list[int]:
+        """Positions in `word` that a rack of `letters` can only cover with a blank.
+
+        Each new tile, in order, uses a real letter from `letters` while one is
+        left and a '?' otherwise -- the same accounting `calculate_word_points`
+        scores with. Pass the result as `place_word`'s `blanks` for a move that
+        did not come from the engine.
         """
 
     def get_row_patterns(self, row_idx: int) -> list[tuple[int, int]]:
@@ -138,7 +336,7 @@ class Board:
         """
 
     def get_best_words(
-        self, dawg: Dawg, letters: str, n: int, parallel: bool = True
+        self, dawg: Dawg, letters: str, n: int, parallel: bool = True, prune: bool = True
     ) -> list[tuple[str, int, tuple[int, int, bool], list[str]]]:
         """Find the `n` best scoring words that can be placed on the board with the given letters.
 
@@ -155,14 +353,68 @@ class Board:
         so for `n > 1` it can under-report a span's other high-scoring plays; the best move
         (`n == 1`, `get_best_word`) is identical for both. Scores are computed identically
         either way.
+
+        With `prune` and `n == 1`, anchors whose score ceiling cannot reach the best
+        play found so far are skipped. The result is the same; only the search is shorter.
+
+        The GIL is released while the moves are generated (as in `search`,
+        `calculate_word_points` and `best_word_from_pattern`), so other Python threads
+        keep running. Don't use one `Board` from two threads at once.
         """
 
-    def get_best_word(
+    def get_best_words_by_leave(
+        self,
+        dawg: Dawg,
+        letters: str,
+        model: LeaveModel,
+        n: int = 1,
+        candidates: int = 50,
+        parallel: bool = True,
+    ) -> list[tuple[str, int, tuple[int, int, bool], list[str], float]]:
+        """SmartPlayer's move decision in one call.
+
+        Takes the top `candidates` moves by score (`get_best_words`), predicts with
+        `model` the value of the rack each one leaves, given this position's
+        `unseen_total(letters)` and `features()`, and returns the best `n` by
+        `score + round(value)`. Ties keep score order. Each move is a
+        `get_best_words` tuple with its leave value appended. Releases the GIL like
+        `get_best_words`.
+        """
+
+    def get_score_stats(
         self, dawg: Dawg, letters: str, parallel: bool = True
+    ) -> tuple[int, int, int, list[int]]:
+        """Score distribution over every legal play for the given letters.
+
+        Returns `(count, best, worst, histogram)`, where `histogram[s]` is the number of
+        plays scoring `s` (so `len(histogram) == best + 1`). Generation is the same as
+        `get_best_words`, but no play is built or returned, which makes rating a move
+        against every alternative about as cheap as one search. Returns `(0, 0, 0, [])`
+        when there is no legal play.
+
+        Without a GADDAG only the best play per board span is counted (see
+        `get_best_words`). Releases the GIL like `get_best_words`.
+        """
+
+    def get_best_words_many(
+        self, dawg: Dawg, racks: list[str], n: int, parallel: bool = True, prune: bool = True
+    ) -> list[list[tuple[str, int, tuple[int, int, bool], list[str]]]]:
+        """`get_best_words(dawg, rack, n)` for every rack in `racks`, against this
+        one position, in a single call.
+
+        Cross-checks and anchors depend only on the board, so they are computed
+        once and shared by every rack, and the GIL is released for the whole
+        batch. With `parallel`, racks are generated concurrently on the engine's
+        pool (a single rack parallelises over anchors instead). Results are in
+        `racks` order and identical to calling `get_best_words` per rack.
+        """
+
+    def get_best_word(
+        self, dawg: Dawg, letters: str, parallel: bool = True, prune: bool = True
     ) -> tuple[str, int, tuple[int, int, bool], list[str]]:
         """Find the best scoring word that can be placed on the board with the given letters.
 
-        Equivalent to `get_best_words(dawg, letters, first, n=1, parallel=parallel)[0]`,
+        Equivalent to `get_best_words(dawg, letters, n=1, parallel=parallel, prune=prune)[0]`,
         or `("", 0, (0, 0, True), [])` if no valid word can be placed.
         The returned list contains the letters used from the player's hand, one entry per newly
         placed tile, with `'?'` for any tile a blank had to stand in for (see `get_best_words`).
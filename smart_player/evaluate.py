@@ -8,14 +8,29 @@ src/main.py's benchmark(), swapping in SmartPlayer for one side). Two modes:
 The --candidate mode is what iterate.py uses to decide whether a freshly
 trained checkpoint is actually better than the current champion before
 promoting it.
+
+--duplicate plays every seeded tile sequence twice, once from each seat,
+and reports per-pair results with confidence intervals. Both sides see the
+same racks, so the luck of the draw cancels out of each pair and far fewer
+games separate two players. --stop-at THRESHOLD ends the run as soon as the
+score-rate interval lies entirely above or below THRESHOLD.
+
+--sprt P0 P1 runs a sequential probability ratio test of "score rate is P0"
+against "score rate is P1" on results as they stream in, and stops as soon
+as one is accepted (alpha/beta error rates via --alpha/--beta). That is how
+iterate.py gates candidates: a clearly worse one is rejected after a few
+hundred games instead of the full budget.
 """
 
 import argparse
+import math
 import os
 import sys
 import time
 from concurrent.futures import ProcessPoolExecutor, as_completed
-from random import random
+from random import random, randrange
+from statistics import NormalDist
+from typing import Any
 
 from tqdm import tqdm  # type: ignore
 
@@ -34,33 +49,141 @@ _dawg = Dawg(os.path.join(_words_dir, "dawg.bin"), os.path.join(_words_dir, "gad
 _OPPONENTS = {"strategic": StrategicPlayer, "simple": SimplePlayer}
 
 
-def _play_vs_baseline(opponent_name: str, model_path: str) -> tuple[int, int]:
+def _play_vs_baseline(
+    opponent_name: str, model_path: str, seed: int | None = None, smart_first: bool | None = None
+) -> tuple[int, int]:
     """Play one game, SmartPlayer(model_path) vs. the named baseline
-    (random seat assignment so first-move advantage evens out). Returns
+    (random seat assignment so first-move advantage evens out, unless
+    `smart_first` fixes it). Players are dealt in seat order, so with a
+    `seed` each seat gets the same racks whoever sits in it. Returns
     (smart_score, opponent_score)."""
-    board = Board()
-    smart = SmartPlayer(board, model_path)
-    other = _OPPONENTS[opponent_name](board)
-    players = [smart, other] if random() < 0.5 else [other, smart]
+    board = Board(seed=seed)
+    if smart_first is None:
+        smart_first = random() < 0.5
+    if smart_first:
+        smart = SmartPlayer(board, model_path)
+        other = _OPPONENTS[opponent_name](board)
+        players = [smart, other]
+    else:
+        other = _OPPONENTS[opponent_name](board)
+        smart = SmartPlayer(board, model_path)
+        players = [other, smart]
 
     play_game(players, _dawg, parallel=False)
 
-    smart_idx = 0 if players[0] is smart else 1
-    return players[smart_idx].score, players[1 - smart_idx].score
+    return smart.score, other.score
 
 
-def _play_candidate(champion_path: str, candidate_path: str) -> tuple[int, int]:
+def _play_candidate(
+    champion_path: str, candidate_path: str, seed: int | None = None, candidate_first: bool | None = None
+) -> tuple[int, int]:
     """Play one game, candidate checkpoint vs. champion checkpoint (random
-    seat assignment). Returns (candidate_score, champion_score)."""
-    board = Board()
-    champion = SmartPlayer(board, champion_path)
-    candidate = SmartPlayer(board, candidate_path)
-    players = [candidate, champion] if random() < 0.5 else [champion, candidate]
+    seat assignment unless `candidate_first` fixes it; dealt in seat order
+    like `_play_vs_baseline`). Returns (candidate_score, champion_score)."""
+    board = Board(seed=seed)
+    if candidate_first is None:
+        candidate_first = random() < 0.5
+    first, second = (candidate_path, champion_path) if candidate_first else (champion_path, candidate_path)
+    players = [SmartPlayer(board, first), SmartPlayer(board, second)]
 
     play_game(players, _dawg, parallel=False)
 
-    candidate_idx = 0 if players[0] is candidate else 1
-    return players[candidate_idx].score, players[1 - candidate_idx].score
+    candidate, champion = players if candidate_first else players[::-1]
+    return candidate.score, champion.score
+
+
+def _play_pair(
+    opponent_name: str, model_path: str, candidate_path: str | None, seed: int
+) -> tuple[tuple[int, int], tuple[int, int]]:
+    """Play one duplicate pair: the same seeded tile sequence twice, with the
+    subject in the first seat and then in the second. Returns both games'
+    (subject_score, other_score)."""
+    if candidate_path:
+        return (
+            _play_candidate(model_path, candidate_path, seed, candidate_first=True),
+            _play_candidate(model_path, candidate_path, seed, candidate_first=False),
+        )
+    return (
+        _play_vs_baseline(opponent_name, model_path, seed, smart_first=True),
+        _play_vs_baseline(opponent_name, model_path, seed, smart_first=False),
+    )
+
+
+class _RunningMean:
+    """Mean and normal-approximation confidence interval of a stream of
+    per-pair values, without keeping the values."""
+
+    def __init__(self) -> None:
+        self.n = 0
+        self._sum = 0.0
+        self._sum_sq = 0.0
+
+    def add(self, x: float) -> None:
+        self.n += 1
+        self._sum += x
+        self._sum_sq += x * x
+
+    @property
+    def mean(self) -> float:
+        return self._sum / self.n if self.n else float("nan")
+
+    @property
+    def variance(self) -> float:
+        if self.n < 2:
+            return float("nan")
+        return max(0.0, (self._sum_sq - self._sum * self._sum / self.n) / (self.n - 1))
+
+    def interval(self, z: float) -> tuple[float, float]:
+        if self.n < 2:
+            return float("-inf"), float("inf")
+        half = z * math.sqrt(self.variance / self.n)
+        return self.mean - half, self.mean + half
+
+
+class _Sprt:
+    """Sequential probability ratio test of mean score `p0` (H0) against
+    `p1` (H1) over a stream of per-unit scores in [0, 1] -- single games, or
+    duplicate pairs. Uses the normal approximation with the sample variance
+    (the generalised SPRT chess engines gate patches with), so ties and
+    pair scores need no separate model:
+
+        LLR = (p1 - p0) * (sum - n * (p0 + p1) / 2) / variance
+
+    H1 is accepted once LLR reaches log((1 - beta) / alpha), H0 once it
+    falls to log(beta / (1 - alpha))."""
+
+    def __init__(self, p0: float, p1: float, alpha: float = 0.05, beta: float = 0.05) -> None:
+        if not 0.0 <= p0 < p1 <= 1.0:
+            raise ValueError(f"SPRT needs 0 <= p0 < p1 <= 1, got p0={p0}, p1={p1}")
+        self.p0, self.p1 = p0, p1
+        self.lower = math.log(beta / (1 - alpha))
+        self.upper = math.log((1 - beta) / alpha)
+        self.scores = _RunningMean()
+
+    def add(self, x: float) -> None:
+        self.scores.add(x)
+
+    @property
+    def llr(self) -> float:
+        variance = self.scores.variance
+        if not variance > 0:  # too few results (nan), or all identical so far
+            return 0.0
+        n = self.scores.n
+        return (self.p1 - self.p0) * (self.scores.mean - (self.p0 + self.p1) / 2) * n / variance
+
+    @property
+    def decision(self) -> str | None:
+        """"accept" (H1), "reject" (H0), or None while undecided."""
+        llr = self.llr
+        if llr >= self.upper:
+            return "accept"
+        if llr <= self.lower:
+            return "reject"
+        return None
+
+
+def _game_points(s: int, o: int) -> float:
+    return 1.0 if s > o else 0.0 if o > s else 0.5
 
 
 def run(
@@ -70,21 +193,52 @@ def run(
     candidate_path: str | None = None,
     n_workers: int | None = None,
     quiet: bool = False,
-) -> dict[str, float]:
+    duplicate: bool = False,
+    seed: int | None = None,
+    stop_at: float | None = None,
+    confidence: float = 0.95,
+    min_pairs: int = 100,
+    sprt: tuple[float, float] | None = None,
+    alpha: float = 0.05,
+    beta: float = 0.05,
+) -> dict[str, Any]:
     """Play `n_games` and return {wins, losses, ties, win_rate, avg_self,
-    avg_opponent} for the "subject" side (SmartPlayer, or the candidate
-    checkpoint when `candidate_path` is given)."""
+    avg_opponent, games} for the "subject" side (SmartPlayer, or the
+    candidate checkpoint when `candidate_path` is given); `games` is how
+    many were actually played.
+
+    With `duplicate`, games are played in seeded pairs (see `run_duplicate`),
+    which adds the paired statistics and may stop early. With `sprt=(p0,
+    p1)`, results are tested as they arrive (see `_Sprt`; per game, or per
+    pair with `duplicate`) and the run stops once the test decides; the
+    result adds `sprt` ("accept", "reject" or None if `n_games` ran out
+    first) and `llr`."""
+    test = _Sprt(*sprt, alpha, beta) if sprt else None
+    if duplicate:
+        return run_duplicate(
+            n_games,
+            opponent,
+            model_path,
+            candidate_path,
+            n_workers,
+            quiet,
+            seed=seed,
+            stop_at=stop_at,
+            confidence=confidence,
+            min_pairs=min_pairs,
+            sprt=test,
+        )
     wins = losses = ties = 0
     self_total = opp_total = 0
     label = "candidate vs champion" if candidate_path else f"SmartPlayer vs {opponent}"
     wall_start = time.perf_counter()
 
-    try:
-        with ProcessPoolExecutor(max_workers=n_workers) as executor:
-            if candidate_path:
-                futures = [executor.submit(_play_candidate, model_path, candidate_path) for _ in range(n_games)]
-            else:
-                futures = [executor.submit(_play_vs_baseline, opponent, model_path) for _ in range(n_games)]
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        if candidate_path:
+            futures = [executor.submit(_play_candidate, model_path, candidate_path) for _ in range(n_games)]
+        else:
+            futures = [executor.submit(_play_vs_baseline, opponent, model_path) for _ in range(n_games)]
+        try:
             for future in tqdm(as_completed(futures), total=n_games, desc=label, disable=quiet):
                 s, o = future.result()
                 self_total += s
@@ -95,28 +249,162 @@ def run(
                     losses += 1
                 else:
                     ties += 1
-    except KeyboardInterrupt:
-        print("\nKeyboardInterrupt received, stopping early...")
+                if test is not None:
+                    test.add(_game_points(s, o))
+                    if test.decision:
+                        break
+        except KeyboardInterrupt:
+            print("\nKeyboardInterrupt received, stopping early...")
+        # Whatever hasn't started yet is no longer needed.
         for future in futures:
             future.cancel()
 
     elapsed = time.perf_counter() - wall_start
+    played = wins + losses + ties
     decisive = wins + losses
     win_rate = wins / decisive if decisive else float("nan")
 
     if not quiet:
-        print(f"\n{n_games} games ({label}) in {elapsed:.1f}s")
+        print(f"\n{played} games ({label}) in {elapsed:.1f}s")
         print(f"{wins}W {losses}L {ties}T  win rate {win_rate * 100:.1f}%")
-        print(f"Avg score -- subject: {self_total / n_games:.1f}  other: {opp_total / n_games:.1f}")
+        if played:
+            print(f"Avg score -- subject: {self_total / played:.1f}  other: {opp_total / played:.1f}")
+        if test is not None:
+            _print_sprt(test)
 
-    return {
+    result = {
         "wins": wins,
         "losses": losses,
         "ties": ties,
         "win_rate": win_rate,
-        "avg_self": self_total / n_games,
-        "avg_opponent": opp_total / n_games,
+        "avg_self": self_total / played if played else float("nan"),
+        "avg_opponent": opp_total / played if played else float("nan"),
+        "games": played,
+    }
+    if test is not None:
+        result |= {"sprt": test.decision, "llr": test.llr}
+    return result
+
+
+def _print_sprt(test: _Sprt) -> None:
+    verdict = {"accept": f"H1 (p={test.p1}) accepted", "reject": f"H0 (p={test.p0}) accepted"}
+    print(
+        f"SPRT: {verdict.get(test.decision, 'undecided')} after {test.scores.n} results, "
+        f"LLR {test.llr:.2f} in [{test.lower:.2f}, {test.upper:.2f}]"
+    )
+
+
+def run_duplicate(
+    n_games: int,
+    opponent: str = "strategic",
+    model_path: str = DEFAULT_WEIGHTS_PATH,
+    candidate_path: str | None = None,
+    n_workers: int | None = None,
+    quiet: bool = False,
+    seed: int | None = None,
+    stop_at: float | None = None,
+    confidence: float = 0.95,
+    min_pairs: int = 100,
+    sprt: _Sprt | None = None,
+) -> dict[str, Any]:
+    """Play up to `n_games` as duplicate pairs: pair `i` deals tile sequence
+    `seed + i` twice, the subject taking the first seat in one game and the
+    second seat in the other. The pair, not the game, is the unit of the
+    statistics, so the shared racks and seat advantage cancel out.
+
+    Returns `run`'s keys plus `pairs`, `score_rate` (wins + ties / 2 per
+    game), `margin` (mean per-game score difference) and a `confidence`
+    interval for each (`score_rate_low`/`_high`, `margin_low`/`_high`),
+    `games` and `stopped_early`. An `sprt` test is fed each pair's score
+    and ends the run when it decides, adding `sprt` and `llr` to the
+    result. With `stop_at`, the run ends once at least
+    `min_pairs` pairs are in and the score-rate interval excludes
+    `stop_at` -- checking after every pair makes that interval somewhat
+    optimistic, so use a high `confidence` or iterate.py's sequential test
+    when the decision matters."""
+    n_pairs = max(1, (n_games + 1) // 2)
+    if seed is None:
+        seed = randrange(2**32)
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    wins = losses = ties = 0
+    self_total = opp_total = 0
+    score_rate, margin = _RunningMean(), _RunningMean()
+    stopped_early = False
+    label = "candidate vs champion" if candidate_path else f"SmartPlayer vs {opponent}"
+    wall_start = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        futures = [
+            executor.submit(_play_pair, opponent, model_path, candidate_path, seed + i) for i in range(n_pairs)
+        ]
+        try:
+            for future in tqdm(as_completed(futures), total=n_pairs, desc=f"{label} (pairs)", disable=quiet):
+                games = future.result()
+                for s, o in games:
+                    self_total += s
+                    opp_total += o
+                    if s > o:
+                        wins += 1
+                    elif o > s:
+                        losses += 1
+                    else:
+                        ties += 1
+                pair_score = sum(_game_points(s, o) for s, o in games) / 2
+                score_rate.add(pair_score)
+                margin.add(sum(s - o for s, o in games) / 2)
+
+                if sprt is not None:
+                    sprt.add(pair_score)
+                    if sprt.decision:
+                        stopped_early = score_rate.n < n_pairs
+                        break
+                if stop_at is not None and score_rate.n >= min_pairs:
+                    low, high = score_rate.interval(z)
+                    if low > stop_at or high < stop_at:
+                        stopped_early = score_rate.n < n_pairs
+                        break
+        except KeyboardInterrupt:
+            print("\nKeyboardInterrupt received, stopping early...")
+        for future in futures:
+            future.cancel()
+
+    elapsed = time.perf_counter() - wall_start
+    n_played = 2 * score_rate.n
+    decisive = wins + losses
+    rate_low, rate_high = score_rate.interval(z)
+    margin_low, margin_high = margin.interval(z)
+
+    if not quiet:
+        stop_note = " (stopped early)" if stopped_early else ""
+        print(f"\n{score_rate.n} duplicate pairs ({label}, seed {seed}) in {elapsed:.1f}s{stop_note}")
+        print(
+            f"{wins}W {losses}L {ties}T  score rate {score_rate.mean * 100:.1f}% "
+            f"[{rate_low * 100:.1f}%, {rate_high * 100:.1f}%] at {confidence:.0%}"
+        )
+        print(f"Margin per game: {margin.mean:+.1f} [{margin_low:+.1f}, {margin_high:+.1f}]")
+        if sprt is not None:
+            _print_sprt(sprt)
+
+    result = {
+        "wins": wins,
+        "losses": losses,
+        "ties": ties,
+        "win_rate": wins / decisive if decisive else float("nan"),
+        "avg_self": self_total / n_played if n_played else float("nan"),
+        "avg_opponent": opp_total / n_played if n_played else float("nan"),
+        "pairs": score_rate.n,
+        "score_rate": score_rate.mean,
+        "score_rate_low": rate_low,
+        "score_rate_high": rate_high,
+        "margin": margin.mean,
+        "margin_low": margin_low,
+        "margin_high": margin_high,
+        "games": n_played,
+        "stopped_early": stopped_early,
     }
+    if sprt is not None:
+        result |= {"sprt": sprt.decision, "llr": sprt.llr}
+    return result
 
 
 if __name__ == "__main__":
@@ -126,6 +414,38 @@ if __name__ == "__main__":
     ap.add_argument("--model-path", default=DEFAULT_WEIGHTS_PATH, help="Champion checkpoint to evaluate.")
     ap.add_argument("--candidate", default=None, help="If given, play this checkpoint against --model-path instead.")
     ap.add_argument("--workers", type=int, default=None)
+    ap.add_argument("--duplicate", action="store_true", help="Play seeded pairs with seats swapped (see above).")
+    ap.add_argument("--seed", type=int, default=None, help="First pair's tile-sequence seed (default: random).")
+    ap.add_argument(
+        "--stop-at",
+        type=float,
+        default=None,
+        help="With --duplicate, stop once the score-rate interval excludes this value (e.g. 0.52).",
+    )
+    ap.add_argument("--confidence", type=float, default=0.95, help="Interval confidence level (default: 0.95)")
+    ap.add_argument(
+        "--sprt",
+        type=float,
+        nargs=2,
+        metavar=("P0", "P1"),
+        default=None,
+        help="Stop once an SPRT of score rate P0 vs P1 decides (e.g. 0.50 0.54).",
+    )
+    ap.add_argument("--alpha", type=float, default=0.05, help="SPRT false-accept rate (default: 0.05)")
+    ap.add_argument("--beta", type=float, default=0.05, help="SPRT false-reject rate (default: 0.05)")
     args = ap.parse_args()
 
-    run(args.games, args.opponent, args.model_path, args.candidate, args.workers)
+    run(
+        args.games,
+        args.opponent,
+        args.model_path,
+        args.candidate,
+        args.workers,
+        duplicate=args.duplicate,
+        seed=args.seed,
+        stop_at=args.stop_at,
+        confidence=args.confidence,
+        sprt=tuple(args.sprt) if args.sprt else None,
+        alpha=args.alpha,
+        beta=args.beta,
+    )
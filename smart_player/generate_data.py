@@ -18,6 +18,10 @@ gate -> promote loop built on top of this.
 
     python smart_player/generate_data.py 200000 --lookahead 4
     python smart_player/generate_data.py 200000 --player smart
+    python smart_player/generate_data.py 200000 --player smart --native
+
+`--native` runs SmartPlayer's model inside the engine (SmartPlayer's
+`native` option) instead of through torch every turn.
 """
 
 import argparse
@@ -80,7 +84,7 @@ class _RecordingMixin:
     def draw_letters(self) -> None:
         if self._dealt:
             diff = self.score - self.opponent.score  # type: ignore[attr-defined]
-            unseen = len(self.get_letters_left())  # type: ignore[attr-defined]
+            unseen = self.board.unseen_total(self.letters)  # type: ignore[attr-defined]
             self.leave_log.append((self.letters, unseen, self._pre_move_board_features, diff))  # type: ignore[attr-defined]
         super().draw_letters()  # type: ignore[misc]
         self._dealt = True
@@ -119,13 +123,16 @@ def _n_step_returns(log: list[_LogEntry], final_diff: int, lookahead: int) -> li
     return samples
 
 
-def _play_one_game(parallel: bool, lookahead: int, player: str, model_path: str) -> tuple[list[_Sample], list[_Sample]]:
+def _play_one_game(
+    parallel: bool, lookahead: int, player: str, model_path: str, native: bool = False, seed: int | None = None
+) -> tuple[list[_Sample], list[_Sample]]:
     """Play one self-play game to completion and return each player's
-    (leave, unseen_tiles, board_features, n_step_return) samples."""
-    board = Board()
+    (leave, unseen_tiles, board_features, n_step_return) samples. A `seed`
+    fixes the board's tile draws, and so the whole game."""
+    board = Board(seed=seed)
     cls = _PLAYER_CLASSES[player]
-    p1 = cls(board, model_path) if player == "smart" else cls(board)
-    p2 = cls(board, model_path) if player == "smart" else cls(board)
+    p1 = cls(board, model_path, native) if player == "smart" else cls(board)
+    p2 = cls(board, model_path, native) if player == "smart" else cls(board)
     p1.opponent, p2.opponent = p2, p1
     play_game([p1, p2], _dawg, parallel=parallel)
 
@@ -143,6 +150,8 @@ def generate(
     model_path: str = DEFAULT_WEIGHTS_PATH,
     n_workers: int | None = None,
     quiet: bool = False,
+    native: bool = False,
+    seed: int | None = None,
 ) -> None:
     all_leaves: list[str] = []
     all_unseen: list[int] = []
@@ -161,10 +170,20 @@ def generate(
         with tqdm(total=n_games, desc="Self-play games", disable=quiet) as pbar:
             for i in range(0, n_games, batch):
                 futures = [
-                    executor.submit(_play_one_game, parallel, lookahead, player, model_path)
-                    for _ in range(min(batch, n_games - i))
+                    executor.submit(
+                        _play_one_game,
+                        parallel,
+                        lookahead,
+                        player,
+                        model_path,
+                        native,
+                        None if seed is None else seed + j,
+                    )
+                    for j in range(i, min(i + batch, n_games))
                 ]
-                for future in as_completed(futures):
+                # Collected in submission order when seeded, so the same seed
+                # writes the same dataset, not just the same games.
+                for future in futures if seed is not None else as_completed(futures):
                     for samples in future.result():
                         for leave, unseen, board_features, target in samples:
                             all_leaves.append(leave)
@@ -213,7 +232,22 @@ if __name__ == "__main__":
         "(policy iteration -- see iterate.py). Default: strategic.",
     )
     ap.add_argument("--model-path", default=DEFAULT_WEIGHTS_PATH, help="Checkpoint to use when --player smart.")
+    ap.add_argument(
+        "--native",
+        action="store_true",
+        help="With --player smart, evaluate the model inside the engine instead of through torch.",
+    )
     ap.add_argument("--workers", type=int, default=None)
+    ap.add_argument("--seed", type=int, default=None, help="Seed game i's tile bag with seed + i (default: random).")
     args = ap.parse_args()
 
-    generate(args.games, args.out, args.lookahead, args.player, args.model_path, args.workers)
+    generate(
+        args.games,
+        args.out,
+        args.lookahead,
+        args.player,
+        args.model_path,
+        args.workers,
+        native=args.native,
+        seed=args.seed,
+    )
@@ -9,10 +9,15 @@ Each round:
      is what makes it policy iteration rather than one static regression:
      the data-generating policy improves round over round.
   2. train.train(...) a candidate checkpoint on that round's data.
-  3. evaluate.run(..., candidate=...) the candidate against the current
-     champion over --eval-games games.
-  4. Promote (overwrite the champion checkpoint) only if the candidate's
-     win rate clears --promote-threshold -- champion/challenger gating,
+  3. evaluate.run(..., candidate=..., duplicate=True, sprt=...) the
+     candidate against the current champion in duplicate pairs (each tile
+     sequence from both seats), for at most --eval-games games, under an
+     SPRT of score rate --promote-threshold -/+ --sprt-margin: the run
+     stops as soon as the test decides, so a clearly worse candidate costs
+     a few hundred games rather than the whole budget.
+  4. Promote (overwrite the champion checkpoint) only if the SPRT accepts
+     (or, if the budget ran out undecided, the candidate's score rate
+     clears --promote-threshold) -- champion/challenger gating,
      the same guard AlphaZero-style self-play uses to stop a single bad
      training round from silently regressing the deployed model.
 
@@ -42,6 +47,9 @@ def iterate(
     lookahead: int = 4,
     eval_games: int = 3000,
     promote_threshold: float = 0.52,
+    sprt_margin: float = 0.02,
+    sprt_alpha: float = 0.05,
+    sprt_beta: float = 0.05,
     epochs: int = 30,
     hidden1: int = 128,
     hidden2: int = 64,
@@ -71,16 +79,23 @@ def iterate(
         val_mse = train_model(dataset_path, candidate_path, epochs=epochs, hidden1=hidden1, hidden2=hidden2, quiet=True)
         os.remove(dataset_path)
 
-        print(f"[{r}] evaluating candidate vs champion over {eval_games} games...")
+        print(f"[{r}] evaluating candidate vs champion over up to {eval_games} games...")
         result = evaluate_run(
             eval_games,
             model_path=champion_path,
             candidate_path=candidate_path,
             n_workers=n_workers,
             quiet=True,
+            duplicate=True,
+            sprt=(promote_threshold - sprt_margin, promote_threshold + sprt_margin),
+            alpha=sprt_alpha,
+            beta=sprt_beta,
         )
 
-        promoted = result["win_rate"] >= promote_threshold
+        if result["sprt"]:
+            promoted = result["sprt"] == "accept"
+        else:
+            promoted = result["score_rate"] >= promote_threshold
         if promoted:
             shutil.copyfile(candidate_path, champion_path)
 
@@ -88,8 +103,9 @@ def iterate(
         status = "PROMOTED" if promoted else "rejected"
         print(
             f"[{r}] candidate: {result['wins']:.0f}W {result['losses']:.0f}L {result['ties']:.0f}T "
-            f"win rate {result['win_rate'] * 100:.1f}% (avg {result['avg_self']:.1f} vs "
-            f"{result['avg_opponent']:.1f})  val mse {val_mse:.1f}  -> {status}  ({elapsed / 60:.1f} min)"
+            f"in {result['games']:.0f} games (SPRT {result['sprt'] or 'undecided'}), score rate {result['score_rate'] * 100:.1f}% "
+            f"[{result['score_rate_low'] * 100:.1f}%, {result['score_rate_high'] * 100:.1f}%] "
+            f"(margin {result['margin']:+.1f}/game)  val mse {val_mse:.1f}  -> {status}  ({elapsed / 60:.1f} min)"
         )
         history.append({"round": r, "val_mse": val_mse, **result, "promoted": promoted})
 
@@ -99,7 +115,10 @@ def iterate(
     print("\n=== Summary ===")
     for h in history:
         status = "PROMOTED" if h["promoted"] else "rejected"
-        print(f"round {h['round']}: win rate {h['win_rate'] * 100:.1f}%  val mse {h['val_mse']:.1f}  {status}")
+        print(
+            f"round {h['round']}: score rate {h['score_rate'] * 100:.1f}% over {h['games']} games  "
+            f"val mse {h['val_mse']:.1f}  {status}"
+        )
     n_promoted = sum(1 for h in history if h["promoted"])
     print(f"{n_promoted}/{rounds} rounds promoted. Final champion: {champion_path}")
 
@@ -109,13 +128,26 @@ if __name__ == "__main__":
     ap.add_argument("--rounds", type=int, default=3, help="Number of generate -> train -> gate rounds (default: 3)")
     ap.add_argument("--games", type=int, default=100000, help="Self-play games per round (default: 100000)")
     ap.add_argument("--lookahead", type=int, default=4)
-    ap.add_argument("--eval-games", type=int, default=3000, help="Games to gate each candidate over (default: 3000)")
+    ap.add_argument(
+        "--eval-games",
+        type=int,
+        default=3000,
+        help="Most games to gate each candidate over; the SPRT usually stops well short (default: 3000)",
+    )
     ap.add_argument(
         "--promote-threshold",
         type=float,
         default=0.52,
-        help="Minimum candidate win rate to replace the champion (default: 0.52)",
+        help="Minimum candidate score rate (wins + ties/2) to replace the champion (default: 0.52)",
+    )
+    ap.add_argument(
+        "--sprt-margin",
+        type=float,
+        default=0.02,
+        help="SPRT tests score rate threshold - margin (reject) vs threshold + margin (promote) (default: 0.02)",
     )
+    ap.add_argument("--sprt-alpha", type=float, default=0.05, help="SPRT false-promotion rate (default: 0.05)")
+    ap.add_argument("--sprt-beta", type=float, default=0.05, help="SPRT false-rejection rate (default: 0.05)")
     ap.add_argument("--epochs", type=int, default=30)
     ap.add_argument("--hidden1", type=int, default=128)
     ap.add_argument("--hidden2", type=int, default=64)
@@ -128,6 +160,9 @@ if __name__ == "__main__":
         args.lookahead,
         args.eval_games,
         args.promote_threshold,
+        args.sprt_margin,
+        args.sprt_alpha,
+        args.sprt_beta,
         args.epochs,
         args.hidden1,
         args.hidden2,
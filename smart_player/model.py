@@ -14,7 +14,7 @@ import numpy as np
 import torch
 import torch.nn as nn
 
-from scrablozaur import Board
+from scrablozaur import Board, LeaveModel
 
 # Single source of truth for which tiles exist -- derived from the engine's
 # own tile distribution rather than hardcoded, so it can never drift from it.
@@ -104,6 +104,7 @@ class LeaveValueNet(nn.Module):
 DEFAULT_WEIGHTS_PATH = _WEIGHTS_PATH
 
 _models: dict[str, LeaveValueNet] = {}
+_engine_models: dict[str, LeaveModel] = {}
 
 
 def get_model(path: str = DEFAULT_WEIGHTS_PATH) -> LeaveValueNet:
@@ -139,3 +140,19 @@ def get_model(path: str = DEFAULT_WEIGHTS_PATH) -> LeaveValueNet:
         model.eval()
         _models[path] = model
     return _models[path]
+
+
+def get_engine_model(path: str = DEFAULT_WEIGHTS_PATH) -> LeaveModel:
+    """The checkpoint at `path` exported to the engine: `get_model`'s Linear
+    layers copied into a `scrablozaur.LeaveModel`, cached per (process, path)
+    the same way. With it, `Board.get_best_words_by_leave` generates, values
+    every candidate's leave and ranks them in one call, and
+    `LeaveModel.evaluate` scores a batch of leaves without a torch forward."""
+    if path not in _engine_models:
+        layers = [
+            (layer.weight.tolist(), layer.bias.tolist())
+            for layer in get_model(path).net
+            if isinstance(layer, nn.Linear)
+        ]
+        _engine_models[path] = LeaveModel("".join(ALPHABET), layers)
+    return _engine_models[path]
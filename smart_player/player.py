@@ -7,9 +7,12 @@ StrategicPlayer's fixed `points < 6` threshold and vowel/consonant-balance
 heuristic (`get_letters_to_exchange`, src/strategy.py).
 """
 
+from __future__ import annotations
+
 import itertools
 import os
 import sys
+from typing import TYPE_CHECKING
 
 import numpy as np
 import torch
@@ -20,7 +23,10 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 from strategy import StrategicPlayer  # noqa: E402
 
 from board_features import encode_board  # noqa: E402
-from model import DEFAULT_WEIGHTS_PATH, encode_leave, encode_leaves, get_model  # noqa: E402
+from model import DEFAULT_WEIGHTS_PATH, encode_leave, encode_leaves, get_engine_model, get_model  # noqa: E402
+
+if TYPE_CHECKING:
+    from engine_server import EngineClient
 
 
 def remove_used(letters: str, used: list[str]) -> str:
@@ -41,14 +47,22 @@ class SmartPlayer(StrategicPlayer):
     """StrategicPlayer with a learned leave evaluator. `model_path` defaults
     to the current champion checkpoint; pass an explicit path to play a
     specific candidate/older checkpoint instead (used by evaluate.py's
-    --candidate mode and iterate.py to pit checkpoints against each other)."""
+    --candidate mode and iterate.py to pit checkpoints against each other).
+
+    With `native=True` the model runs inside the engine (see
+    model.get_engine_model): one `Board.get_best_words_by_leave` call makes
+    the whole move decision, and exchange subsets are valued by
+    `LeaveModel.evaluate`, with no torch forward per turn. That needs a local
+    `Dawg`; with an `engine_server.EngineClient` as the move source, keep
+    `native=False`: the candidates come from the daemon and torch ranks them."""
 
-    def __init__(self, board: Board, model_path: str = DEFAULT_WEIGHTS_PATH) -> None:
+    def __init__(self, board: Board, model_path: str = DEFAULT_WEIGHTS_PATH, native: bool = False) -> None:
         super().__init__(board)
         self.model_path = model_path
+        self.native = native
 
     def get_best_word(
-        self, dawg: Dawg, parallel: bool
+        self, dawg: Dawg | EngineClient, parallel: bool
     ) -> tuple[str, int, tuple[int, int, bool], list[str]]:
         # The real board/rack don't change across the ~50 candidates being
         # compared in one decision -- only each candidate's hypothetical
@@ -57,7 +71,17 @@ class SmartPlayer(StrategicPlayer):
         # *single* batched forward pass, rather than one batch-size-1 forward
         # (and its per-call dispatch overhead) per candidate.
         self._board_features = encode_board(self.board)
-        self._unseen_tiles = len(self.get_letters_left())
+        self._unseen_tiles = self.board.unseen_total(self.letters)
+        if self.native:
+            if not isinstance(dawg, Dawg):
+                raise ValueError("native=True ranks moves in the engine and needs a local Dawg, not an EngineClient")
+            ranked = self.board.get_best_words_by_leave(
+                dawg, self.letters, get_engine_model(self.model_path), 1, 50, parallel
+            )
+            if not ranked:
+                return ("", 0, (0, 0, True), [])
+            word, points, position, used, _value = ranked[0]
+            return (word, points, position, used)
         words = self.get_best_words(dawg, self.letters, parallel)
         if not words:
             return ("", 0, (0, 0, True), [])
@@ -72,7 +96,7 @@ class SmartPlayer(StrategicPlayer):
 
     def evaluate_word(
         self,
-        dawg: Dawg,
+        dawg: Dawg | EngineClient,
         word: str,
         points: int,
         position: tuple[int, int, bool],
@@ -93,6 +117,8 @@ class SmartPlayer(StrategicPlayer):
         discarded tiles is random either way, so the model's prediction for
         the kept subset is the best available signal for ranking exchanges,
         same as it ranks candidate moves."""
+        if self.native:
+            return self._leave_values([leave])[0]
         with torch.inference_mode():
             x = encode_leave(leave, self._unseen_tiles, self._board_features)
             return get_model(self.model_path)(x.unsqueeze(0)).item()
@@ -105,6 +131,8 @@ class SmartPlayer(StrategicPlayer):
         a handful of numpy passes rather than N per-sample tensor builds."""
         if not leaves:
             return []
+        if self.native:
+            return get_engine_model(self.model_path).evaluate(leaves, self._unseen_tiles, self._board_features)
         leaves_arr = np.asarray(leaves)
         unseen = np.full(len(leaves), self._unseen_tiles, dtype=np.float32)
         board_feats = np.tile(
@@ -142,7 +170,7 @@ class SmartPlayer(StrategicPlayer):
         best_i = max(range(len(values)), key=values.__getitem__)
         return discards[best_i], values[best_i]
 
-    def play_word(self, dawg: Dawg, parallel: bool = False) -> str | None:
+    def play_word(self, dawg: Dawg | EngineClient, parallel: bool = False) -> str | None:
         """Returns the played word, `None` if letters were exchanged instead
         (a real, repeatable action -- not "no play"), or `""` only when
         genuinely no action is available (no legal word and can't exchange)."""
@@ -166,7 +194,7 @@ class SmartPlayer(StrategicPlayer):
             return ""
 
         self.score += points
-        self.board.place_word(word, position[0], position[1], position[2])
+        self.board.place_move((word, points, position, used))
         self.letters = remove_used(self.letters, used)
         self.draw_letters()
         return word
@@ -0,0 +1,385 @@
+"""Long-lived engine daemon: one process owns the `Dawg` (+ GADDAG) and serves
+move generation to any number of local clients over a Unix socket.
+
+Every script that plays games (src/main.py's benchmark workers, web/game.py's
+benchmark pool, smart_player's generate_data.py/evaluate.py) loads its own
+`Dawg` per process by default. The players in src/strategy.py and
+smart_player/player.py accept an `EngineClient` wherever they take a `Dawg`,
+and `python src/main.py N 2 1 --engine-socket PATH` runs its benchmark workers
+that way: none of them loads a lexicon. The other pools still load their own. The graph files are memory-mapped, so those copies
+already share page-cache pages, but each process still pays its own load, its
+own rayon pool and its own share of the resident set. Running the engine here
+instead lets hundreds of lightweight client processes (or threads) play
+concurrently against one lexicon and one move-generation pool:
+
+    python src/engine_server.py                        # serve on the default socket
+    python src/engine_server.py --socket /tmp/e.sock   # ...or an explicit one
+
+    from engine_server import EngineClient
+    with EngineClient() as engine:
+        engine.get_best_words(board, "aeimnrt", 10)
+
+Wire format: each message is a 4-byte big-endian length followed by that many
+bytes of UTF-8 JSON. A request is `{"op": ..., **args}`; the reply is
+`{"ok": result}` or `{"error": message}`. `batch` carries a list of requests
+and answers with a list of replies, so a client can amortise one round trip
+over many racks or positions.
+
+Requests from every connection funnel into a single queue drained by one
+engine thread, which takes whatever has accumulated (up to `--max-batch`).
+`best_words` requests in it for the same position and `n` are answered by one
+`get_best_words_many` call; everything else runs one request after another,
+each with rayon-parallel generation. A lone client sees no added latency.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import queue
+import socket
+import socketserver
+import struct
+import sys
+import threading
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any
+
+_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(_ROOT))
+
+from scrablozaur import Board, Dawg  # noqa: E402
+
+DAWG_PATH = _ROOT / "words" / "dawg.bin"
+GADDAG_PATH = _ROOT / "words" / "gaddag.bin"
+DEFAULT_SOCKET = os.environ.get("SCRABLOZAUR_SOCKET", "/tmp/scrablozaur.sock")
+
+_HEADER = struct.Struct(">I")
+# Guards against a corrupt length prefix making either side allocate
+# gigabytes; real messages (a batch of a few hundred boards) are far smaller.
+_MAX_MESSAGE = 64 << 20
+
+BestWord = tuple[str, int, tuple[int, int, bool], list[str]]
+
+
+def _send(sock: socket.socket, payload: Any) -> None:
+    data = json.dumps(payload, ensure_ascii=False).encode()
+    sock.sendall(_HEADER.pack(len(data)) + data)
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes | None:
+    chunks = bytearray()
+    while len(chunks) < size:
+        chunk = sock.recv(size - len(chunks))
+        if not chunk:
+            return None
+        chunks += chunk
+    return bytes(chunks)
+
+
+def _recv(sock: socket.socket) -> Any | None:
+    """Read one message, or None if the peer closed the connection."""
+    header = _recv_exact(sock, _HEADER.size)
+    if header is None:
+        return None
+    (size,) = _HEADER.unpack(header)
+    if size > _MAX_MESSAGE:
+        raise ValueError(f"message of {size} bytes exceeds the {_MAX_MESSAGE}-byte limit")
+    data = _recv_exact(sock, size)
+    if data is None:
+        return None
+    return json.loads(data)
+
+
+def board_grid(board: Board | list[list[str]]) -> list[list[str]]:
+    """The 15x15 cell grid of a `Board` (or an already-extracted grid), in the
+    shape `Board.from_grid` accepts -- what goes over the wire in place of
+    the unpicklable Rust object."""
+    if isinstance(board, Board):
+        return board.grid()
+    return board
+
+
+def board_blanks(board: Board | list[list[str]]) -> list[tuple[int, int]]:
+    """The blank cells to send along with `board_grid`, so blanks keep
+    scoring 0 on the daemon's copy (none for a bare grid)."""
+    if isinstance(board, Board):
+        return board.blank_cells()
+    return []
+
+
+def _request_board(request: dict[str, Any]) -> Board:
+    # JSON turns the (row, col) tuples into lists.
+    return Board.from_grid(request["grid"], [tuple(cell) for cell in request.get("blanks", [])])
+
+
+def _same_board_groups(
+    batch: list[tuple[dict[str, Any], Future[Any]]],
+) -> list[list[tuple[dict[str, Any], Future[Any]]]]:
+    """Split a drained batch into what the engine can answer together:
+    `best_words` requests for the same grid, blanks and `n` share a group,
+    placed where the first of them arrived; any other request is a group of
+    one."""
+    groups: list[list[tuple[dict[str, Any], Future[Any]]]] = []
+    by_board: dict[str, list[tuple[dict[str, Any], Future[Any]]]] = {}
+    for item in batch:
+        request = item[0]
+        if not (isinstance(request, dict) and request.get("op") == "best_words"):
+            groups.append([item])
+            continue
+        key = json.dumps([request.get("grid"), request.get("blanks", []), request.get("n")])
+        if key in by_board:
+            by_board[key].append(item)
+        else:
+            by_board[key] = [item]
+            groups.append(by_board[key])
+    return groups
+
+
+# ---------------------------------------------------------------------------
+# Server
+# ---------------------------------------------------------------------------
+
+
+class EngineServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix-socket server owning one `Dawg`. Connection threads only decode
+    and enqueue; all engine calls happen on the single `_engine_loop` thread
+    so requests from every client share one rayon pool instead of contending
+    for it."""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, dawg: Dawg, max_batch: int = 64) -> None:
+        if os.path.exists(socket_path):
+            # A socket file left behind by a daemon that died without cleaning
+            # up; refuse only if something is still listening on it.
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(socket_path)
+            except OSError:
+                os.unlink(socket_path)
+            else:
+                probe.close()
+                raise RuntimeError(f"an engine is already listening on {socket_path}")
+        super().__init__(socket_path, _EngineHandler)
+        self.dawg = dawg
+        self.max_batch = max_batch
+        self.requests_served = 0
+        self.requests_grouped = 0
+        self.batches_run = 0
+        self._queue: queue.SimpleQueue[tuple[dict[str, Any], Future[Any]]] = queue.SimpleQueue()
+        self._engine = threading.Thread(target=self._engine_loop, name="engine", daemon=True)
+        self._engine.start()
+
+    def submit(self, request: dict[str, Any]) -> Future[Any]:
+        future: Future[Any] = Future()
+        self._queue.put((request, future))
+        return future
+
+    def _engine_loop(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            self.batches_run += 1
+            for group in _same_board_groups(batch):
+                if len(group) > 1 and self._run_group(group):
+                    continue
+                for request, future in group:
+                    self._run_one(request, future)
+
+    def _run_one(self, request: dict[str, Any], future: Future[Any]) -> None:
+        try:
+            future.set_result({"ok": self._dispatch(request)})
+        except Exception as e:  # reported to the client, never kills the loop
+            future.set_result({"error": f"{type(e).__name__}: {e}"})
+        self.requests_served += 1
+
+    def _run_group(self, group: list[tuple[dict[str, Any], Future[Any]]]) -> bool:
+        """Answer same-board `best_words` requests with one `get_best_words_many`
+        call. Returns False, answering none of them, if that call fails, so
+        each request is retried alone and gets its own error."""
+        first = group[0][0]
+        try:
+            board = _request_board(first)
+            racks = [request["letters"] for request, _ in group]
+            results = board.get_best_words_many(self.dawg, racks, first["n"], parallel=True)
+        except Exception:
+            return False
+        for (_, future), result in zip(group, results):
+            future.set_result({"ok": result})
+        self.requests_served += len(group)
+        self.requests_grouped += len(group)
+        return True
+
+    def _dispatch(self, request: dict[str, Any]) -> Any:
+        match request.get("op"):
+            case "best_words":
+                board = _request_board(request)
+                # Lists, not tuples, once through JSON -- the client rebuilds
+                # the `(row, col, horizontal)` tuple.
+                return board.get_best_words(self.dawg, request["letters"], request["n"], parallel=True)
+            case "best_words_many":
+                board = _request_board(request)
+                return board.get_best_words_many(self.dawg, request["racks"], request["n"], parallel=True)
+            case "contains":
+                return self.dawg.contains(request["word"])
+            case "search":
+                return self.dawg.search(request["pattern"], request["letters"])
+            case "batch":
+                replies = []
+                for sub in request["requests"]:
+                    try:
+                        replies.append({"ok": self._dispatch(sub)})
+                    except Exception as e:
+                        replies.append({"error": f"{type(e).__name__}: {e}"})
+                return replies
+            case "stats":
+                return {
+                    "requests_served": self.requests_served,
+                    "requests_grouped": self.requests_grouped,
+                    "batches_run": self.batches_run,
+                    "has_gaddag": self.dawg.has_gaddag(),
+                    "is_mapped": self.dawg.is_mapped(),
+                    "cache": dict(zip(("hits", "misses", "entries", "capacity"), self.dawg.cache_stats())),
+                }
+            case op:
+                raise ValueError(f"unknown op {op!r}")
+
+    def server_close(self) -> None:
+        super().server_close()
+        if os.path.exists(self.server_address):  # type: ignore[arg-type]
+            os.unlink(self.server_address)  # type: ignore[arg-type]
+
+
+class _EngineHandler(socketserver.BaseRequestHandler):
+    server: EngineServer
+
+    def handle(self) -> None:
+        while True:
+            try:
+                request = _recv(self.request)
+            except (ValueError, OSError):
+                return
+            if request is None:
+                return
+            _send(self.request, self.server.submit(request).result())
+
+
+def serve(socket_path: str = DEFAULT_SOCKET, max_batch: int = 64, compact: bool = False) -> None:
+    dawg = Dawg(str(DAWG_PATH), str(GADDAG_PATH), compact=compact)
+    with EngineServer(socket_path, dawg, max_batch) as server:
+        print(f"Engine serving on {socket_path} (gaddag={dawg.has_gaddag()}, mapped={dawg.is_mapped()})")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            print("\nShutting down.")
+
+
+# ---------------------------------------------------------------------------
+# Client
+# ---------------------------------------------------------------------------
+
+
+class EngineError(RuntimeError):
+    """The engine daemon rejected a request (bad arguments, invalid grid...)."""
+
+
+class EngineClient:
+    """Lightweight handle on a running engine daemon. Holds only a socket, so
+    it's cheap to open one per worker process; the methods mirror the
+    `Dawg`/`Board` calls players make, taking the board explicitly since the
+    engine keeps no per-client position.
+
+    One connection is one in-flight request at a time -- share a client
+    across threads only behind a lock, or open one per thread."""
+
+    def __init__(self, socket_path: str = DEFAULT_SOCKET) -> None:
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.connect(socket_path)
+
+    def __enter__(self) -> EngineClient:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._sock.close()
+
+    def _call(self, request: dict[str, Any]) -> Any:
+        _send(self._sock, request)
+        reply = _recv(self._sock)
+        if reply is None:
+            raise ConnectionError("engine daemon closed the connection")
+        return _unwrap(reply)
+
+    def contains(self, word: str) -> bool:
+        return self._call({"op": "contains", "word": word})
+
+    def search(self, pattern: str, letters: str) -> list[str]:
+        return self._call({"op": "search", "pattern": pattern, "letters": letters})
+
+    def get_best_words(self, board: Board | list[list[str]], letters: str, n: int) -> list[BestWord]:
+        """Top-`n` moves for `letters` on `board`, same shape as
+        `Board.get_best_words`."""
+        result = self._call(
+            {"op": "best_words", "grid": board_grid(board), "blanks": board_blanks(board), "letters": letters, "n": n}
+        )
+        return [_best_word(m) for m in result]
+
+    def get_best_word(self, board: Board | list[list[str]], letters: str) -> BestWord:
+        return next(iter(self.get_best_words(board, letters, 1)), ("", 0, (0, 0, True), []))
+
+    def get_best_words_many(
+        self, board: Board | list[list[str]], racks: list[str], n: int
+    ) -> list[list[BestWord]]:
+        """`Board.get_best_words_many` on the daemon: every rack against one
+        position in a single round trip, sharing its cross-checks."""
+        result = self._call(
+            {
+                "op": "best_words_many",
+                "grid": board_grid(board),
+                "blanks": board_blanks(board),
+                "racks": racks,
+                "n": n,
+            }
+        )
+        return [[_best_word(m) for m in moves] for moves in result]
+
+    def stats(self) -> dict[str, Any]:
+        return self._call({"op": "stats"})
+
+
+def _unwrap(reply: dict[str, Any]) -> Any:
+    if "error" in reply:
+        raise EngineError(reply["error"])
+    return reply["ok"]
+
+
+def _best_word(m: list[Any]) -> BestWord:
+    word, score, (row, col, horizontal), used = m
+    return word, score, (row, col, horizontal), used
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve move generation from one shared engine over a Unix socket.")
+    parser.add_argument(
+        "--socket",
+        default=DEFAULT_SOCKET,
+        help=f"Unix socket path (default: $SCRABLOZAUR_SOCKET or {DEFAULT_SOCKET})",
+    )
+    parser.add_argument(
+        "--max-batch",
+        type=int,
+        default=64,
+        help="Most queued requests the engine thread takes per pass (default: 64)",
+    )
+    parser.add_argument("--compact", action="store_true", help="Repack graph edges on load (see Dawg(compact=...))")
+    args = parser.parse_args()
+    serve(args.socket, args.max_batch, args.compact)
@@ -1,11 +1,12 @@
 use pyo3::exceptions::PyIOError;
 use pyo3::prelude::*;
+use pyo3::types::PyBytes;
 use rayon::prelude::*;
-use std::collections::HashMap;
+use std::collections::{BTreeMap, BinaryHeap, HashMap};
 use std::fs;
-use std::io::{self, BufWriter, Write};
-use std::sync::atomic::{AtomicUsize, Ordering};
-use std::sync::OnceLock;
+use std::io::{self, BufWriter, Read, Write};
+use std::sync::atomic::{AtomicU32, AtomicU64, AtomicUsize, Ordering};
+use std::sync::{Mutex, OnceLock};
 use std::time::{Instant, SystemTime, UNIX_EPOCH};
 
 // Per-quadrant bonus lookup. Index by (min(r, 14-r), min(c, 14-c)).
@@ -114,6 +115,10 @@ fn in_bounds(row: usize, col: usize) -> bool {
     row < BOARD_SIZE && col < BOARD_SIZE
 }
 
+fn in_bounds_signed(row: isize, col: isize) -> bool {
+    (0..BOARD_SIZE as isize).contains(&row) && (0..BOARD_SIZE as isize).contains(&col)
+}
+
 /// A candidate move: the word, its score, its (row, col, horizontal)
 /// placement, and the letters drawn from the player's hand to play it.
 type BestWord = (String, u32, (usize, usize, bool), Vec<char>);
@@ -140,6 +145,37 @@ fn quadrant_bonus(row: usize, col: usize) -> (u8, u8) {
     BONUS_TABLE[r as usize][c as usize]
 }
 
+/// Premium-square kinds tallied by `Board::features`, in its order: triple
+/// word, double word, triple letter, double letter.
+const PREMIUM_KINDS: usize = 4;
+
+/// Which premium kind the square at (row, col) is, if any. A word bonus
+/// takes precedence (the centre square counts as a double word).
+fn premium_kind(row: usize, col: usize) -> Option<usize> {
+    match quadrant_bonus(row, col) {
+        (_, 3) => Some(0),
+        (_, 2) => Some(1),
+        (3, _) => Some(2),
+        (2, _) => Some(3),
+        _ => None,
+    }
+}
+
+static PREMIUM_TOTALS: OnceLock<[u8; PREMIUM_KINDS]> = OnceLock::new();
+
+/// Squares of each premium kind on the board (8 TW, 17 DW, 12 TL, 24 DL).
+fn premium_totals() -> &'static [u8; PREMIUM_KINDS] {
+    PREMIUM_TOTALS.get_or_init(|| {
+        let mut totals = [0; PREMIUM_KINDS];
+        for r in 0..BOARD_SIZE {
+            for kind in (0..BOARD_SIZE).filter_map(|c| premium_kind(r, c)) {
+                totals[kind] += 1;
+            }
+        }
+        totals
+    })
+}
+
 // Polish letter point values, shared by calculate_word_points and rack_value
 // so the two can never drift apart.
 #[pyfunction]
@@ -233,6 +269,68 @@ fn symbol_index(c: char) -> Option<u32> {
     }
 }
 
+/// Symbol index of the GADDAG `SEP` edge (see `symbol_index`).
+const SEP_SYMBOL: u8 = ALPHABET_SIZE as u8;
+
+/// A board square as the engine stores it: the `letter_index` of its tile, or
+/// one of the two markers below. Squares are converted to and from `char`
+/// only at the Python boundary (`from_grid`, `place_word`, `__str__`) and by
+/// the legacy pattern search, which works on strings.
+type Cell = u8;
+const EMPTY: Cell = u8::MAX;
+/// A blank whose letter is unknown (a `'?'` on a loaded grid). No lexicon
+/// edge matches it, so no word can run through it.
+const UNKNOWN_TILE: Cell = u8::MAX - 1;
+
+/// The `Cell` for a tile showing `c`: a Polish letter (either case) or `'?'`.
+fn tile_cell(c: char) -> Option<Cell> {
+    if c == '?' {
+        return Some(UNKNOWN_TILE);
+    }
+    letter_index(c)
+        .or_else(|| c.to_lowercase().next().and_then(letter_index))
+        .map(|i| i as Cell)
+}
+
+/// Inverse of `tile_cell` (lower-case), with `'-'` for `EMPTY`.
+fn cell_char(cell: Cell) -> char {
+    match cell {
+        EMPTY => '-',
+        UNKNOWN_TILE => '?',
+        _ => symbol_chars()[cell as usize],
+    }
+}
+
+// Alphabet index -> face value, `letter_points` as a table for the move
+// generator's scoring.
+static SYMBOL_POINTS: OnceLock<[u32; ALPHABET_SIZE]> = OnceLock::new();
+fn symbol_points() -> &'static [u32; ALPHABET_SIZE] {
+    SYMBOL_POINTS.get_or_init(|| {
+        let mut table = [0; ALPHABET_SIZE];
+        for (i, c) in POLISH_ALPHABET.chars().enumerate() {
+            table[i] = letter_points(c);
+        }
+        table
+    })
+}
+
+/// A rack as tile counts: one slot per `letter_index`, plus `BLANK` for `'?'`.
+/// Anything else in the rack string is ignored, as it can never be played.
+type RackCounts = [u8; ALPHABET_SIZE + 1];
+const BLANK: usize = ALPHABET_SIZE;
+
+fn rack_counts(letters: &str) -> RackCounts {
+    let mut counts = [0u8; ALPHABET_SIZE + 1];
+    for c in letters.chars() {
+        if c == '?' {
+            counts[BLANK] += 1;
+        } else if let Some(i) = letter_index(c) {
+            counts[i] += 1;
+        }
+    }
+    counts
+}
+
 // ---------------------------------------------------------------------------
 // Move-generation thread pool
 // ---------------------------------------------------------------------------
@@ -315,23 +413,176 @@ impl Arena {
 // Flat, read-only DAWG loaded from a binary file
 // ---------------------------------------------------------------------------
 
-/// One decoded outgoing edge of a flat DAWG node: the edge letter, its
+/// One outgoing edge of a flat DAWG node: the edge letter's codepoint, its
 /// precomputed cross-check bit (`letter_bit`, `0` for `SEP`/non-alphabet), and
-/// the child node id. Decoding the codepoint and bit once at load keeps them
-/// off the traversal hot path.
+/// the child node id. `#[repr(C)]` because the flat file stores these records
+/// verbatim and `Dawg` reads them in place, so the codepoint is kept as a raw
+/// `u32` (any bit pattern is a valid `u32`, not every one is a valid `char`).
+#[repr(C)]
+#[derive(Clone, Copy)]
 struct Child {
+    cp: u32,
+    bit: u32,
+    id: u32,
+}
+
+impl Child {
+    #[inline]
+    fn ch(&self) -> char {
+        char::from_u32(self.cp).unwrap_or(char::REPLACEMENT_CHARACTER)
+    }
+}
+
+/// How a flat graph stores its edges. `Wide` is the 12-byte `Child` record;
+/// `Packed` is one `u32` per edge — the 6-bit symbol index (`symbol_index`)
+/// in the low bits, the child id in the high 26 — with the letter and its
+/// cross-check bit derived from the symbol. A third the size, so a worker's
+/// resident graph and the generator's working set shrink to match, at the
+/// cost of a shift and a table lookup per edge.
+#[derive(Clone, Copy, PartialEq, Eq)]
+enum EdgeEncoding {
+    Wide = 0,
+    Packed = 1,
+}
+
+impl EdgeEncoding {
+    fn from_header(v: u32) -> Option<Self> {
+        match v {
+            0 => Some(EdgeEncoding::Wide),
+            1 => Some(EdgeEncoding::Packed),
+            _ => None,
+        }
+    }
+
+    fn edge_size(self) -> usize {
+        match self {
+            EdgeEncoding::Wide => std::mem::size_of::<Child>(),
+            EdgeEncoding::Packed => std::mem::size_of::<u32>(),
+        }
+    }
+}
+
+const PACKED_SYM_BITS: u32 = 6;
+const PACKED_SYM_MASK: u32 = (1 << PACKED_SYM_BITS) - 1;
+/// Largest node count a `Packed` graph can address (2^26, ~67 M nodes).
+const PACKED_MAX_NODES: usize = 1 << (32 - PACKED_SYM_BITS);
+
+// Symbol index -> letter (`SEP` for index 32), inverse of `symbol_index`.
+static SYMBOL_CHARS: OnceLock<[char; ALPHABET_SIZE + 1]> = OnceLock::new();
+fn symbol_chars() -> &'static [char; ALPHABET_SIZE + 1] {
+    SYMBOL_CHARS.get_or_init(|| {
+        let mut table = [SEP; ALPHABET_SIZE + 1];
+        for (i, c) in POLISH_ALPHABET.chars().enumerate() {
+            table[i] = c;
+        }
+        table
+    })
+}
+
+/// One outgoing edge as the traversal sees it, whichever `EdgeEncoding` the
+/// graph stores: the letter, its cross-check bit (0 for `SEP`) and the child.
+#[derive(Clone, Copy)]
+struct Edge {
     ch: char,
     bit: u32,
     id: u32,
 }
 
-/// Flat, read-only DAWG/GADDAG decoded from its binary file into a
-/// direct-indexed form. Per node: a `terminal` flag and a 33-bit child-presence
-/// `bitmap` (bit `symbol_index(letter)`); `child_start` delimits each node's
-/// slice of the contiguous `children`, packed in symbol-index order. `find_child`
-/// is O(1) via the bitmap + a popcount; iteration reads the decoded `Child`
-/// slice directly, with no per-edge codepoint decoding.
-struct Dawg {
+impl Edge {
+    #[inline]
+    fn from_wide(c: &Child) -> Self {
+        Edge {
+            ch: c.ch(),
+            bit: c.bit,
+            id: c.id,
+        }
+    }
+
+    #[inline]
+    fn from_packed(e: u32) -> Self {
+        let sym = (e & PACKED_SYM_MASK) as usize;
+        Edge {
+            ch: symbol_chars()[sym],
+            bit: if sym < ALPHABET_SIZE { 1u32 << sym } else { 0 },
+            id: e >> PACKED_SYM_BITS,
+        }
+    }
+}
+
+/// Iterator over one node's edges, in symbol-index order.
+enum Edges<'a> {
+    Wide(std::slice::Iter<'a, Child>),
+    Packed(std::slice::Iter<'a, u32>),
+}
+
+impl Iterator for Edges<'_> {
+    type Item = Edge;
+
+    #[inline]
+    fn next(&mut self) -> Option<Edge> {
+        match self {
+            Edges::Wide(it) => it.next().map(Edge::from_wide),
+            Edges::Packed(it) => it.next().map(|&e| Edge::from_packed(e)),
+        }
+    }
+}
+
+/// Magic bytes opening a flat graph file (see `FlatLayout`). Files without it
+/// are the legacy per-node format, decoded on load instead of mapped.
+const FLAT_MAGIC: &[u8; 8] = b"SCRBFLAT";
+const FLAT_VERSION: u32 = 1;
+const FLAT_HEADER_LEN: usize = 32;
+
+fn align8(n: usize) -> usize {
+    (n + 7) & !7
+}
+
+/// Byte offsets of the flat graph's sections. The file is exactly the runtime
+/// arrays laid end to end, each 8-byte aligned, after a 32-byte header
+/// (`FLAT_MAGIC`, version, root, node count, edge count, edge encoding,
+/// reserved):
+///
+///   bitmap      u64 × nodes
+///   child_start u32 × (nodes + 1)
+///   terminal    u8  × nodes
+///   children    Child (or packed u32, see `EdgeEncoding`) × edges
+///
+/// so a memory-mapped file is used in place with no per-node decoding.
+#[derive(Clone, Copy)]
+struct FlatLayout {
+    nodes: usize,
+    edges: usize,
+    encoding: EdgeEncoding,
+    bitmap: usize,
+    child_start: usize,
+    terminal: usize,
+    children: usize,
+    total: usize,
+}
+
+impl FlatLayout {
+    fn new(nodes: usize, edges: usize, encoding: EdgeEncoding) -> Self {
+        let bitmap = FLAT_HEADER_LEN;
+        let child_start = bitmap + 8 * nodes;
+        let terminal = align8(child_start + 4 * (nodes + 1));
+        let children = align8(terminal + nodes);
+        let total = children + encoding.edge_size() * edges;
+        Self {
+            nodes,
+            edges,
+            encoding,
+            bitmap,
+            child_start,
+            terminal,
+            children,
+            total,
+        }
+    }
+}
+
+/// Decoded graph arrays, the common ground between the legacy file format,
+/// the build-time `Arena` and the flat file (`encode` writes the latter).
+struct FlatParts {
     root: u32,
     terminal: Vec<bool>,
     child_start: Vec<u32>,
@@ -339,107 +590,399 @@ struct Dawg {
     children: Vec<Child>,
 }
 
-impl Dawg {
-    fn load(path: &str) -> io::Result<Self> {
-        Self::from_bytes(fs::read(path)?)
+impl FlatParts {
+    fn with_capacity(root: u32, node_count: usize) -> Self {
+        Self {
+            root,
+            terminal: Vec::with_capacity(node_count),
+            child_start: Vec::with_capacity(node_count + 1),
+            bitmap: Vec::with_capacity(node_count),
+            children: Vec::new(),
+        }
     }
 
-    fn from_bytes(data: Vec<u8>) -> io::Result<Self> {
+    /// Append a node with the given edges, packed in symbol-index order (any
+    /// non-alphabet, non-SEP edge sorts after all known symbols) so the child
+    /// bitmap and the popcount indexing in `find_child` stay exact.
+    fn push_node(&mut self, is_terminal: bool, edges: impl IntoIterator<Item = (char, u32)>) {
+        self.child_start.push(self.children.len() as u32);
+        self.terminal.push(is_terminal);
+        let start = self.children.len();
+        for (ch, id) in edges {
+            self.children.push(Child {
+                cp: ch as u32,
+                bit: letter_bit(ch),
+                id,
+            });
+        }
+        self.children[start..].sort_by_key(|c| symbol_index(c.ch()).unwrap_or(u32::MAX));
+        let mut bm = 0u64;
+        for c in &self.children[start..] {
+            if let Some(sym) = symbol_index(c.ch()) {
+                bm |= 1u64 << sym;
+            }
+        }
+        self.bitmap.push(bm);
+    }
+
+    /// Close the node list (the final `child_start` sentinel).
+    fn finish(mut self) -> Self {
+        self.child_start.push(self.children.len() as u32);
+        self
+    }
+
+    /// Decode the legacy per-node format: root, node count, then per node a
+    /// terminal byte, an edge count and (codepoint, child id) pairs.
+    fn from_legacy(data: &[u8]) -> io::Result<Self> {
         if data.len() < 8 {
             return Err(io::Error::new(io::ErrorKind::InvalidData, "file too short"));
         }
         let root = u32::from_le_bytes(data[0..4].try_into().unwrap());
         let node_count = u32::from_le_bytes(data[4..8].try_into().unwrap()) as usize;
-
-        let mut terminal = Vec::with_capacity(node_count);
-        let mut child_start = Vec::with_capacity(node_count + 1);
-        let mut bitmap = Vec::with_capacity(node_count);
-        let mut children: Vec<Child> = Vec::new();
-
+        let mut parts = Self::with_capacity(root, node_count);
         let mut pos = 8usize;
         for _ in 0..node_count {
-            child_start.push(children.len() as u32);
-            terminal.push(data[pos] != 0);
+            let is_terminal = data[pos] != 0;
             pos += 1;
             let n_children = u32::from_le_bytes(data[pos..pos + 4].try_into().unwrap()) as usize;
             pos += 4;
-            let start = children.len();
-            for _ in 0..n_children {
-                let cp = u32::from_le_bytes(data[pos..pos + 4].try_into().unwrap());
-                let cid = u32::from_le_bytes(data[pos + 4..pos + 8].try_into().unwrap());
-                pos += 8;
-                let ch = char::from_u32(cp).unwrap();
-                children.push(Child { ch, bit: letter_bit(ch), id: cid });
-            }
-            // Pack this node's children in symbol-index order (any non-alphabet,
-            // non-SEP edge sorts after all known symbols) so the child bitmap and
-            // the popcount indexing in `find_child` stay exact.
-            children[start..].sort_by_key(|c| symbol_index(c.ch).unwrap_or(u32::MAX));
-            let mut bm = 0u64;
-            for c in &children[start..] {
-                if let Some(sym) = symbol_index(c.ch) {
-                    bm |= 1u64 << sym;
+            let edges: Vec<(char, u32)> = (0..n_children)
+                .map(|k| {
+                    let at = pos + 8 * k;
+                    let cp = u32::from_le_bytes(data[at..at + 4].try_into().unwrap());
+                    let cid = u32::from_le_bytes(data[at + 4..at + 8].try_into().unwrap());
+                    (char::from_u32(cp).unwrap(), cid)
+                })
+                .collect();
+            pos += 8 * n_children;
+            parts.push_node(is_terminal, edges);
+        }
+        Ok(parts.finish())
+    }
+
+    /// Serialize to the flat, mmap-able format described on `FlatLayout`,
+    /// with `Wide` edges.
+    fn encode(&self) -> Vec<u8> {
+        self.write(EdgeEncoding::Wide)
+    }
+
+    /// Serialize with `Packed` edges. Fails if an edge letter has no symbol
+    /// index or a node id does not fit the packed id field.
+    fn encode_packed(&self) -> io::Result<Vec<u8>> {
+        let invalid = |msg: &str| io::Error::new(io::ErrorKind::InvalidData, msg.to_string());
+        if self.terminal.len() > PACKED_MAX_NODES {
+            return Err(invalid("too many nodes for the packed edge encoding"));
+        }
+        if self.children.iter().any(|c| symbol_index(c.ch()).is_none()) {
+            return Err(invalid("edge letter outside the alphabet; cannot pack"));
+        }
+        Ok(self.write(EdgeEncoding::Packed))
+    }
+
+    fn write(&self, encoding: EdgeEncoding) -> Vec<u8> {
+        let layout = FlatLayout::new(self.terminal.len(), self.children.len(), encoding);
+        let mut buf = vec![0u8; layout.total];
+        buf[0..8].copy_from_slice(FLAT_MAGIC);
+        buf[8..12].copy_from_slice(&FLAT_VERSION.to_le_bytes());
+        buf[12..16].copy_from_slice(&self.root.to_le_bytes());
+        buf[16..20].copy_from_slice(&(layout.nodes as u32).to_le_bytes());
+        buf[20..24].copy_from_slice(&(layout.edges as u32).to_le_bytes());
+        buf[24..28].copy_from_slice(&(encoding as u32).to_le_bytes());
+        for (i, bm) in self.bitmap.iter().enumerate() {
+            let at = layout.bitmap + 8 * i;
+            buf[at..at + 8].copy_from_slice(&bm.to_le_bytes());
+        }
+        for (i, s) in self.child_start.iter().enumerate() {
+            let at = layout.child_start + 4 * i;
+            buf[at..at + 4].copy_from_slice(&s.to_le_bytes());
+        }
+        for (i, &t) in self.terminal.iter().enumerate() {
+            buf[layout.terminal + i] = t as u8;
+        }
+        for (i, c) in self.children.iter().enumerate() {
+            match encoding {
+                EdgeEncoding::Wide => {
+                    let at = layout.children + 12 * i;
+                    buf[at..at + 4].copy_from_slice(&c.cp.to_le_bytes());
+                    buf[at + 4..at + 8].copy_from_slice(&c.bit.to_le_bytes());
+                    buf[at + 8..at + 12].copy_from_slice(&c.id.to_le_bytes());
+                }
+                EdgeEncoding::Packed => {
+                    let at = layout.children + 4 * i;
+                    // Validated by `encode_packed`: the symbol exists and the id fits.
+                    let sym = symbol_index(c.ch()).unwrap_or(0);
+                    let e = (c.id << PACKED_SYM_BITS) | sym;
+                    buf[at..at + 4].copy_from_slice(&e.to_le_bytes());
                 }
             }
-            bitmap.push(bm);
         }
-        child_start.push(children.len() as u32);
+        buf
+    }
+}
+
+/// Storage behind a `Dawg`'s flat arrays: a read-only memory map of the file
+/// (shared through the page cache by every process that opens it), or a heap
+/// copy for graphs decoded from the legacy format or built in memory. The heap
+/// buffer is `u64`-backed so its sections are as aligned as a mapped file's.
+enum Backing {
+    Mapped(memmap2::Mmap),
+    Heap { words: Vec<u64>, len: usize },
+}
+
+impl Backing {
+    fn heap(bytes: &[u8]) -> Self {
+        let mut words = vec![0u64; bytes.len().div_ceil(8)];
+        // SAFETY: a `u64` buffer viewed as bytes; length is within the allocation.
+        let dst = unsafe {
+            std::slice::from_raw_parts_mut(words.as_mut_ptr() as *mut u8, words.len() * 8)
+        };
+        dst[..bytes.len()].copy_from_slice(bytes);
+        Backing::Heap {
+            words,
+            len: bytes.len(),
+        }
+    }
+
+    #[inline]
+    fn bytes(&self) -> &[u8] {
+        match self {
+            Backing::Mapped(map) => map,
+            // SAFETY: a `u64` buffer viewed as bytes; `len` is within the allocation.
+            Backing::Heap { words, len } => unsafe {
+                std::slice::from_raw_parts(words.as_ptr() as *const u8, *len)
+            },
+        }
+    }
+}
+
+/// Flat, read-only DAWG/GADDAG used in place from its file (see `FlatLayout`).
+/// Per node: a `terminal` flag and a 33-bit child-presence `bitmap` (bit
+/// `symbol_index(letter)`); `child_start` delimits each node's slice of the
+/// contiguous `children`, packed in symbol-index order. `find_child` is O(1)
+/// via the bitmap + a popcount; iteration reads the `Child` records directly,
+/// with no per-edge codepoint decoding. Loading a flat file is a header check
+/// plus an `mmap`, so construction is O(1) and N worker processes share one
+/// page-cache copy of the graph instead of each decoding a private one.
+struct Dawg {
+    root: u32,
+    layout: FlatLayout,
+    backing: Backing,
+    /// Process-unique id, so state derived from one graph (`Board`'s cached
+    /// cross-checks) can tell whether it was computed against this one.
+    id: u64,
+}
+
+static NEXT_DAWG_ID: AtomicU64 = AtomicU64::new(1);
+
+impl Dawg {
+    /// Open `path`: flat files are memory-mapped and used in place, legacy
+    /// files are decoded into an equivalent heap buffer.
+    fn load(path: &str) -> io::Result<Self> {
+        let mut file = fs::File::open(path)?;
+        let mut magic = [0u8; 8];
+        if file.read_exact(&mut magic).is_ok() && &magic == FLAT_MAGIC {
+            // SAFETY: the map is read-only and the graph files are never
+            // rewritten in place (`build`/`convert` create them afresh); a
+            // truncated or corrupt file is caught by `from_backing`'s checks.
+            let map = unsafe { memmap2::Mmap::map(&file)? };
+            Self::from_backing(Backing::Mapped(map))
+        } else {
+            Self::from_bytes(fs::read(path)?)
+        }
+    }
+
+    /// `load`, then repack the edges as `Packed` on the heap if `compact` is
+    /// set and the file stores them `Wide`. A file converted to `Packed`
+    /// ahead of time (`convert ... packed`) is mapped as is either way.
+    fn open(path: &str, compact: bool) -> io::Result<Self> {
+        let dawg = Self::load(path)?;
+        if compact && dawg.layout.encoding == EdgeEncoding::Wide {
+            Self::from_backing(Backing::heap(&dawg.to_parts().encode_packed()?))
+        } else {
+            Ok(dawg)
+        }
+    }
+
+    /// Load a graph from an in-memory file image, in either format.
+    fn from_bytes(data: Vec<u8>) -> io::Result<Self> {
+        if data.starts_with(FLAT_MAGIC) {
+            Self::from_backing(Backing::heap(&data))
+        } else {
+            Self::from_backing(Backing::heap(&FlatParts::from_legacy(&data)?.encode()))
+        }
+    }
 
+    /// Validate a flat image's header against its length; O(1), independent
+    /// of the graph size. Node ids and child offsets are not scanned — a
+    /// corrupt one fails a slice bounds check at lookup time, never reads
+    /// out of bounds.
+    fn from_backing(backing: Backing) -> io::Result<Self> {
+        let invalid = |msg: &str| io::Error::new(io::ErrorKind::InvalidData, msg.to_string());
+        if cfg!(target_endian = "big") {
+            return Err(invalid("flat graph files require a little-endian host"));
+        }
+        let data = backing.bytes();
+        if data.len() < FLAT_HEADER_LEN || !data.starts_with(FLAT_MAGIC) {
+            return Err(invalid("not a flat graph file"));
+        }
+        let word = |at: usize| u32::from_le_bytes(data[at..at + 4].try_into().unwrap());
+        if word(8) != FLAT_VERSION {
+            return Err(invalid("unsupported flat graph version"));
+        }
+        let root = word(12);
+        let encoding =
+            EdgeEncoding::from_header(word(24)).ok_or_else(|| invalid("unknown edge encoding"))?;
+        let layout = FlatLayout::new(word(16) as usize, word(20) as usize, encoding);
+        if data.len() < layout.total {
+            return Err(invalid("flat graph file truncated"));
+        }
+        if (data.as_ptr() as usize) % 8 != 0 {
+            return Err(invalid("flat graph buffer misaligned"));
+        }
+        if root as usize >= layout.nodes {
+            return Err(invalid("root node out of range"));
+        }
         Ok(Self {
             root,
-            terminal,
-            child_start,
-            bitmap,
-            children,
+            layout,
+            backing,
+            id: NEXT_DAWG_ID.fetch_add(1, Ordering::Relaxed),
         })
     }
 
+    /// View `len` `T`s starting `offset` bytes into the backing buffer.
+    ///
+    /// SAFETY (upheld by `from_backing`): the buffer is at least
+    /// `layout.total` bytes and 8-byte aligned, every section lies within
+    /// `layout.total` at an 8-byte-aligned offset, and `T` is a plain integer
+    /// or `Child` for which every bit pattern is valid.
+    #[inline]
+    fn section<T>(&self, offset: usize, len: usize) -> &[T] {
+        let bytes = self.backing.bytes();
+        unsafe { std::slice::from_raw_parts(bytes.as_ptr().add(offset) as *const T, len) }
+    }
+
+    #[inline]
+    fn terminal(&self) -> &[u8] {
+        self.section(self.layout.terminal, self.layout.nodes)
+    }
+
+    #[inline]
+    fn child_start(&self) -> &[u32] {
+        self.section(self.layout.child_start, self.layout.nodes + 1)
+    }
+
+    #[inline]
+    fn bitmap(&self) -> &[u64] {
+        self.section(self.layout.bitmap, self.layout.nodes)
+    }
+
+    /// The edge records when stored `Wide` (empty for `Packed` graphs).
+    #[inline]
+    fn children(&self) -> &[Child] {
+        match self.layout.encoding {
+            EdgeEncoding::Wide => self.section(self.layout.children, self.layout.edges),
+            EdgeEncoding::Packed => &[],
+        }
+    }
+
+    /// The edge words when stored `Packed` (empty for `Wide` graphs).
+    #[inline]
+    fn packed_children(&self) -> &[u32] {
+        match self.layout.encoding {
+            EdgeEncoding::Packed => self.section(self.layout.children, self.layout.edges),
+            EdgeEncoding::Wide => &[],
+        }
+    }
+
+    /// The `k`-th edge overall (indexing the concatenated per-node slices).
+    #[inline]
+    fn edge(&self, k: usize) -> Edge {
+        match self.layout.encoding {
+            EdgeEncoding::Wide => Edge::from_wide(&self.children()[k]),
+            EdgeEncoding::Packed => Edge::from_packed(self.packed_children()[k]),
+        }
+    }
+
+    /// Whether the graph is served from a memory-mapped file.
+    fn is_mapped(&self) -> bool {
+        matches!(self.backing, Backing::Mapped(_))
+    }
+
+    /// Whether the edges are stored `Packed`.
+    fn is_compact(&self) -> bool {
+        self.layout.encoding == EdgeEncoding::Packed
+    }
+
+    /// Decode back to `FlatParts` (to re-encode with another `EdgeEncoding`).
+    fn to_parts(&self) -> FlatParts {
+        let mut parts = FlatParts::with_capacity(self.root, self.layout.nodes);
+        for id in 0..self.layout.nodes as u32 {
+            let edges: Vec<(char, u32)> = self.node_children(id).map(|e| (e.ch, e.id)).collect();
+            parts.push_node(self.node_is_terminal(id), edges);
+        }
+        parts.finish()
+    }
+
     #[inline]
     fn node_is_terminal(&self, id: u32) -> bool {
-        self.terminal[id as usize]
+        self.terminal()[id as usize] != 0
     }
 
     #[inline]
     fn node_children_count(&self, id: u32) -> usize {
         let i = id as usize;
-        (self.child_start[i + 1] - self.child_start[i]) as usize
+        let starts = self.child_start();
+        (starts[i + 1] - starts[i]) as usize
     }
 
-    /// The node's decoded outgoing edges, packed in symbol-index order.
+    /// The node's outgoing edges, packed in symbol-index order.
     #[inline]
-    fn node_children(&self, id: u32) -> &[Child] {
+    fn node_children(&self, id: u32) -> Edges<'_> {
         let i = id as usize;
-        &self.children[self.child_start[i] as usize..self.child_start[i + 1] as usize]
+        let starts = self.child_start();
+        let range = starts[i] as usize..starts[i + 1] as usize;
+        match self.layout.encoding {
+            EdgeEncoding::Wide => Edges::Wide(self.children()[range].iter()),
+            EdgeEncoding::Packed => Edges::Packed(self.packed_children()[range].iter()),
+        }
     }
 
     #[inline]
     fn node_child(&self, id: u32, i: usize) -> (char, u32) {
-        let ch = &self.children[self.child_start[id as usize] as usize + i];
-        (ch.ch, ch.id)
+        let e = self.edge(self.child_start()[id as usize] as usize + i);
+        (e.ch, e.id)
     }
 
     /// O(1) edge lookup: the child bitmap tells whether an edge for `c` exists,
     /// and a popcount of the bits below it gives its index in the packed slice.
     #[inline]
     fn find_child(&self, id: u32, c: char) -> Option<u32> {
-        let i = id as usize;
         match symbol_index(c) {
-            Some(sym) => {
-                let bit = 1u64 << sym;
-                let bm = self.bitmap[i];
-                if bm & bit == 0 {
-                    return None;
-                }
-                let off = (bm & (bit - 1)).count_ones() as usize;
-                Some(self.children[self.child_start[i] as usize + off].id)
-            }
+            Some(sym) => self.find_symbol(id, sym as u8),
             // Non-alphabet, non-SEP edges are absent from the bitmap; scan for them.
             None => self
                 .node_children(id)
-                .iter()
-                .find(|ch| ch.ch == c)
-                .map(|ch| ch.id),
+                .find(|e| e.ch == c)
+                .map(|e| e.id),
+        }
+    }
+
+    /// `find_child` by symbol index, as a board `Cell` holds it; `None` for
+    /// anything past `SEP_SYMBOL` (`UNKNOWN_TILE`, `EMPTY`).
+    #[inline]
+    fn find_symbol(&self, id: u32, sym: u8) -> Option<u32> {
+        if sym > SEP_SYMBOL {
+            return None;
         }
+        let i = id as usize;
+        let bit = 1u64 << sym;
+        let bm = self.bitmap()[i];
+        if bm & bit == 0 {
+            return None;
+        }
+        let off = (bm & (bit - 1)).count_ones() as usize;
+        Some(self.edge(self.child_start()[i] as usize + off).id)
     }
 
     fn contains(&self, word: &str) -> bool {
@@ -475,7 +1018,7 @@ impl Dawg {
     }
 
     fn node_count(&self) -> usize {
-        self.terminal.len()
+        self.layout.nodes
     }
 
     /// Traverse the DAWG matching `pattern` against the given letter bag.
@@ -631,78 +1174,653 @@ impl Dawg {
 }
 
 // ---------------------------------------------------------------------------
-// Python-exposed types
+// Opening book: precomputed top opening moves per blank-free rack
 // ---------------------------------------------------------------------------
 
-#[pyclass(name = "Dawg")]
-struct DawgPy {
-    inner: Dawg,
-    /// The GADDAG for the same lexicon, driving `get_best_words`. Loaded from
-    /// `gaddag.bin` alongside the DAWG (auto-located next to it, or given
-    /// explicitly). `None` if no GADDAG file is present, in which case move
-    /// generation falls back to the legacy DAWG pattern search.
-    gaddag: Option<Dawg>,
+/// Magic bytes opening an opening-book file (see `OpeningBook`).
+const BOOK_MAGIC: &[u8; 8] = b"SCRBOPEN";
+const BOOK_VERSION: u32 = 1;
+const BOOK_HEADER_LEN: usize = 32;
+
+/// Dense index of every full, blank-free rack the bag can deal: a rack is a
+/// multiset of `RACK_SIZE` letters, each at most as often as the bag holds
+/// it, ranked in lexicographic order of its per-letter counts. `ways[i][k]`
+/// is how many ways letters `i..` can make up `k` tiles.
+struct RackIndex {
+    caps: [u8; ALPHABET_SIZE],
+    ways: [[u32; RACK_SIZE + 1]; ALPHABET_SIZE + 1],
 }
 
-/// If `path` is `.../dawg.bin`, the sibling `.../gaddag.bin`; otherwise `None`.
-fn sibling_gaddag_path(path: &str) -> Option<String> {
-    let p = std::path::Path::new(path);
-    let name = p.file_name()?.to_str()?;
-    let sibling = name.replacen("dawg", "gaddag", 1);
-    if sibling == name {
-        return None;
-    }
-    Some(p.with_file_name(sibling).to_str()?.to_string())
+static RACK_INDEX: OnceLock<RackIndex> = OnceLock::new();
+
+fn rack_index() -> &'static RackIndex {
+    RACK_INDEX.get_or_init(|| {
+        let counts = rack_counts(&fresh_tile_bag().into_iter().collect::<String>());
+        let mut caps = [0u8; ALPHABET_SIZE];
+        caps.copy_from_slice(&counts[..ALPHABET_SIZE]);
+        let mut ways = [[0u32; RACK_SIZE + 1]; ALPHABET_SIZE + 1];
+        ways[ALPHABET_SIZE][0] = 1;
+        for i in (0..ALPHABET_SIZE).rev() {
+            for k in 0..=RACK_SIZE {
+                ways[i][k] = (0..=k.min(caps[i] as usize)).map(|t| ways[i + 1][k - t]).sum();
+            }
+        }
+        RackIndex { caps, ways }
+    })
 }
 
-#[pymethods]
-impl DawgPy {
-    /// Load a DAWG from `path`. If `gaddag_path` is omitted, a sibling
-    /// `gaddag.bin` (same directory, `dawg`→`gaddag` in the filename) is loaded
-    /// when present; move generation uses it automatically. Passing a path that
-    /// does not exist is an error; omitting it and finding no sibling simply
-    /// leaves the GADDAG absent (legacy generation).
-    #[new]
-    #[pyo3(signature = (path, gaddag_path=None))]
-    fn new(path: &str, gaddag_path: Option<&str>) -> PyResult<Self> {
-        let inner = Dawg::load(path).map_err(|e| PyIOError::new_err(e.to_string()))?;
-        let gaddag = match gaddag_path {
-            Some(gp) => Some(Dawg::load(gp).map_err(|e| PyIOError::new_err(e.to_string()))?),
-            None => match sibling_gaddag_path(path) {
-                Some(gp) if std::path::Path::new(&gp).exists() => {
-                    Some(Dawg::load(&gp).map_err(|e| PyIOError::new_err(e.to_string()))?)
-                }
-                _ => None,
-            },
-        };
-        Ok(DawgPy { inner, gaddag })
+impl RackIndex {
+    fn len(&self) -> usize {
+        self.ways[0][RACK_SIZE] as usize
     }
 
-    fn contains(&self, word: &str) -> bool {
-        self.inner.contains(word)
+    /// The rack's index, or `None` if it holds a blank, is not exactly
+    /// `RACK_SIZE` tiles, or holds more of a letter than the bag does.
+    fn rank(&self, counts: &RackCounts) -> Option<usize> {
+        if counts[BLANK] > 0 {
+            return None;
+        }
+        let mut left = RACK_SIZE;
+        let mut rank = 0usize;
+        for i in 0..ALPHABET_SIZE {
+            let m = counts[i] as usize;
+            if m > left || counts[i] > self.caps[i] {
+                return None;
+            }
+            rank += (0..m).map(|t| self.ways[i + 1][left - t] as usize).sum::<usize>();
+            left -= m;
+        }
+        (left == 0).then_some(rank)
     }
 
-    fn __contains__(&self, word: &str) -> bool {
-        self.inner.contains(word)
+    /// The rack at `rank` (inverse of `rank`), as letters.
+    fn letters(&self, mut rank: usize) -> String {
+        let chars = symbol_chars();
+        let mut left = RACK_SIZE;
+        let mut out = String::with_capacity(2 * RACK_SIZE);
+        for i in 0..ALPHABET_SIZE {
+            let mut m = 0;
+            while m < left.min(self.caps[i] as usize) {
+                let ways = self.ways[i + 1][left - m] as usize;
+                if rank < ways {
+                    break;
+                }
+                rank -= ways;
+                m += 1;
+            }
+            out.extend(std::iter::repeat_n(chars[i], m));
+            left -= m;
+        }
+        out
     }
+}
 
-    fn node_count(&self) -> usize {
-        self.inner.node_count()
+/// The opening book file: a 32-byte header (`BOOK_MAGIC`, version, moves
+/// kept per rack `n`, rack count, and the node count, edge count and root of
+/// the DAWG it was built against) followed by `n` little-endian `u64` move
+/// slots per `RackIndex` rank, best first. A slot of 0 is empty (the rack
+/// has fewer than `n` openings). Memory-mapped like the graphs, so a lookup
+/// is a rank computation and one read.
+///
+/// Every opening is a horizontal play through the centre, so a slot packs
+/// just the score (bits 0–15), start column (16–19), length (20–23) and the
+/// letters' alphabet indices (5 bits each from bit 24); a book rack has no
+/// blanks to record.
+struct OpeningBook {
+    backing: Backing,
+    n: usize,
+}
+
+impl OpeningBook {
+    /// Map the book at `path`, checking it was built for `dawg`'s lexicon.
+    fn load(path: &str, dawg: &Dawg) -> io::Result<Self> {
+        let file = fs::File::open(path)?;
+        // SAFETY: read-only, and books are written afresh by `build-openings`,
+        // never rewritten in place; `from_backing` checks the size.
+        let map = unsafe { memmap2::Mmap::map(&file)? };
+        Self::from_backing(Backing::Mapped(map), dawg)
     }
 
-    /// Whether a GADDAG is loaded (so `get_best_words` uses the fast path).
-    fn has_gaddag(&self) -> bool {
-        self.gaddag.is_some()
+    fn from_backing(backing: Backing, dawg: &Dawg) -> io::Result<Self> {
+        let invalid = |msg: &str| io::Error::new(io::ErrorKind::InvalidData, msg.to_string());
+        let data = backing.bytes();
+        if data.len() < BOOK_HEADER_LEN || !data.starts_with(BOOK_MAGIC) {
+            return Err(invalid("not an opening book file"));
+        }
+        let word = |at: usize| u32::from_le_bytes(data[at..at + 4].try_into().unwrap());
+        if word(8) != BOOK_VERSION {
+            return Err(invalid("unsupported opening book version"));
+        }
+        let (n, racks) = (word(12) as usize, word(16) as usize);
+        if racks != rack_index().len() {
+            return Err(invalid("opening book was built for a different tile set"));
+        }
+        if [word(20), word(24), word(28)] != Self::lexicon_key(dawg) {
+            return Err(invalid("opening book was built for a different lexicon"));
+        }
+        if data.len() < BOOK_HEADER_LEN + 8 * n * racks {
+            return Err(invalid("opening book file truncated"));
+        }
+        Ok(OpeningBook { backing, n })
     }
 
-    fn search(&self, pattern: &str, letters: &str) -> Vec<String> {
-        self.inner.search_inner(pattern, letters)
+    /// What the header records of the DAWG a book was built against.
+    fn lexicon_key(dawg: &Dawg) -> [u32; 3] {
+        [dawg.layout.nodes as u32, dawg.layout.edges as u32, dawg.root]
+    }
+
+    fn header(n: usize, dawg: &Dawg) -> Vec<u8> {
+        let mut buf = Vec::with_capacity(BOOK_HEADER_LEN);
+        buf.extend_from_slice(BOOK_MAGIC);
+        for w in [BOOK_VERSION, n as u32, rack_index().len() as u32] {
+            buf.extend_from_slice(&w.to_le_bytes());
+        }
+        for w in Self::lexicon_key(dawg) {
+            buf.extend_from_slice(&w.to_le_bytes());
+        }
+        buf
+    }
+
+    fn pack(mv: &GenMove) -> u64 {
+        let mut slot = mv.score as u64 | (mv.col() as u64) << 16 | (mv.len as u64) << 20;
+        for (i, &l) in mv.letters[..mv.len as usize].iter().enumerate() {
+            slot |= (l as u64) << (24 + 5 * i);
+        }
+        slot
+    }
+
+    fn unpack(slot: u64) -> GenMove {
+        let len = (slot >> 20 & 0xF) as u8;
+        let mut letters = [0u8; BOARD_SIZE];
+        for (i, l) in letters[..len as usize].iter_mut().enumerate() {
+            *l = (slot >> (24 + 5 * i) & 0x1F) as u8;
+        }
+        let col = (slot >> 16 & 0xF) as usize;
+        GenMove {
+            pos: (CENTER * BOARD_SIZE + col) as u16 | GenMove::HORIZONTAL,
+            len,
+            letters,
+            blanks: 0,
+            score: (slot & 0xFFFF) as u32,
+        }
+    }
+
+    /// The top `n` openings for `letters`, best first, if the book covers
+    /// the rack and keeps at least `n` moves per rack.
+    fn lookup(&self, letters: &str, n: usize) -> Option<Vec<GenMove>> {
+        if n > self.n {
+            return None;
+        }
+        let rank = rack_index().rank(&rack_counts(letters))?;
+        let at = BOOK_HEADER_LEN + 8 * self.n * rank;
+        let slots = &self.backing.bytes()[at..at + 8 * n];
+        Some(
+            slots
+                .chunks_exact(8)
+                .map(|b| u64::from_le_bytes(b.try_into().unwrap()))
+                .take_while(|&slot| slot != 0)
+                .map(Self::unpack)
+                .collect(),
+        )
+    }
+}
+
+/// Build an opening book: the top `n` openings of every `RackIndex` rack,
+/// generated exactly as `get_best_words` would on an empty board.
+fn build_opening_book(dawg: &Dawg, gaddag: &Dawg, n: usize) -> Vec<u8> {
+    const CHUNK: usize = 4096;
+    let board = Board::new(None).expect("new board");
+    let setup = board.gen_setup(dawg);
+    let racks = rack_index().len();
+    let chunks: Vec<Vec<u8>> = gen_pool().install(|| {
+        (0..racks.div_ceil(CHUNK))
+            .into_par_iter()
+            .map(|chunk| {
+                let mut out = Vec::with_capacity(8 * n * CHUNK);
+                for rank in chunk * CHUNK..racks.min((chunk + 1) * CHUNK) {
+                    let letters = rack_index().letters(rank);
+                    let moves = board.gaddag_top_moves(&setup, gaddag, &letters, n, false, true);
+                    for i in 0..n {
+                        let slot = moves.get(i).map_or(0, OpeningBook::pack);
+                        out.extend_from_slice(&slot.to_le_bytes());
+                    }
+                }
+                out
+            })
+            .collect()
+    });
+    let mut data = OpeningBook::header(n, dawg);
+    data.reserve(8 * n * racks);
+    for chunk in chunks {
+        data.extend_from_slice(&chunk);
+    }
+    data
+}
+
+// ---------------------------------------------------------------------------
+// Move cache: recent get_best_words results by position and rack
+// ---------------------------------------------------------------------------
+
+/// Zobrist keys: one random `u64` per (square, tile, blank) plus one for
+/// "the opening is still to be played". A position's hash is the XOR of the
+/// keys of its tiles (see `Board::zobrist`).
+struct Zobrist {
+    tiles: Vec<u64>,
+    opening: u64,
+}
+
+/// Tile kinds per square in `Zobrist::tiles`: the letters, then
+/// `UNKNOWN_TILE`; each as a real tile and as a blank.
+const ZOBRIST_KINDS: usize = 2 * (ALPHABET_SIZE + 1);
+
+static ZOBRIST: OnceLock<Zobrist> = OnceLock::new();
+
+fn zobrist() -> &'static Zobrist {
+    ZOBRIST.get_or_init(|| {
+        // Fixed seed: hashes are stable across runs and processes.
+        let mut seed = 0x9E37_79B9_7F4A_7C15u64;
+        let mut next = || {
+            xorshift(&mut seed);
+            seed
+        };
+        Zobrist {
+            tiles: (0..BOARD_SIZE * BOARD_SIZE * ZOBRIST_KINDS).map(|_| next()).collect(),
+            opening: next(),
+        }
+    })
+}
+
+impl Zobrist {
+    /// Key for `tile` (a letter or `UNKNOWN_TILE`) on (r, c).
+    #[inline]
+    fn tile(&self, r: usize, c: usize, tile: Cell, blank: bool) -> u64 {
+        let kind = if tile == UNKNOWN_TILE { ALPHABET_SIZE } else { tile as usize };
+        self.tiles[(r * BOARD_SIZE + c) * ZOBRIST_KINDS + 2 * kind + blank as usize]
+    }
+}
+
+/// Cache key: the position's Zobrist hash and the rack as tile counts, so
+/// any ordering of the same letters hits the same entry.
+type MoveCacheKey = (u64, RackCounts);
+
+/// Bounded LRU cache of `get_best_words` results, shared by every `Board`
+/// generating against one `Dawg`. Results are deterministic for a position
+/// and rack (`parallel` and `prune` never change them), and a top-`n` list is
+/// a prefix of any longer one, so an entry kept for `n` also answers smaller
+/// requests. `place_word` changes the position's hash, so a board never hits
+/// entries from before its last move.
+struct MoveCache {
+    capacity: usize,
+    /// Each entry's result, the `n` it was generated for, and its last use.
+    entries: HashMap<MoveCacheKey, (Vec<BestWord>, usize, u64)>,
+    /// Last use → key, oldest first: the eviction order.
+    recency: BTreeMap<u64, MoveCacheKey>,
+    clock: u64,
+    hits: u64,
+    misses: u64,
+}
+
+impl MoveCache {
+    fn new(capacity: usize) -> Self {
+        MoveCache {
+            capacity,
+            entries: HashMap::new(),
+            recency: BTreeMap::new(),
+            clock: 0,
+            hits: 0,
+            misses: 0,
+        }
+    }
+
+    /// The cached top `n` for `key`, if an entry covers it.
+    fn get(&mut self, key: &MoveCacheKey, n: usize) -> Option<Vec<BestWord>> {
+        if self.capacity == 0 {
+            return None;
+        }
+        self.clock += 1;
+        match self.entries.get_mut(key) {
+            // An entry generated for fewer moves than `n` still answers when
+            // it came back short, i.e. holds every legal move.
+            Some((moves, kept, used)) if *kept >= n || moves.len() < *kept => {
+                self.recency.remove(used);
+                *used = self.clock;
+                self.recency.insert(self.clock, *key);
+                self.hits += 1;
+                Some(moves.iter().take(n).cloned().collect())
+            }
+            _ => {
+                self.misses += 1;
+                None
+            }
+        }
+    }
+
+    fn insert(&mut self, key: MoveCacheKey, n: usize, moves: &[BestWord]) {
+        if self.capacity == 0 {
+            return;
+        }
+        self.clock += 1;
+        if let Some((_, _, used)) = self.entries.insert(key, (moves.to_vec(), n, self.clock)) {
+            self.recency.remove(&used);
+        }
+        self.recency.insert(self.clock, key);
+        self.evict();
+    }
+
+    fn resize(&mut self, capacity: usize) {
+        self.capacity = capacity;
+        self.evict();
+    }
+
+    /// Drop least recently used entries down to `capacity`.
+    fn evict(&mut self) {
+        while self.entries.len() > self.capacity {
+            let (_, oldest) = self.recency.pop_first().expect("recency tracks every entry");
+            self.entries.remove(&oldest);
+        }
+    }
+
+    fn clear(&mut self) {
+        self.entries.clear();
+        self.recency.clear();
+        self.hits = 0;
+        self.misses = 0;
+    }
+}
+
+// ---------------------------------------------------------------------------
+// Leave model: smart_player's LeaveValueNet, evaluated in the engine
+// ---------------------------------------------------------------------------
+
+/// Board-context inputs of the leave model (`Board::features`).
+const LEAVE_BOARD_FEATURES: usize = 5;
+/// Leave-model inputs: a count per bag letter (blank included), the unseen
+/// tiles / 100, then the board features -- `smart_player/model.py`'s
+/// `encode_leave`.
+const LEAVE_INPUTS: usize = ALPHABET_SIZE + 1 + 1 + LEAVE_BOARD_FEATURES;
+
+/// One fully connected layer: `weights` is `outputs x inputs`, row-major,
+/// as `torch.nn.Linear` stores it.
+struct Dense {
+    inputs: usize,
+    weights: Vec<f32>,
+    bias: Vec<f32>,
+}
+
+/// `get_best_words_by_leave` result: a `BestWord` plus the predicted value
+/// of the rack it leaves.
+type LeaveRankedWord = (String, u32, (usize, usize, bool), Vec<char>, f64);
+
+/// A trained `LeaveValueNet` (smart_player/model.py) as plain weights: dense
+/// layers with ReLU between them and a single output. Built from the
+/// checkpoint by `model.get_engine_model`, so a whole decision -- generate,
+/// value every candidate's leave, rank -- runs in one engine call.
+#[pyclass(name = "LeaveModel")]
+struct LeaveModel {
+    /// Input index of each `RackCounts` slot, from the alphabet the model
+    /// was trained with.
+    inputs: [usize; ALPHABET_SIZE + 1],
+    layers: Vec<Dense>,
+}
+
+#[pymethods]
+impl LeaveModel {
+    /// `alphabet` is the model's tile order (`model.ALPHABET` joined, `'?'`
+    /// for the blank); `layers` is each `Linear`'s `(weight, bias)` as
+    /// nested lists, first layer first.
+    #[new]
+    fn new(alphabet: &str, layers: Vec<(Vec<Vec<f32>>, Vec<f32>)>) -> PyResult<Self> {
+        let err = |msg: String| pyo3::exceptions::PyValueError::new_err(msg);
+        let mut inputs = [usize::MAX; ALPHABET_SIZE + 1];
+        let mut symbols = 0;
+        for (i, c) in alphabet.chars().enumerate() {
+            let slot = match c {
+                '?' => BLANK,
+                _ => letter_index(c).ok_or_else(|| err(format!("'{c}' is not a tile letter")))?,
+            };
+            if inputs[slot] != usize::MAX {
+                return Err(err(format!("'{c}' appears twice in the alphabet")));
+            }
+            inputs[slot] = i;
+            symbols += 1;
+        }
+        if symbols != ALPHABET_SIZE + 1 {
+            return Err(err(format!(
+                "alphabet has {symbols} tiles, the bag has {}",
+                ALPHABET_SIZE + 1
+            )));
+        }
+
+        let mut width = LEAVE_INPUTS;
+        let mut dense = Vec::with_capacity(layers.len());
+        for (k, (weights, bias)) in layers.into_iter().enumerate() {
+            if bias.is_empty()
+                || weights.len() != bias.len()
+                || weights.iter().any(|row| row.len() != width)
+            {
+                return Err(err(format!(
+                    "layer {k}: expected {} x {width} weights, got {} rows of {:?}",
+                    bias.len(),
+                    weights.len(),
+                    weights.first().map(Vec::len)
+                )));
+            }
+            dense.push(Dense {
+                inputs: width,
+                weights: weights.into_iter().flatten().collect(),
+                bias,
+            });
+            width = dense[k].bias.len();
+        }
+        if dense.is_empty() || width != 1 {
+            return Err(err(format!(
+                "the last layer must have one output, not {width}"
+            )));
+        }
+        Ok(LeaveModel {
+            inputs,
+            layers: dense,
+        })
+    }
+
+    /// Predicted value of each leave in `leaves` for `unseen_tiles` and
+    /// `board_features` (`Board.unseen_total` / `Board.features`) -- the
+    /// batch forward pass of `LeaveValueNet`.
+    fn evaluate(
+        &self,
+        leaves: Vec<String>,
+        unseen_tiles: u32,
+        board_features: [f64; LEAVE_BOARD_FEATURES],
+    ) -> Vec<f64> {
+        leaves
+            .iter()
+            .map(|leave| self.value(&rack_counts(leave), unseen_tiles, &board_features))
+            .collect()
+    }
+}
+
+impl LeaveModel {
+    fn value(
+        &self,
+        leave: &RackCounts,
+        unseen_tiles: u32,
+        board_features: &[f64; LEAVE_BOARD_FEATURES],
+    ) -> f64 {
+        let mut x = vec![0f32; LEAVE_INPUTS];
+        for (slot, &k) in leave.iter().enumerate() {
+            x[self.inputs[slot]] = k as f32;
+        }
+        x[ALPHABET_SIZE + 1] = unseen_tiles as f32 / 100.0;
+        for (xi, &f) in x[ALPHABET_SIZE + 2..].iter_mut().zip(board_features) {
+            *xi = f as f32;
+        }
+        let last = self.layers.len() - 1;
+        for (k, layer) in self.layers.iter().enumerate() {
+            let mut out = layer.bias.clone();
+            for (o, row) in out.iter_mut().zip(layer.weights.chunks_exact(layer.inputs)) {
+                *o += row.iter().zip(&x).map(|(w, a)| w * a).sum::<f32>();
+                if k < last {
+                    *o = o.max(0.0);
+                }
+            }
+            x = out;
+        }
+        x[0] as f64
+    }
+}
+
+/// `rack` after playing the tiles in `used` (a move's `used` list): a letter
+/// the rack doesn't hold came from a blank, like `player.remove_used`.
+fn leave_after(rack: &RackCounts, used: &[char]) -> RackCounts {
+    let mut leave = *rack;
+    for &c in used {
+        match (c == '?').then_some(BLANK).or_else(|| letter_index(c)) {
+            Some(slot) if leave[slot] > 0 => leave[slot] -= 1,
+            _ => leave[BLANK] = leave[BLANK].saturating_sub(1),
+        }
+    }
+    leave
+}
+
+// ---------------------------------------------------------------------------
+// Python-exposed types
+// ---------------------------------------------------------------------------
+
+#[pyclass(name = "Dawg")]
+struct DawgPy {
+    inner: Dawg,
+    /// The GADDAG for the same lexicon, driving `get_best_words`. Loaded from
+    /// `gaddag.bin` alongside the DAWG (auto-located next to it, or given
+    /// explicitly). `None` if no GADDAG file is present, in which case move
+    /// generation falls back to the legacy DAWG pattern search.
+    gaddag: Option<Dawg>,
+    /// Precomputed openings for blank-free racks (`build-openings`), found
+    /// like the GADDAG (`openings.bin`) or given explicitly. `None` if absent.
+    openings: Option<OpeningBook>,
+    /// Recent `get_best_words` results for boards generating against this
+    /// lexicon (see `MoveCache`).
+    move_cache: Mutex<MoveCache>,
+}
+
+/// Default `MoveCache` capacity, in (position, rack) entries.
+const DEFAULT_MOVE_CACHE: usize = 4096;
+
+/// If `path` is `.../dawg.bin`, the sibling `.../<kind>.bin` (e.g. `gaddag`);
+/// otherwise `None`.
+fn sibling_path(path: &str, kind: &str) -> Option<String> {
+    let p = std::path::Path::new(path);
+    let name = p.file_name()?.to_str()?;
+    let sibling = name.replacen("dawg", kind, 1);
+    if sibling == name {
+        return None;
+    }
+    Some(p.with_file_name(sibling).to_str()?.to_string())
+}
+
+#[pymethods]
+impl DawgPy {
+    /// Load a DAWG from `path`. If `gaddag_path` is omitted, a sibling
+    /// `gaddag.bin` (same directory, `dawg`→`gaddag` in the filename) is loaded
+    /// when present; move generation uses it automatically. Passing a path that
+    /// does not exist is an error; omitting it and finding no sibling simply
+    /// leaves the GADDAG absent (legacy generation). With `compact`, graphs
+    /// stored with wide edges are repacked on load (see `EdgeEncoding`).
+    /// `openings_path` (or a sibling `openings.bin`) is an opening book from
+    /// `build-openings`, found and validated the same way. `cache_size` bounds
+    /// the move cache (0 disables it).
+    #[new]
+    #[pyo3(signature = (path, gaddag_path=None, compact=false, openings_path=None, cache_size=DEFAULT_MOVE_CACHE))]
+    fn new(
+        path: &str,
+        gaddag_path: Option<&str>,
+        compact: bool,
+        openings_path: Option<&str>,
+        cache_size: usize,
+    ) -> PyResult<Self> {
+        let io_err = |e: io::Error| PyIOError::new_err(e.to_string());
+        let open = |p: &str| Dawg::open(p, compact).map_err(io_err);
+        let locate = |given: Option<&str>, kind: &str| match given {
+            Some(p) => Some(p.to_string()),
+            None => sibling_path(path, kind).filter(|p| std::path::Path::new(p).exists()),
+        };
+        let inner = open(path)?;
+        let gaddag = locate(gaddag_path, "gaddag").map(|gp| open(&gp)).transpose()?;
+        let openings = locate(openings_path, "openings")
+            .map(|op| OpeningBook::load(&op, &inner).map_err(io_err))
+            .transpose()?;
+        Ok(DawgPy {
+            inner,
+            gaddag,
+            openings,
+            move_cache: Mutex::new(MoveCache::new(cache_size)),
+        })
+    }
+
+    fn contains(&self, word: &str) -> bool {
+        self.inner.contains(word)
+    }
+
+    fn __contains__(&self, word: &str) -> bool {
+        self.inner.contains(word)
+    }
+
+    fn node_count(&self) -> usize {
+        self.inner.node_count()
+    }
+
+    /// Whether a GADDAG is loaded (so `get_best_words` uses the fast path).
+    fn has_gaddag(&self) -> bool {
+        self.gaddag.is_some()
+    }
+
+    /// Whether an opening book is loaded (see `build-openings`).
+    fn has_openings(&self) -> bool {
+        self.openings.is_some()
+    }
+
+    /// Move-cache counters: `(hits, misses, entries, capacity)`.
+    fn cache_stats(&self) -> (u64, u64, usize, usize) {
+        let cache = self.move_cache();
+        (cache.hits, cache.misses, cache.entries.len(), cache.capacity)
+    }
+
+    /// Change the move cache's capacity, evicting the least recently used
+    /// entries if it shrinks; 0 disables it.
+    fn set_cache_size(&self, capacity: usize) {
+        self.move_cache().resize(capacity);
+    }
+
+    /// Empty the move cache and reset its counters.
+    fn clear_cache(&self) {
+        self.move_cache().clear();
+    }
+
+    /// Whether every loaded graph is served zero-copy from a memory-mapped
+    /// flat file (false if any was decoded from the legacy format).
+    fn is_mapped(&self) -> bool {
+        self.inner.is_mapped() && self.gaddag.as_ref().is_none_or(Dawg::is_mapped)
+    }
+
+    /// Whether every loaded graph stores its edges packed (4 bytes per edge).
+    fn is_compact(&self) -> bool {
+        self.inner.is_compact() && self.gaddag.as_ref().is_none_or(Dawg::is_compact)
+    }
+
+    fn search(&self, py: Python<'_>, pattern: &str, letters: &str) -> Vec<String> {
+        py.detach(|| self.inner.search_inner(pattern, letters))
+    }
+}
+
+impl DawgPy {
+    fn move_cache(&self) -> std::sync::MutexGuard<'_, MoveCache> {
+        // The cache holds no invariant a panicking holder could break.
+        self.move_cache.lock().unwrap_or_else(|e| e.into_inner())
     }
 }
 
-fn row_to_string(row: &[char; BOARD_SIZE]) -> String {
+fn row_to_string(row: &[Cell; BOARD_SIZE]) -> String {
     row.iter()
-        .map(|c| c.to_string())
+        .map(|&cell| cell_char(cell).to_string())
         .collect::<Vec<_>>()
         .join(" ")
 }
@@ -725,6 +1843,15 @@ fn draw_seed(bag_len: usize) -> u64 {
     nanos ^ (bag_len as u64)
 }
 
+/// splitmix64 finaliser: spreads a user seed (or seed + game index) over all
+/// 64 bits, and never yields the all-zero state xorshift would stick at.
+fn mix_seed(seed: u64) -> u64 {
+    let mut z = seed.wrapping_add(0x9E37_79B9_7F4A_7C15);
+    z = (z ^ (z >> 30)).wrapping_mul(0xBF58_476D_1CE4_E5B9);
+    z = (z ^ (z >> 27)).wrapping_mul(0x94D0_49BB_1331_11EB);
+    (z ^ (z >> 31)).max(1)
+}
+
 /// Alphabetical rank of `c` for `first_draw_winner`'s "closest to 'A'"
 /// tiebreak: a blank outranks every letter, unknown characters sort last.
 fn alphabet_rank(c: char) -> i32 {
@@ -751,21 +1878,70 @@ fn fresh_tile_bag() -> Vec<char> {
     ]
 }
 
+static FULL_BAG_COUNTS: OnceLock<RackCounts> = OnceLock::new();
+
+/// `fresh_tile_bag` as counts per letter (blanks at `BLANK`).
+fn full_bag_counts() -> &'static RackCounts {
+    FULL_BAG_COUNTS.get_or_init(|| rack_counts(&fresh_tile_bag().into_iter().collect::<String>()))
+}
+
+/// The `RackCounts` slot a placed tile came out of the bag as: a blank
+/// (whatever letter it shows) is a `'?'`.
+fn bag_slot(tile: Cell, blank: bool) -> usize {
+    if blank || tile == UNKNOWN_TILE {
+        BLANK
+    } else {
+        tile as usize
+    }
+}
+
 #[pyclass(name = "Board")]
 struct Board {
-    board: [[char; BOARD_SIZE]; BOARD_SIZE],
+    /// Each square as a `Cell`: a tile's alphabet index, or `EMPTY`.
+    board: [[Cell; BOARD_SIZE]; BOARD_SIZE],
+    /// Bit `c` of `blanks[r]` set: the tile at (r, c) is a blank, worth 0
+    /// whatever letter it shows. Always set for `UNKNOWN_TILE` squares.
+    blanks: [u16; BOARD_SIZE],
     tile_bag: Vec<char>,
     first: bool,
+    /// Zobrist hash of the position, kept up to date by `place_word` (see
+    /// `Board::zobrist` for the definition).
+    hash: u64,
+    /// Unoccupied squares of each premium kind (see `premium_kind`) and
+    /// occupied squares overall, kept up to date by `place_word`.
+    open_premiums: [u8; PREMIUM_KINDS],
+    filled: u8,
+    /// Tiles on the board per bag letter (see `bag_slot`), kept up to date
+    /// by `place_word`.
+    on_board: RackCounts,
+    /// State of the xorshift stream tile draws come from when the board was
+    /// seeded (`Board(seed=...)`); `None` seeds every draw from the clock
+    /// (see `draw_seed`).
+    rng: Option<u64>,
+    /// Cross-checks and anchors from the last generation, kept up to date
+    /// across `place_word` (see `GenCache`). `None` until first needed.
+    gen_cache: Option<GenCache>,
 }
 
 #[pymethods]
 impl Board {
+    /// A fresh board with a full tile bag. With a `seed`, every draw from
+    /// the bag (`give_letters`, `exchange_letters`) follows one reproducible
+    /// stream, so the same seed and the same calls give the same tiles.
     #[new]
-    fn new() -> PyResult<Self> {
+    #[pyo3(signature = (seed=None))]
+    fn new(seed: Option<u64>) -> PyResult<Self> {
         Ok(Board {
-            board: [['-'; BOARD_SIZE]; BOARD_SIZE],
+            board: [[EMPTY; BOARD_SIZE]; BOARD_SIZE],
+            blanks: [0; BOARD_SIZE],
             tile_bag: fresh_tile_bag(),
             first: true,
+            hash: zobrist().opening,
+            open_premiums: *premium_totals(),
+            filled: 0,
+            on_board: [0; ALPHABET_SIZE + 1],
+            rng: seed.map(mix_seed),
+            gen_cache: None,
         })
     }
 
@@ -775,15 +1951,28 @@ impl Board {
     /// tile bag, same as `Board()` -- letters already on the grid are not
     /// subtracted from it, since callers that load a grid this way manage
     /// their own separate tile-bag bookkeeping rather than relying on this
-    /// board's.
+    /// board's. `blanks` lists the `(row, col)` cells whose letter is a
+    /// blank (as `blank_cells` returns them), so a grid and its blanks
+    /// round-trip a position exactly.
     #[staticmethod]
-    fn from_grid(board: Vec<Vec<String>>) -> PyResult<Self> {
+    #[pyo3(signature = (board, blanks=Vec::new()))]
+    fn from_grid(board: Vec<Vec<String>>, blanks: Vec<(usize, usize)>) -> PyResult<Self> {
         if board.len() != BOARD_SIZE {
             return Err(pyo3::exceptions::PyValueError::new_err(
                 "board must have exactly 15 rows",
             ));
         }
-        let mut result = [['-'; BOARD_SIZE]; BOARD_SIZE];
+        let blank_cells = blanks;
+        for &(r, c) in &blank_cells {
+            let filled = in_bounds(r, c) && board[r].get(c).is_some_and(|cell| cell != "-");
+            if !filled {
+                return Err(pyo3::exceptions::PyValueError::new_err(format!(
+                    "blank at ({r}, {c}) is not on a tile"
+                )));
+            }
+        }
+        let mut result = [[EMPTY; BOARD_SIZE]; BOARD_SIZE];
+        let mut blanks = [0u16; BOARD_SIZE];
         let mut first = true;
         let mut tile_bag = fresh_tile_bag();
         for (r, row) in board.iter().enumerate() {
@@ -802,25 +1991,115 @@ impl Board {
                         "cell must contain exactly one character",
                     ));
                 }
-                result[r][c] = ch;
                 if ch != '-' {
                     first = false;
-                    if let Some(pos) = tile_bag.iter().position(|&x| x == ch) {
+                    let blank = ch == '?' || blank_cells.contains(&(r, c));
+                    let bag_tile = if blank { '?' } else { ch };
+                    if let Some(pos) = tile_bag.iter().position(|&x| x == bag_tile) {
                         tile_bag.remove(pos);
                     } else {
                         return Err(pyo3::exceptions::PyValueError::new_err(format!(
                             "letter '{}' not available in tile bag",
-                            ch
+                            bag_tile
                         )));
                     }
+                    result[r][c] = tile_cell(ch).ok_or_else(|| {
+                        pyo3::exceptions::PyValueError::new_err(format!(
+                            "'{ch}' is not a tile letter"
+                        ))
+                    })?;
+                    if blank {
+                        blanks[r] |= 1 << c;
+                    }
                 }
             }
         }
-        Ok(Board {
+        let mut board = Board {
             board: result,
+            blanks,
             tile_bag: tile_bag,
             first: first,
-        })
+            hash: 0,
+            open_premiums: *premium_totals(),
+            filled: 0,
+            on_board: [0; ALPHABET_SIZE + 1],
+            rng: None,
+            gen_cache: None,
+        };
+        board.hash = board.zobrist();
+        (board.open_premiums, board.filled) = board.count_features();
+        board.on_board = board.count_tiles();
+        Ok(board)
+    }
+
+    /// 64-bit Zobrist hash of the position: every tile with its square and
+    /// blank flag, and whether the opening is still to be played. Kept up to
+    /// date by `place_word`, so reading it is O(1). Equal positions hash
+    /// equal across boards and processes.
+    fn hash(&self) -> u64 {
+        self.hash
+    }
+
+    /// Board-context features for the leave model: the fraction of triple
+    /// word, double word, triple letter and double letter squares still
+    /// unoccupied, and the fraction of all 225 squares occupied. Kept up to
+    /// date by `place_word`, so reading them is O(1).
+    fn features(&self) -> (f64, f64, f64, f64, f64) {
+        let totals = premium_totals();
+        let open = |kind: usize| self.open_premiums[kind] as f64 / totals[kind] as f64;
+        (
+            open(0),
+            open(1),
+            open(2),
+            open(3),
+            self.filled as f64 / (BOARD_SIZE * BOARD_SIZE) as f64,
+        )
+    }
+
+    /// Tiles not on the board or in `rack` -- still in the bag or on an
+    /// opponent's rack -- as letter -> count, `'?'` for blanks. A blank on the
+    /// board counts as a `'?'` whatever letter it shows. Letters the rack
+    /// holds beyond what is left are ignored.
+    fn unseen_counts(&self, rack: &str) -> HashMap<char, u32> {
+        let symbols = symbol_chars();
+        self.unseen(rack)
+            .iter()
+            .enumerate()
+            .filter(|&(_, &k)| k > 0)
+            .map(|(i, &k)| (if i == BLANK { '?' } else { symbols[i] }, k as u32))
+            .collect()
+    }
+
+    /// Number of tiles `unseen_counts(rack)` holds.
+    fn unseen_total(&self, rack: &str) -> u32 {
+        self.unseen(rack).iter().map(|&k| k as u32).sum()
+    }
+
+    /// The 15x15 grid as one-character strings, `'-'` for empty -- the same
+    /// cells `str()` prints and `from_grid` accepts, without the formatting.
+    fn grid(&self) -> Vec<Vec<char>> {
+        self.board
+            .iter()
+            .map(|row| row.iter().map(|&cell| cell_char(cell)).collect())
+            .collect()
+    }
+
+    /// The `(row, col)` cells holding a blank tile, row-major. `grid()` shows
+    /// a blank as the letter it stands for; pass these to `from_grid` along
+    /// with it to rebuild the same position.
+    fn blank_cells(&self) -> Vec<(usize, usize)> {
+        (0..BOARD_SIZE)
+            .flat_map(|r| (0..BOARD_SIZE).map(move |c| (r, c)))
+            .filter(|&(r, c)| self.board[r][c] != EMPTY && self.blanks[r] & (1 << c) != 0)
+            .collect()
+    }
+
+    /// The 225 squares row-major as `bytes`, one symbol index per square:
+    /// `i < 32` is `ALPHABET[i]`, `EMPTY_CELL` an empty square and
+    /// `UNKNOWN_CELL` a `'?'`. `numpy.frombuffer(board.cells(), numpy.uint8)`
+    /// views it as an array without parsing anything.
+    fn cells<'py>(&self, py: Python<'py>) -> Bound<'py, PyBytes> {
+        PyBytes::new(py, self.board.as_flattened())
     }
 
     fn __str__(&self) -> String {
@@ -832,7 +2111,7 @@ impl Board {
     }
 
     fn give_letters(&mut self, letters: &str) -> String {
-        let mut seed = draw_seed(self.tile_bag.len());
+        let mut seed = self.rng.unwrap_or_else(|| draw_seed(self.tile_bag.len()));
         let mut drawn = String::new();
         let draw_count = (RACK_SIZE - letters.chars().count()).min(self.tile_bag.len());
         for _ in 0..draw_count {
@@ -840,6 +2119,9 @@ impl Board {
             let idx = (seed as usize) % self.tile_bag.len();
             drawn.push(self.tile_bag.swap_remove(idx));
         }
+        if self.rng.is_some() {
+            self.rng = Some(seed);
+        }
         drawn
     }
 
@@ -905,28 +2187,32 @@ impl Board {
 
     fn calculate_word_points(
         &self,
+        py: Python<'_>,
         word: &str,
         row: usize,
         col: usize,
         horizontal: bool,
         letters: &str,
     ) -> PyResult<u32> {
-        // The main word and every cross-word it forms are each scored
-        // independently (own letter multipliers + own word multiplier, from
-        // only the one square where the shared new tile lands), then summed
-        // — never merge their tile totals before multiplying, or a word
-        // multiplier from elsewhere in the main word would incorrectly leak
-        // into an unrelated cross-word's score.
-        let mut main_total = 0u32;
-        let mut main_word_mul = 1u32;
-        let mut cross_words_total = 0u32;
-        let mut tiles_from_hand = 0usize;
-        // Depleted as real letters are claimed by earlier tiles in the
-        // word, so a letter repeated more times than the rack has real
-        // copies of it correctly falls back to a blank (0 points) for the
-        // extra occurrences instead of being scored as real every time.
-        let mut hand_freq = real_letter_counts(letters);
+        py.detach(|| self.calculate_word_points_inner(word, row, col, horizontal, letters))
+    }
 
+    fn check_word_placement(
+        &self,
+        dawg: &DawgPy,
+        word: &str,
+        row: usize,
+        col: usize,
+        horizontal: bool,
+    ) -> PyResult<()> {
+        // Standard rule: a play must be at least 2 letters -- enforced
+        // explicitly rather than relying on the dictionary happening to
+        // have no 1-letter entries.
+        if word.chars().count() < 2 {
+            return Err(pyo3::exceptions::PyValueError::new_err(
+                "word must be at least 2 letters",
+            ));
+        }
         for (i, ch) in word.chars().enumerate() {
             let (r, c) = word_cell(row, col, horizontal, i);
             if !in_bounds(r, c) {
@@ -934,64 +2220,35 @@ impl Board {
                     "word out of bounds",
                 ));
             }
-            let bonus = quadrant_bonus(r, c);
+            if self.board[r][c] != EMPTY {
+                continue;
+            }
 
-            if self.board[r][c] == '-' {
-                let this_letter_value = match hand_freq.get_mut(&ch) {
-                    Some(count) if *count > 0 => {
-                        *count -= 1;
-                        letter_points(ch)
-                    }
-                    // No real copy left in hand — a blank stands in for
-                    // this letter and always scores 0.
-                    _ => 0,
-                };
-                tiles_from_hand += 1;
-
-                main_total += this_letter_value * bonus.0 as u32;
-                main_word_mul *= bonus.1 as u32;
-
-                // cross-word formed by this newly placed letter, if any,
-                // scored on its own (this tile's value + existing
-                // perpendicular neighbours), multiplied only by this tile's
-                // own word bonus.
-                if let Some(neighbor_points) = self.cross_neighbor_points(r, c, horizontal, ch) {
-                    let cross_total = this_letter_value * bonus.0 as u32 + neighbor_points;
-                    cross_words_total += cross_total * bonus.1 as u32;
-                }
-            } else {
-                if ch != self.board[r][c] {
-                    return Err(pyo3::exceptions::PyValueError::new_err(format!(
-                        "letter on board '{}' does not match word letter '{}'",
-                        self.board[r][c], ch,
-                    )));
-                }
-                main_total += letter_points(ch);
+            let adjacent = self.cross_word(r, c, horizontal, ch);
+            if adjacent.len() > 1 && !dawg.contains(&adjacent) {
+                return Err(pyo3::exceptions::PyValueError::new_err(format!(
+                    "cross-word '{adjacent}' formed by '{ch}' is not in the dictionary",
+                )));
             }
         }
-
-        // Bonus for using the whole rack in one move
-        Ok(main_total * main_word_mul
-            + cross_words_total
-            + if tiles_from_hand == RACK_SIZE { 50 } else { 0 })
+        Ok(())
     }
 
-    fn check_word_placement(
-        &self,
-        dawg: &DawgPy,
+    /// Put `word`'s tiles on the board. `blanks` lists the positions in
+    /// `word` played with a blank tile: they show their letter but score 0
+    /// in any later word through them. A `'?'` in `word` is a blank of
+    /// unknown letter.
+    #[pyo3(signature = (word, row, col, horizontal, blanks=Vec::new()))]
+    fn place_word(
+        &mut self,
         word: &str,
         row: usize,
         col: usize,
         horizontal: bool,
+        blanks: Vec<usize>,
     ) -> PyResult<()> {
-        // Standard rule: a play must be at least 2 letters -- enforced
-        // explicitly rather than relying on the dictionary happening to
-        // have no 1-letter entries.
-        if word.chars().count() < 2 {
-            return Err(pyo3::exceptions::PyValueError::new_err(
-                "word must be at least 2 letters",
-            ));
-        }
+        // Validate everything first, so a bad word leaves the board untouched.
+        let mut tiles = Vec::with_capacity(word.len());
         for (i, ch) in word.chars().enumerate() {
             let (r, c) = word_cell(row, col, horizontal, i);
             if !in_bounds(r, c) {
@@ -999,38 +2256,50 @@ impl Board {
                     "word out of bounds",
                 ));
             }
-            if self.board[r][c] != '-' {
-                continue;
+            let tile = tile_cell(ch).ok_or_else(|| {
+                pyo3::exceptions::PyValueError::new_err(format!("'{ch}' is not a tile letter"))
+            })?;
+            tiles.push((r, c, tile, tile == UNKNOWN_TILE || blanks.contains(&i)));
+        }
+        let keys = zobrist();
+        for (r, c, tile, blank) in tiles {
+            let old = self.board[r][c];
+            if old == tile {
+                continue; // a tile the word runs through keeps its blank bit
             }
-
-            let adjacent = self.cross_word(r, c, horizontal, ch);
-            if adjacent.len() > 1 && !dawg.contains(&adjacent) {
-                return Err(pyo3::exceptions::PyValueError::new_err(format!(
-                    "cross-word '{adjacent}' formed by '{ch}' is not in the dictionary",
-                )));
+            if old != EMPTY {
+                let old_blank = self.blanks[r] & (1 << c) != 0;
+                self.hash ^= keys.tile(r, c, old, old_blank);
+                self.on_board[bag_slot(old, old_blank)] -= 1;
+            } else {
+                self.filled += 1;
+                if let Some(kind) = premium_kind(r, c) {
+                    self.open_premiums[kind] -= 1;
+                }
             }
-        }
-        Ok(())
-    }
-
-    fn place_word(&mut self, word: &str, row: usize, col: usize, horizontal: bool) -> PyResult<()> {
-        for (i, ch) in word.chars().enumerate() {
-            let (r, c) = word_cell(row, col, horizontal, i);
-            if !in_bounds(r, c) {
-                return Err(pyo3::exceptions::PyValueError::new_err(
-                    "word out of bounds",
-                ));
+            self.hash ^= keys.tile(r, c, tile, blank);
+            self.on_board[bag_slot(tile, blank)] += 1;
+            self.board[r][c] = tile;
+            if blank {
+                self.blanks[r] |= 1 << c;
+            } else {
+                self.blanks[r] &= !(1 << c);
             }
-            self.board[r][c] = ch;
+            if let Some(cache) = &mut self.gen_cache {
+                cache.dirty.push((r, c));
+            }
+        }
+        if self.first {
+            self.hash ^= keys.opening;
+            self.first = false;
         }
-        self.first = false;
         Ok(())
     }
 
     fn get_row_patterns(&self, row_idx: usize) -> Vec<(usize, usize)> {
-        let row = &self.board.as_slice()[row_idx];
+        let row = &self.board[row_idx];
         let n = row.len();
-        let empty = |i: usize| row.get(i).copied() == Some('-');
+        let empty = |i: usize| row.get(i).copied() == Some(EMPTY);
         let valid_start = |i: usize| i == 0 || empty(i - 1);
         let valid_end = |i: usize| i == n - 1 || empty(i + 1);
 
@@ -1044,7 +2313,7 @@ impl Board {
                     continue;
                 }
                 let slice = &row[start..=end];
-                if slice.contains(&'-') && slice.iter().any(|&c| c != '-') {
+                if slice.contains(&EMPTY) && slice.iter().any(|&c| c != EMPTY) {
                     patterns.push((start, end));
                 }
             }
@@ -1056,8 +2325,8 @@ impl Board {
         // touching it only through the cross-words it forms. `get_all_patterns`
         // fed only the "crossing" patterns above would never find these.
         let has_adjacent_tile = |i: usize| {
-            (row_idx > 0 && self.board[row_idx - 1][i] != '-')
-                || (row_idx < n - 1 && self.board[row_idx + 1][i] != '-')
+            (row_idx > 0 && self.board[row_idx - 1][i] != EMPTY)
+                || (row_idx < n - 1 && self.board[row_idx + 1][i] != EMPTY)
         };
         let mut run_start = 0;
         while run_start < n {
@@ -1093,7 +2362,7 @@ impl Board {
 
     fn get_col_patterns(&self, col_idx: usize) -> Vec<(usize, usize)> {
         let n = BOARD_SIZE;
-        let empty = |i: usize| self.board[i][col_idx] == '-';
+        let empty = |i: usize| self.board[i][col_idx] == EMPTY;
         let valid_start = |i: usize| i == 0 || empty(i - 1);
         let valid_end = |i: usize| i == n - 1 || empty(i + 1);
 
@@ -1109,7 +2378,7 @@ impl Board {
                 let mut has_empty = false;
                 let mut has_tile = false;
                 for i in start..=end {
-                    if self.board[i][col_idx] == '-' {
+                    if self.board[i][col_idx] == EMPTY {
                         has_empty = true;
                     } else {
                         has_tile = true;
@@ -1128,8 +2397,8 @@ impl Board {
         // to the board only via a filled neighbour directly left/right --
         // see get_row_patterns for the full rationale.
         let has_adjacent_tile = |i: usize| {
-            (col_idx > 0 && self.board[i][col_idx - 1] != '-')
-                || (col_idx < n - 1 && self.board[i][col_idx + 1] != '-')
+            (col_idx > 0 && self.board[i][col_idx - 1] != EMPTY)
+                || (col_idx < n - 1 && self.board[i][col_idx + 1] != EMPTY)
         };
         let mut run_start = 0;
         while run_start < n {
@@ -1174,6 +2443,7 @@ impl Board {
 
     fn best_word_from_pattern(
         &self,
+        py: Python<'_>,
         dawg: &DawgPy,
         row: usize,
         start: usize,
@@ -1181,41 +2451,79 @@ impl Board {
         horizontal: bool,
         letters: &str,
     ) -> String {
-        self.best_word_from_pattern_inner(&dawg.inner, row, start, end, horizontal, letters)
-            .0
+        py.detach(|| {
+            self.best_word_from_pattern_inner(&dawg.inner, row, start, end, horizontal, letters)
+                .0
+        })
     }
 
-    #[pyo3(signature = (dawg, letters, n, parallel=true))]
+    /// Top-`n` moves for `letters`. The GIL is released while they are
+    /// generated, so other Python threads (e.g. other web sessions) keep
+    /// running; a `Board` itself must not be used from two threads at once.
+    #[pyo3(signature = (dawg, letters, n, parallel=true, prune=true))]
     fn get_best_words(
         &mut self,
+        py: Python<'_>,
         dawg: &DawgPy,
         letters: &str,
         n: usize,
         parallel: bool,
+        prune: bool,
     ) -> Vec<BestWord> {
-        if self.first {
-            self.best_opening_words(dawg, letters, n)
-        } else if let Some(gaddag) = &dawg.gaddag {
-            // Fast path: GADDAG anchor generation (equivalent to the legacy
-            // pattern search, verified by the `gen-verify` CLI command).
-            self.gaddag_best_words(&dawg.inner, gaddag, letters, n, parallel)
-        } else {
-            self.best_words_from_patterns(dawg, letters, n, parallel)
-        }
+        py.detach(|| self.best_words(dawg, letters, n, parallel, prune))
+    }
+
+    /// SmartPlayer's decision in one call: the top `candidates` moves by
+    /// score, each valued as score plus `model`'s prediction for the rack it
+    /// leaves (rounded, in this position's `unseen_total` and `features`),
+    /// best `n` first; ties keep score order. Each move comes with its leave
+    /// value. Releases the GIL like `get_best_words`.
+    #[pyo3(signature = (dawg, letters, model, n=1, candidates=50, parallel=true))]
+    fn get_best_words_by_leave(
+        &mut self,
+        py: Python<'_>,
+        dawg: &DawgPy,
+        letters: &str,
+        model: &LeaveModel,
+        n: usize,
+        candidates: usize,
+        parallel: bool,
+    ) -> Vec<LeaveRankedWord> {
+        py.detach(|| self.best_words_by_leave(dawg, letters, model, n, candidates, parallel))
+    }
+
+    /// Score distribution over every legal play for `letters`:
+    /// `(count, best, worst, histogram)` where `histogram[s]` is the number
+    /// of plays scoring `s` (length `best + 1`). Same move generation as
+    /// `get_best_words`, but no play is built or returned, so rating a move
+    /// against all alternatives costs about one search. `(0, 0, 0, [])` when
+    /// there is no legal play. Releases the GIL like `get_best_words`.
+    #[pyo3(signature = (dawg, letters, parallel=true))]
+    fn get_score_stats(
+        &mut self,
+        py: Python<'_>,
+        dawg: &DawgPy,
+        letters: &str,
+        parallel: bool,
+    ) -> (usize, u32, u32, Vec<u32>) {
+        py.detach(|| self.score_stats(dawg, letters, parallel).summary())
     }
 
-    /// Best-scoring first moves: the centre square must be covered, so
-    /// every word/offset combination that does so is a candidate.
+    /// Best-scoring first moves without a GADDAG: the centre square must be
+    /// covered, so every word/offset combination that does so is a candidate.
+    /// (With one, the opening is generated from the centre anchor instead —
+    /// see `GenSetup`.)
     fn best_opening_words(&self, dawg: &DawgPy, letters: &str, n: usize) -> Vec<BestWord> {
         let mut candidates: Vec<BestWord> = Vec::new();
-        for word in dawg.search("*", letters) {
+        for word in dawg.inner.search_inner("*", letters) {
+            let len = word.chars().count();
             for offset in 0..CENTER {
-                if offset >= word.len() {
+                if offset >= len {
                     break;
                 }
                 let col = CENTER - offset;
                 let score = self
-                    .calculate_word_points(&word, CENTER, col, true, letters)
+                    .calculate_word_points_inner(&word, CENTER, col, true, letters)
                     .unwrap_or(0);
                 if score == 0 {
                     continue;
@@ -1269,17 +2577,183 @@ impl Board {
             .collect()
     }
 
-    #[pyo3(signature = (dawg, letters, parallel=true))]
-    fn get_best_word(&mut self, dawg: &DawgPy, letters: &str, parallel: bool) -> BestWord {
-        self.get_best_words(dawg, letters, 1, parallel)
-            .into_iter()
-            .next()
-            .unwrap_or_else(|| (String::new(), 0, (0, 0, true), Vec::new()))
+    /// `get_best_words` for every rack in `racks` against this one position, in
+    /// one call: cross-checks and anchors are computed once and shared, and
+    /// the GIL is released while the racks are generated. With `parallel`,
+    /// racks run concurrently on the engine pool (each rack single-threaded);
+    /// a lone rack instead parallelises over its anchors, as `get_best_words`.
+    #[pyo3(signature = (dawg, racks, n, parallel=true, prune=true))]
+    fn get_best_words_many(
+        &mut self,
+        py: Python<'_>,
+        dawg: &DawgPy,
+        racks: Vec<String>,
+        n: usize,
+        parallel: bool,
+        prune: bool,
+    ) -> Vec<Vec<BestWord>> {
+        py.detach(|| self.best_words_many(dawg, &racks, n, parallel, prune))
+    }
+
+    #[pyo3(signature = (dawg, letters, parallel=true, prune=true))]
+    fn get_best_word(
+        &mut self,
+        py: Python<'_>,
+        dawg: &DawgPy,
+        letters: &str,
+        parallel: bool,
+        prune: bool,
+    ) -> BestWord {
+        py.detach(|| self.best_word(dawg, letters, parallel, prune))
+    }
+
+    /// Play a move exactly as `get_best_words` returned it: `place_word`,
+    /// with the new tiles its `used` list spends a `'?'` on placed as
+    /// blanks, so they keep scoring 0 in later words.
+    #[pyo3(name = "place_move")]
+    fn place_move_py(&mut self, best: BestWord) -> PyResult<()> {
+        self.place_move(&best)
+    }
+
+    /// Positions in `word` that a rack of `letters` can only cover with a
+    /// blank: each new tile, in order, takes a literal tile while one is
+    /// left and a `'?'` otherwise -- the same accounting as scoring with
+    /// `letters` in `calculate_word_points`. Pass the result as
+    /// `place_word`'s `blanks` for a move that did not come from the engine.
+    fn rack_blanks(
+        &self,
+        word: &str,
+        row: usize,
+        col: usize,
+        horizontal: bool,
+        letters: &str,
+    ) -> Vec<usize> {
+        let mut rack: Vec<char> = letters.chars().collect();
+        let mut blanks = Vec::new();
+        for (i, ch) in word.chars().enumerate() {
+            let (r, c) = word_cell(row, col, horizontal, i);
+            if !in_bounds(r, c) || self.board[r][c] != EMPTY {
+                continue;
+            }
+            if let Some(pos) = rack.iter().position(|&x| x == ch) {
+                rack.swap_remove(pos);
+            } else if let Some(pos) = rack.iter().position(|&x| x == '?') {
+                rack.swap_remove(pos);
+                blanks.push(i);
+            }
+        }
+        blanks
     }
 }
 
 // Pure Rust methods — no PyO3 overhead, safe to call from rayon threads.
 impl Board {
+    /// Play a move as `get_best_words` returns it, marking the new tiles
+    /// `used` spends blanks on as blanks.
+    fn place_move(&mut self, (word, _, (row, col, horizontal), used): &BestWord) -> PyResult<()> {
+        let mut spent = used.iter();
+        let blanks = (0..word.chars().count())
+            .filter(|&i| {
+                let (r, c) = word_cell(*row, *col, *horizontal, i);
+                in_bounds(r, c) && self.board[r][c] == EMPTY && spent.next() == Some(&'?')
+            })
+            .collect();
+        self.place_word(word, *row, *col, *horizontal, blanks)
+    }
+
+    fn calculate_word_points_inner(
+        &self,
+        word: &str,
+        row: usize,
+        col: usize,
+        horizontal: bool,
+        letters: &str,
+    ) -> PyResult<u32> {
+        // The main word and every cross-word it forms are each scored
+        // independently (own letter multipliers + own word multiplier, from
+        // only the one square where the shared new tile lands), then summed
+        // — never merge their tile totals before multiplying, or a word
+        // multiplier from elsewhere in the main word would incorrectly leak
+        // into an unrelated cross-word's score.
+        let mut main_total = 0u32;
+        let mut main_word_mul = 1u32;
+        let mut cross_words_total = 0u32;
+        let mut tiles_from_hand = 0usize;
+        // Depleted as real letters are claimed by earlier tiles in the
+        // word, so a letter repeated more times than the rack has real
+        // copies of it correctly falls back to a blank (0 points) for the
+        // extra occurrences instead of being scored as real every time.
+        let mut hand = rack_counts(letters);
+        let points = symbol_points();
+
+        for (i, ch) in word.chars().enumerate() {
+            let (r, c) = word_cell(row, col, horizontal, i);
+            if !in_bounds(r, c) {
+                return Err(pyo3::exceptions::PyValueError::new_err(
+                    "word out of bounds",
+                ));
+            }
+            let tile = tile_cell(ch).ok_or_else(|| {
+                pyo3::exceptions::PyValueError::new_err(format!("'{ch}' is not a tile letter"))
+            })?;
+            let bonus = quadrant_bonus(r, c);
+
+            if self.board[r][c] == EMPTY {
+                let this_letter_value = match hand.get_mut(tile as usize) {
+                    Some(count) if (tile as usize) < BLANK && *count > 0 => {
+                        *count -= 1;
+                        points[tile as usize]
+                    }
+                    // No real copy left in hand — a blank stands in for
+                    // this letter and always scores 0.
+                    _ => 0,
+                };
+                tiles_from_hand += 1;
+
+                main_total += this_letter_value * bonus.0 as u32;
+                main_word_mul *= bonus.1 as u32;
+
+                // cross-word formed by this newly placed letter, if any,
+                // scored on its own (this tile's value + existing
+                // perpendicular neighbours), multiplied only by this tile's
+                // own word bonus.
+                if let Some(neighbor_points) = self.cross_neighbor_points(r, c, horizontal) {
+                    let cross_total = this_letter_value * bonus.0 as u32 + neighbor_points;
+                    cross_words_total += cross_total * bonus.1 as u32;
+                }
+            } else {
+                if tile != self.board[r][c] {
+                    return Err(pyo3::exceptions::PyValueError::new_err(format!(
+                        "letter on board '{}' does not match word letter '{}'",
+                        self.char_at(r, c),
+                        ch,
+                    )));
+                }
+                main_total += self.tile_points(r, c);
+            }
+        }
+
+        // Bonus for using the whole rack in one move
+        Ok(main_total * main_word_mul
+            + cross_words_total
+            + if tiles_from_hand == RACK_SIZE { 50 } else { 0 })
+    }
+
+    /// The square at (r, c) as the Python side sees it (`cell_char`).
+    fn char_at(&self, r: usize, c: usize) -> char {
+        cell_char(self.board[r][c])
+    }
+
+    /// What the tile at (r, c) scores: its face value, or 0 for a blank
+    /// (and for an empty square).
+    #[inline]
+    fn tile_points(&self, r: usize, c: usize) -> u32 {
+        if self.blanks[r] & (1 << c) != 0 {
+            return 0;
+        }
+        symbol_points().get(self.board[r][c] as usize).copied().unwrap_or(0)
+    }
+
     /// Return the cross-word formed at `(row, col)` when placing `ch` in the
     /// direction perpendicular to `horizontal`. Returns an empty string if no
     /// neighbour tiles exist.
@@ -1288,60 +2762,51 @@ impl Board {
         if !horizontal {
             // placing vertically → check horizontal neighbours
             let mut x = 1;
-            while x <= col && self.board[row][col - x] != '-' {
+            while x <= col && self.board[row][col - x] != EMPTY {
                 x += 1;
             }
             let start = col - x + 1;
             let mut x = 1;
-            while col + x < BOARD_SIZE && self.board[row][col + x] != '-' {
+            while col + x < BOARD_SIZE && self.board[row][col + x] != EMPTY {
                 x += 1;
             }
             let end = col + x - 1;
             if end > start || (end == start && (start < col || col < end)) {
                 for ci in start..=end {
-                    word.push(if ci == col { ch } else { self.board[row][ci] });
+                    word.push(if ci == col { ch } else { self.char_at(row, ci) });
                 }
             }
         } else {
             // placing horizontally → check vertical neighbours
             let mut y = 1;
-            while y <= row && self.board[row - y][col] != '-' {
+            while y <= row && self.board[row - y][col] != EMPTY {
                 y += 1;
             }
             let start = row - y + 1;
             let mut y = 1;
-            while row + y < BOARD_SIZE && self.board[row + y][col] != '-' {
+            while row + y < BOARD_SIZE && self.board[row + y][col] != EMPTY {
                 y += 1;
             }
             let end = row + y - 1;
             if end > start || (end == start && (start < row || row < end)) {
                 for ri in start..=end {
-                    word.push(if ri == row { ch } else { self.board[ri][col] });
+                    word.push(if ri == row { ch } else { self.char_at(ri, col) });
                 }
             }
         }
         word
     }
 
-    /// Sum of face point values of the cross-word formed at `(row, col)`
-    /// when placing `ch`, excluding `ch`'s own value — i.e. just the
-    /// existing perpendicular neighbours. `None` if no cross-word forms
-    /// here (no adjacent tiles). Reuses `cross_word` rather than
-    /// re-walking the neighbours, since `ch` appears in that string
-    /// exactly once.
-    fn cross_neighbor_points(
-        &self,
-        row: usize,
-        col: usize,
-        horizontal: bool,
-        ch: char,
-    ) -> Option<u32> {
-        let cross = self.cross_word(row, col, horizontal, ch);
-        if cross.is_empty() {
-            return None;
-        }
-        let total: u32 = cross.chars().map(letter_points).sum();
-        Some(total - letter_points(ch))
+    /// Sum of point values of the existing perpendicular neighbours of
+    /// `(row, col)` — the cross-word a tile placed there forms, without the
+    /// tile itself. `None` if no cross-word forms here (no adjacent tiles).
+    fn cross_neighbor_points(&self, row: usize, col: usize, horizontal: bool) -> Option<u32> {
+        let mut run = self
+            .tile_run(row, col, !horizontal, false)
+            .chain(self.tile_run(row, col, !horizontal, true))
+            .peekable();
+        run.peek()?;
+        Some(run.map(|(r, c)| self.tile_points(r, c)).sum())
     }
 
     fn check_word_placement_inner(
@@ -1357,7 +2822,7 @@ impl Board {
             if !in_bounds(r, c) {
                 return false;
             }
-            if self.board[r][c] != '-' {
+            if self.board[r][c] != EMPTY {
                 continue;
             }
 
@@ -1388,7 +2853,7 @@ impl Board {
             .enumerate()
             .filter_map(|(i, ch)| {
                 let (r, c) = word_cell(row, col, horizontal, i);
-                if self.board[r][c] != '-' {
+                if self.board[r][c] != EMPTY {
                     return None;
                 }
                 match hand_freq.get_mut(&ch) {
@@ -1414,11 +2879,11 @@ impl Board {
         let mut pattern = String::new();
         if horizontal {
             for i in start..=end {
-                pattern.push(self.board[row][i]);
+                pattern.push(self.char_at(row, i));
             }
         } else {
             for i in row..=end {
-                pattern.push(self.board[i][start]);
+                pattern.push(self.char_at(i, start));
             }
         }
 
@@ -1434,7 +2899,7 @@ impl Board {
         for word in dawg.search_inner(&pattern, letters) {
             if self.check_word_placement_inner(dawg, &word, row, start, horizontal) {
                 let score = self
-                    .calculate_word_points(&word, row, start, horizontal, letters)
+                    .calculate_word_points_inner(&word, row, start, horizontal, letters)
                     .unwrap_or(0);
                 if score > best_score {
                     best_score = score;
@@ -1459,26 +2924,23 @@ impl Board {
 /// word. Uses the DAWG (`dawg`), since cross-words are ordinary dictionary
 /// words. A square with no perpendicular neighbours never calls this — it keeps
 /// `CROSS_ANY`.
-fn cross_bits(dawg: &Dawg, prefix: &[char], suffix: &[char]) -> u32 {
+fn cross_bits(dawg: &Dawg, prefix: &[Cell], suffix: &[Cell]) -> u32 {
     let mut node = dawg.root;
-    for &ch in prefix {
-        match dawg.find_child(node, ch) {
+    for &sym in prefix {
+        match dawg.find_symbol(node, sym) {
             Some(n) => node = n,
             None => return 0,
         }
     }
     let mut bits = 0u32;
-    let cnt = dawg.node_children_count(node);
-    for i in 0..cnt {
-        let (l, child) = dawg.node_child(node, i);
-        let bit = letter_bit(l);
-        if bit == 0 {
+    for edge in dawg.node_children(node) {
+        if edge.bit == 0 {
             continue;
         }
-        let mut n = child;
+        let mut n = edge.id;
         let mut ok = true;
-        for &ch in suffix {
-            match dawg.find_child(n, ch) {
+        for &sym in suffix {
+            match dawg.find_symbol(n, sym) {
                 Some(x) => n = x,
                 None => {
                     ok = false;
@@ -1487,7 +2949,7 @@ fn cross_bits(dawg: &Dawg, prefix: &[char], suffix: &[char]) -> u32 {
             }
         }
         if ok && dawg.node_is_terminal(n) {
-            bits |= bit;
+            bits |= edge.bit;
         }
     }
     bits
@@ -1506,70 +2968,371 @@ struct GenCtx<'a> {
     cross_score: &'a [[u32; BOARD_SIZE]; BOARD_SIZE],
     /// Whether a cross-word forms at each empty square (has a perpendicular tile).
     has_cross: &'a [[bool; BOARD_SIZE]; BOARD_SIZE],
-    /// Count of each real (non-blank) rack letter, indexed by `letter_index`.
-    /// Precomputed once per move so `score_word`'s word-order real-vs-blank
-    /// allocation is a cheap array copy, not a per-word map allocation.
-    rack_counts: [u8; ALPHABET_SIZE],
+    /// The rack's tile counts. Precomputed once per move so `score_word`'s
+    /// word-order real-vs-blank allocation is a cheap array copy, not a
+    /// per-word map allocation.
+    rack_counts: RackCounts,
     ar: usize,
     ac: usize,
     horizontal: bool,
 }
 
-/// A generated, scored placement: (row, col, horizontal, word, score) of the
-/// leftmost/topmost cell. Scored during generation via `GenCtx::score_word`,
-/// which reproduces `calculate_word_points` exactly using precomputed
-/// cross-scores instead of re-walking the board.
-type GenMove = (usize, usize, bool, String, u32);
+/// A generated, scored placement, anchored at its leftmost/topmost cell.
+/// Scored during generation via `GenCtx::score_word`, which reproduces
+/// `calculate_word_points` exactly using precomputed cross-scores instead of
+/// re-walking the board.
+///
+/// A fixed-size `Copy` record — the word as alphabet indices, plus which of
+/// its new tiles are blanks — so generating, ranking and discarding
+/// candidates never touches the heap. Only the moves that are returned are
+/// spelled out, by `word` / `used` / `to_best_word`.
+#[derive(Clone, Copy, PartialEq, Eq, PartialOrd, Ord, Hash, Debug)]
+struct GenMove {
+    /// `row * BOARD_SIZE + col`, with `GenMove::HORIZONTAL` set for a
+    /// horizontal play.
+    pos: u16,
+    len: u8,
+    /// `letter_index` of each letter; only the first `len` are meaningful.
+    letters: [u8; BOARD_SIZE],
+    /// Bit `i` set: letter `i` is a new tile a blank stands in for.
+    blanks: u16,
+    score: u32,
+}
 
-impl<'a> GenCtx<'a> {
-    /// Board cell `off` squares along the play direction from the anchor, or
-    /// `None` if it falls off the board.
-    #[inline]
-    fn cell(&self, off: isize) -> Option<(usize, usize)> {
-        let (r, c) = if self.horizontal {
-            (self.ar as isize, self.ac as isize + off)
-        } else {
-            (self.ar as isize + off, self.ac as isize)
-        };
-        if r >= 0 && r < BOARD_SIZE as isize && c >= 0 && c < BOARD_SIZE as isize {
-            Some((r as usize, c as usize))
-        } else {
-            None
+impl GenMove {
+    const HORIZONTAL: u16 = 1 << 15;
+
+    fn row(&self) -> usize {
+        (self.pos & !Self::HORIZONTAL) as usize / BOARD_SIZE
+    }
+
+    fn col(&self) -> usize {
+        (self.pos & !Self::HORIZONTAL) as usize % BOARD_SIZE
+    }
+
+    fn horizontal(&self) -> bool {
+        self.pos & Self::HORIZONTAL != 0
+    }
+
+    fn chars(&self) -> impl Iterator<Item = char> + '_ {
+        let chars = symbol_chars();
+        self.letters[..self.len as usize].iter().map(|&i| chars[i as usize])
+    }
+
+    fn word(&self) -> String {
+        self.chars().collect()
+    }
+
+    /// The rack tiles the move spends, one per new tile, in word order: the
+    /// letter itself, or `'?'` where a blank stands in (as
+    /// `Board::hand_tiles_for_word` reports it).
+    fn used(&self, board: &Board) -> Vec<char> {
+        let (row, col, horizontal) = (self.row(), self.col(), self.horizontal());
+        self.chars()
+            .enumerate()
+            .filter(|&(i, _)| {
+                let (r, c) = word_cell(row, col, horizontal, i);
+                board.board[r][c] == EMPTY
+            })
+            .map(|(i, ch)| if self.blanks & (1 << i) != 0 { '?' } else { ch })
+            .collect()
+    }
+
+    fn to_best_word(self, board: &Board) -> BestWord {
+        let used = self.used(board);
+        (self.word(), self.score, (self.row(), self.col(), self.horizontal()), used)
+    }
+}
+
+/// Where `GenCtx` delivers generated moves. `record` scores a move first and
+/// only builds its `GenMove` if the sink `wants` that score.
+trait MoveSink {
+    fn wants(&self, score: u32) -> bool;
+    fn push(&mut self, mv: GenMove);
+
+    /// Lowest score a not-yet-generated move needs for the sink to keep it,
+    /// if there is one — the cut-off for branch-and-bound pruning.
+    fn floor(&self) -> Option<u32> {
+        None
+    }
+}
+
+/// Keep everything (`gen-verify`'s exhaustive comparisons).
+impl MoveSink for Vec<GenMove> {
+    fn wants(&self, _score: u32) -> bool {
+        true
+    }
+
+    fn push(&mut self, mv: GenMove) {
+        Vec::push(self, mv);
+    }
+}
+
+/// Score distribution of every legal play, without keeping the plays
+/// themselves (`get_score_stats`): `hist[s]` counts the plays scoring `s`.
+#[derive(Default)]
+struct ScoreStats {
+    count: usize,
+    hist: Vec<u32>,
+}
+
+impl ScoreStats {
+    fn add(&mut self, score: u32) {
+        let s = score as usize;
+        if self.hist.len() <= s {
+            self.hist.resize(s + 1, 0);
         }
+        self.hist[s] += 1;
+        self.count += 1;
     }
 
-    /// True if the cell at `off` is empty or off the board — i.e. a clean word
-    /// boundary, with no existing tile that the word would have to include.
-    #[inline]
-    fn is_free(&self, off: isize) -> bool {
-        match self.cell(off) {
-            Some((r, c)) => self.board.board[r][c] == '-',
-            None => true,
+    fn merge(mut self, other: ScoreStats) -> ScoreStats {
+        if self.hist.len() < other.hist.len() {
+            self.hist.resize(other.hist.len(), 0);
         }
+        for (acc, n) in self.hist.iter_mut().zip(other.hist) {
+            *acc += n;
+        }
+        self.count += other.count;
+        self
     }
 
-    /// Fill the square at `off`: follow an existing tile's arc, or try every
-    /// rack letter the current GADDAG node and the square's cross-check allow.
-    fn gen(
-        &self,
-        node: u32,
-        off: isize,
-        budget: usize,
-        freq: &mut LetterFreq,
-        left: &mut Vec<char>,
-        right: &mut Vec<char>,
-        out: &mut Vec<GenMove>,
+    /// `(count, best, worst, histogram)`, or all zeros and an empty
+    /// histogram when there is no legal play.
+    fn summary(self) -> (usize, u32, u32, Vec<u32>) {
+        let worst = self.hist.iter().position(|&n| n > 0).unwrap_or(0) as u32;
+        let best = self.hist.len().saturating_sub(1) as u32;
+        (self.count, best, worst, self.hist)
+    }
+}
+
+impl MoveSink for ScoreStats {
+    fn wants(&self, _score: u32) -> bool {
+        true
+    }
+
+    fn push(&mut self, mv: GenMove) {
+        self.add(mv.score);
+    }
+}
+
+/// A kept move ranked for `TopN`'s heap: the heap's maximum is the move that
+/// would be evicted first — lowest score, and among equal scores the one
+/// generated last.
+struct Ranked {
+    seq: usize,
+    mv: GenMove,
+}
+
+impl Ranked {
+    fn key(&self) -> (std::cmp::Reverse<u32>, usize) {
+        (std::cmp::Reverse(self.mv.score), self.seq)
+    }
+}
+
+impl PartialEq for Ranked {
+    fn eq(&self, other: &Self) -> bool {
+        self.key() == other.key()
+    }
+}
+
+impl Eq for Ranked {}
+
+impl PartialOrd for Ranked {
+    fn partial_cmp(&self, other: &Self) -> Option<std::cmp::Ordering> {
+        Some(self.cmp(other))
+    }
+}
+
+impl Ord for Ranked {
+    fn cmp(&self, other: &Self) -> std::cmp::Ordering {
+        self.key().cmp(&other.key())
+    }
+}
+
+/// Bounded top-`n` of the moves one generation task produces, ties going to
+/// the earlier move — exactly the first `n` of a stable sort by descending
+/// score, without materialising the rest. Moves are offered in generation
+/// order, so a move merely equal to the worst kept one can never displace it
+/// and `wants` skips building its word. With `n == 1` this degenerates to a
+/// running best score, compared before any string is built.
+///
+/// For `n == 1`, `shared` (when set) is the best score any task has kept so
+/// far. A move must *beat* this task's own best to be kept, but only *match*
+/// another task's, since that one may come later in anchor order and lose the
+/// tie — so `floor` is strict locally and inclusive across tasks.
+struct TopN<'s> {
+    n: usize,
+    seq: usize,
+    heap: BinaryHeap<Ranked>,
+    shared: Option<&'s AtomicU32>,
+}
+
+impl<'s> TopN<'s> {
+    fn new(n: usize) -> Self {
+        TopN {
+            n,
+            seq: 0,
+            heap: BinaryHeap::with_capacity(n.min(64) + 1),
+            shared: None,
+        }
+    }
+
+    fn with_shared(n: usize, shared: Option<&'s AtomicU32>) -> Self {
+        TopN {
+            shared: shared.filter(|_| n == 1),
+            ..TopN::new(n)
+        }
+    }
+
+    /// The kept moves, best first (ties in generation order).
+    fn into_sorted(self) -> Vec<GenMove> {
+        // `into_sorted_vec` is ascending by `Ord`, i.e. best first here.
+        self.heap.into_sorted_vec().into_iter().map(|r| r.mv).collect()
+    }
+}
+
+impl MoveSink for TopN<'_> {
+    fn wants(&self, score: u32) -> bool {
+        if self.heap.len() < self.n {
+            return true;
+        }
+        self.heap.peek().is_some_and(|worst| score > worst.mv.score)
+    }
+
+    fn push(&mut self, mv: GenMove) {
+        if !self.wants(mv.score) {
+            return;
+        }
+        if let Some(shared) = self.shared {
+            shared.fetch_max(mv.score, Ordering::Relaxed);
+        }
+        if self.heap.len() == self.n {
+            self.heap.pop();
+        }
+        self.heap.push(Ranked { seq: self.seq, mv });
+        self.seq += 1;
+    }
+
+    fn floor(&self) -> Option<u32> {
+        let local = if self.heap.len() < self.n {
+            None
+        } else {
+            self.heap.peek().map(|worst| worst.mv.score + 1)
+        };
+        local.max(self.shared.map(|s| s.load(Ordering::Relaxed)))
+    }
+}
+
+/// Ceiling on what covering a stretch of a line adds to a word (see
+/// `Board::anchor_bound`): the tiles already there plus what letter bonuses
+/// could add to the new ones, the product of word multipliers, and the
+/// cross-words formed. The new tiles' own face values are added separately.
+#[derive(Clone, Copy)]
+struct Reach {
+    main: u32,
+    word_mul: u32,
+    cross: u32,
+}
+
+impl Reach {
+    const NONE: Reach = Reach {
+        main: 0,
+        word_mul: 1,
+        cross: 0,
+    };
+
+    fn join(self, other: Reach) -> Reach {
+        Reach {
+            main: self.main + other.main,
+            word_mul: self.word_mul * other.word_mul,
+            cross: self.cross + other.cross,
+        }
+    }
+}
+
+/// Per-direction cross data from `compute_cross_data`: cross-check bitsets,
+/// perpendicular neighbours' face-value sums, and whether a cross-word forms.
+type CrossData = (
+    [[u32; BOARD_SIZE]; BOARD_SIZE],
+    [[u32; BOARD_SIZE]; BOARD_SIZE],
+    [[bool; BOARD_SIZE]; BOARD_SIZE],
+);
+
+/// Everything GADDAG generation needs from a position that does not depend on
+/// the rack: cross data for both play directions and the anchors. Computed once
+/// by `gen_setup` and shared read-only by every rack generated against it.
+/// On an opening board the centre square is the only anchor and only
+/// horizontal plays are generated (`opening`): the board is symmetric about
+/// its diagonal, so the vertical ones would just mirror them.
+#[derive(PartialEq)]
+struct GenSetup {
+    horizontal: CrossData,
+    vertical: CrossData,
+    is_anchor: [[bool; BOARD_SIZE]; BOARD_SIZE],
+    anchors: Vec<(usize, usize)>,
+    opening: bool,
+}
+
+/// A `GenSetup` cached on the `Board` between moves. `place_word` only records
+/// the cells it filled in `dirty` (it has no DAWG to recompute cross-checks
+/// with); the next generation against the same DAWG (`dawg_id`) repairs just
+/// the squares those tiles can affect, instead of rescanning the whole board.
+struct GenCache {
+    dawg_id: u64,
+    setup: GenSetup,
+    dirty: Vec<(usize, usize)>,
+}
+
+impl<'a> GenCtx<'a> {
+    /// Board cell `off` squares along the play direction from the anchor, or
+    /// `None` if it falls off the board.
+    #[inline]
+    fn cell(&self, off: isize) -> Option<(usize, usize)> {
+        let (r, c) = if self.horizontal {
+            (self.ar as isize, self.ac as isize + off)
+        } else {
+            (self.ar as isize + off, self.ac as isize)
+        };
+        if r >= 0 && r < BOARD_SIZE as isize && c >= 0 && c < BOARD_SIZE as isize {
+            Some((r as usize, c as usize))
+        } else {
+            None
+        }
+    }
+
+    /// True if the cell at `off` is empty or off the board — i.e. a clean word
+    /// boundary, with no existing tile that the word would have to include.
+    #[inline]
+    fn is_free(&self, off: isize) -> bool {
+        match self.cell(off) {
+            Some((r, c)) => self.board.board[r][c] == EMPTY,
+            None => true,
+        }
+    }
+
+    /// Fill the square at `off`: follow an existing tile's arc, or try every
+    /// rack letter the current GADDAG node and the square's cross-check allow.
+    fn gen<S: MoveSink>(
+        &self,
+        node: u32,
+        off: isize,
+        budget: usize,
+        freq: &mut RackCounts,
+        left: &mut Vec<u8>,
+        right: &mut Vec<u8>,
+        out: &mut S,
     ) {
         let (r, c) = match self.cell(off) {
             Some(rc) => rc,
             None => return,
         };
-        let bch = self.board.board[r][c];
-        if bch != '-' {
+        let tile = self.board.board[r][c];
+        if tile != EMPTY {
             // Existing tile: forced letter, no rack cost, no cross-check, and it
             // does not consume the left budget (only new tiles do).
-            if let Some(next) = self.gaddag.find_child(node, bch) {
-                self.go_on(off, bch, next, budget, freq, left, right, out);
+            if let Some(next) = self.gaddag.find_symbol(node, tile) {
+                self.go_on(off, tile, next, budget, freq, left, right, out);
             }
             return;
         }
@@ -1584,56 +3347,117 @@ impl<'a> GenCtx<'a> {
         // real tile if one is left, else a blank (greedy real-first is optimal
         // for feasibility — reals only fit their own letter, blanks fit any).
         let allowed = self.cross[r][c];
-        let qi = '?' as usize;
-        // Iterate the node's decoded children directly: `bit` is the precomputed
-        // cross-check mask (0 for SEP), so the hot loop avoids re-decoding the
-        // edge codepoint and recomputing `letter_bit` on every arc.
+        // Iterate the node's edges directly: `bit` is the cross-check mask,
+        // stored (`Wide`) or derived from the symbol index (`Packed`), and its
+        // position is the letter's index — so the hot loop never looks the
+        // letter up. `SEP` has no bit and is skipped here; the direction switch
+        // is handled in go_on.
         for entry in self.gaddag.node_children(node) {
-            let l = entry.ch;
-            if l == SEP {
-                continue; // direction switch is handled in go_on, not here
-            }
             if allowed & entry.bit == 0 {
                 continue;
             }
-            let li = l as usize;
-            let used_real = li < FREQ_SIZE && freq[li] > 0;
+            let li = entry.bit.trailing_zeros() as usize;
+            let used_real = freq[li] > 0;
             if used_real {
                 freq[li] -= 1;
-            } else if freq[qi] > 0 {
-                freq[qi] -= 1;
+            } else if freq[BLANK] > 0 {
+                freq[BLANK] -= 1;
             } else {
                 continue; // no tile can play this letter
             }
-            self.go_on(off, l, entry.id, next_budget, freq, left, right, out);
+            self.go_on(off, li as u8, entry.id, next_budget, freq, left, right, out);
             if used_real {
                 freq[li] += 1;
             } else {
-                freq[qi] += 1;
+                freq[BLANK] += 1;
+            }
+        }
+    }
+
+    /// Opening generation on an empty board, from the centre anchor: every
+    /// word the rack spells is walked once, forwards, through the GADDAG's
+    /// `w0 SEP w1…` entries, and recorded at each offset that covers the
+    /// anchor. On an empty board the squares only matter for scoring, so this
+    /// skips the per-offset re-walks of `gen`'s reversed prefixes. Only first
+    /// letters in `first` are tried (all of them for `CROSS_ANY`), which lets
+    /// the single anchor be split across tasks.
+    fn gen_opening<S: MoveSink>(&self, first: u32, freq: &mut RackCounts, word: &mut Vec<u8>, out: &mut S) {
+        for entry in self.gaddag.node_children(self.gaddag.root) {
+            if first & entry.bit == 0 {
+                continue;
+            }
+            if let Some(sep_node) = self.gaddag.find_symbol(entry.id, SEP_SYMBOL) {
+                let li = entry.bit.trailing_zeros() as u8;
+                self.spend(li, freq, |freq| {
+                    word.push(li);
+                    self.extend_opening(sep_node, freq, word, out);
+                    word.pop();
+                });
+            }
+        }
+    }
+
+    fn extend_opening<S: MoveSink>(&self, node: u32, freq: &mut RackCounts, word: &mut Vec<u8>, out: &mut S) {
+        let len = word.len();
+        if self.gaddag.node_is_terminal(node) {
+            // Offset k puts the word's k-th letter on the anchor square.
+            for k in len.saturating_sub(BOARD_SIZE - self.ac)..len.min(self.ac + 1) {
+                self.emit(-(k as isize), len, word.iter(), out);
+            }
+        }
+        if len == BOARD_SIZE {
+            return;
+        }
+        for entry in self.gaddag.node_children(node) {
+            if entry.bit == 0 {
+                continue; // SEP
             }
+            let li = entry.bit.trailing_zeros() as u8;
+            self.spend(li, freq, |freq| {
+                word.push(li);
+                self.extend_opening(entry.id, freq, word, out);
+                word.pop();
+            });
         }
     }
 
+    /// Run `f` with one tile for letter `li` taken from `freq` — a real one if
+    /// left, else a blank — and put it back afterwards; skip it if neither is.
+    #[inline]
+    fn spend(&self, li: u8, freq: &mut RackCounts, f: impl FnOnce(&mut RackCounts)) {
+        let li = li as usize;
+        let slot = if freq[li] > 0 {
+            li
+        } else if freq[BLANK] > 0 {
+            BLANK
+        } else {
+            return;
+        };
+        freq[slot] -= 1;
+        f(freq);
+        freq[slot] += 1;
+    }
+
     /// Having committed letter `l` at `off` (reaching `new_node`), record any
     /// completed word and recurse: keep extending left, switch direction across
     /// `SEP`, or keep extending right.
-    fn go_on(
+    fn go_on<S: MoveSink>(
         &self,
         off: isize,
-        l: char,
+        l: u8,
         new_node: u32,
         budget: usize,
-        freq: &mut LetterFreq,
-        left: &mut Vec<char>,
-        right: &mut Vec<char>,
-        out: &mut Vec<GenMove>,
+        freq: &mut RackCounts,
+        left: &mut Vec<u8>,
+        right: &mut Vec<u8>,
+        out: &mut S,
     ) {
         if off <= 0 {
             // Left phase: letters accrue anchor-first, i.e. reversed board order.
             left.push(l);
             // Switch to the right half only if the word's left end is clean.
             if self.is_free(off - 1) {
-                if let Some(sep_node) = self.gaddag.find_child(new_node, SEP) {
+                if let Some(sep_node) = self.gaddag.find_symbol(new_node, SEP_SYMBOL) {
                     if self.gaddag.node_is_terminal(sep_node) && self.is_free(1) {
                         self.record(left, right, out);
                     }
@@ -1656,24 +3480,43 @@ impl<'a> GenCtx<'a> {
     }
 
     /// Emit the word currently spelled by `left` (reversed) followed by `right`,
-    /// anchored at its leftmost/topmost cell, scored in place.
-    fn record(&self, left: &[char], right: &[char], out: &mut Vec<GenMove>) {
-        let len = left.len() + right.len();
+    /// anchored at its leftmost/topmost cell, scored in place. The `GenMove`
+    /// is only built if `out` will keep a move of that score.
+    fn record<S: MoveSink>(&self, left: &[u8], right: &[u8], out: &mut S) {
+        let leftmost_off = -(left.len() as isize - 1);
+        self.emit(leftmost_off, left.len() + right.len(), left.iter().rev().chain(right), out);
+    }
+
+    /// `record` for a word of `len` letters starting `leftmost_off` squares
+    /// from the anchor, given in board order.
+    fn emit<'w, S: MoveSink>(
+        &self,
+        leftmost_off: isize,
+        len: usize,
+        word: impl Iterator<Item = &'w u8> + Clone,
+        out: &mut S,
+    ) {
         if len < 2 {
             return; // a legal play spells a word of at least two letters
         }
-        let mut word = String::with_capacity(len * 2);
-        for &ch in left.iter().rev() {
-            word.push(ch);
-        }
-        for &ch in right {
-            word.push(ch);
-        }
-        let leftmost_off = -(left.len() as isize - 1);
         // The leftmost cell was placed, so it is always in bounds.
         if let Some((r, c)) = self.cell(leftmost_off) {
-            let score = self.score_word(r, c, &word);
-            out.push((r, c, self.horizontal, word, score));
+            let (score, blanks) = self.score_word(r, c, word.clone());
+            if !out.wants(score) {
+                return;
+            }
+            let mut letters = [0u8; BOARD_SIZE];
+            for (slot, &l) in letters.iter_mut().zip(word) {
+                *slot = l;
+            }
+            let pos = (r * BOARD_SIZE + c) as u16;
+            out.push(GenMove {
+                pos: if self.horizontal { pos | GenMove::HORIZONTAL } else { pos },
+                len: len as u8,
+                letters,
+                blanks,
+                score,
+            });
         }
     }
 
@@ -1683,27 +3526,31 @@ impl<'a> GenCtx<'a> {
     /// cross-word scoring and +50 bingo — but reads the perpendicular
     /// contribution from `cross_score`/`has_cross` instead of re-walking the
     /// board. `calculate_word_points` stays the authority; `gen-verify` asserts
-    /// they agree.
-    fn score_word(&self, r0: usize, c0: usize, word: &str) -> u32 {
+    /// they agree. Also returns which letters (as a bitmask by word position)
+    /// that allocation gave to blanks.
+    fn score_word<'w>(&self, r0: usize, c0: usize, word: impl Iterator<Item = &'w u8>) -> (u32, u16) {
         let mut main_total = 0u32;
         let mut main_word_mul = 1u32;
         let mut cross_total = 0u32;
         let mut tiles_from_hand = 0usize;
-        // A fresh copy of the real-letter counts to spend as we walk the word --
-        // a 32-byte stack array, not a per-word HashMap allocation.
+        let mut blanks = 0u16;
+        // A fresh copy of the rack counts to spend as we walk the word --
+        // a 33-byte stack array, not a per-word HashMap allocation.
         let mut hand = self.rack_counts;
-        for (i, ch) in word.chars().enumerate() {
+        let points = symbol_points();
+        for (i, &l) in word.enumerate() {
             let (r, c) = word_cell(r0, c0, self.horizontal, i);
             let (lm, wm) = quadrant_bonus(r, c);
             let (lm, wm) = (lm as u32, wm as u32);
-            if self.board.board[r][c] == '-' {
+            if self.board.board[r][c] == EMPTY {
                 // New tile: a real copy if the hand still has one, else a blank (0).
-                let v = match letter_index(ch) {
-                    Some(idx) if hand[idx] > 0 => {
-                        hand[idx] -= 1;
-                        letter_points(ch)
-                    }
-                    _ => 0,
+                let l = l as usize;
+                let v = if hand[l] > 0 {
+                    hand[l] -= 1;
+                    points[l]
+                } else {
+                    blanks |= 1 << i;
+                    0
                 };
                 tiles_from_hand += 1;
                 main_total += v * lm;
@@ -1712,29 +3559,42 @@ impl<'a> GenCtx<'a> {
                     cross_total += (v * lm + self.cross_score[r][c]) * wm;
                 }
             } else {
-                main_total += letter_points(ch);
+                main_total += self.board.tile_points(r, c);
             }
         }
-        main_total * main_word_mul + cross_total + if tiles_from_hand == RACK_SIZE { 50 } else { 0 }
+        let bingo = if tiles_from_hand == RACK_SIZE { 50 } else { 0 };
+        (main_total * main_word_mul + cross_total + bingo, blanks)
     }
 }
 
 impl Board {
+    /// The opening move is still to be played: the first play must cover
+    /// the (empty) centre square instead of touching a tile.
+    fn is_opening(&self) -> bool {
+        self.first && self.board[CENTER][CENTER] == EMPTY
+    }
+
     /// Anchors — empty squares orthogonally adjacent to at least one tile, which
-    /// every non-opening play must cover. Returns both the boolean grid (used by
-    /// the left-limit) and the list to iterate.
+    /// every non-opening play must cover; for the opening, just the centre.
+    /// Returns both the boolean grid (used by the left-limit) and the list to
+    /// iterate.
     fn anchor_grid(&self) -> ([[bool; BOARD_SIZE]; BOARD_SIZE], Vec<(usize, usize)>) {
         let mut grid = [[false; BOARD_SIZE]; BOARD_SIZE];
         let mut anchors = Vec::new();
+        if self.is_opening() {
+            grid[CENTER][CENTER] = true;
+            anchors.push((CENTER, CENTER));
+            return (grid, anchors);
+        }
         for r in 0..BOARD_SIZE {
             for c in 0..BOARD_SIZE {
-                if self.board[r][c] != '-' {
+                if self.board[r][c] != EMPTY {
                     continue;
                 }
-                let adjacent = (r > 0 && self.board[r - 1][c] != '-')
-                    || (r + 1 < BOARD_SIZE && self.board[r + 1][c] != '-')
-                    || (c > 0 && self.board[r][c - 1] != '-')
-                    || (c + 1 < BOARD_SIZE && self.board[r][c + 1] != '-');
+                let adjacent = (r > 0 && self.board[r - 1][c] != EMPTY)
+                    || (r + 1 < BOARD_SIZE && self.board[r + 1][c] != EMPTY)
+                    || (c > 0 && self.board[r][c - 1] != EMPTY)
+                    || (c + 1 < BOARD_SIZE && self.board[r][c + 1] != EMPTY);
                 if adjacent {
                     grid[r][c] = true;
                     anchors.push((r, c));
@@ -1768,7 +3628,7 @@ impl Board {
                 Some(rc) => rc,
                 None => break,
             };
-            if self.board[rr][cc] != '-' || is_anchor[rr][cc] {
+            if self.board[rr][cc] != EMPTY || is_anchor[rr][cc] {
                 break;
             }
             budget += 1;
@@ -1777,87 +3637,250 @@ impl Board {
         budget
     }
 
+    /// Branch-and-bound ceiling on the score of any play through the anchor
+    /// at (`r`, `c`) in one direction: `1..=left_max` new tiles from the anchor
+    /// backwards plus any number forwards from the square after it, at most
+    /// `top.len() - 1` in all. `top[j]` is the sum of the `j` highest face
+    /// values in the rack, and the highest alone stands in for a tile's value
+    /// wherever a bonus multiplies it. The bingo counts only when a
+    /// split can use a full rack.
+    fn anchor_bound(
+        &self,
+        data: &CrossData,
+        r: usize,
+        c: usize,
+        horizontal: bool,
+        left_max: usize,
+        top: &[u32],
+    ) -> u32 {
+        let at = |k: usize| if horizontal { (r, k) } else { (k, c) };
+        let pos = if horizontal { c } else { r };
+        let max_tiles = top.len() - 1;
+        let rack_max = top.get(1).copied().unwrap_or(0);
+        let left = self.reach(data, (0..=pos).rev().map(at), rack_max, left_max.min(max_tiles));
+        let right = self.reach(data, (pos + 1..BOARD_SIZE).map(at), rack_max, max_tiles);
+        let mut best = 0;
+        for (jl, l) in left.iter().enumerate().skip(1) {
+            let Some(l) = l else { break };
+            // Every `Reach` component only grows with the tile count, so the
+            // widest `right` that still fits is the best partner.
+            let fits = (0..=max_tiles - jl).rev().find_map(|jr| right[jr].map(|r| (jr, r)));
+            if let Some((jr, r)) = fits {
+                let (reach, tiles) = (l.join(r), jl + jr);
+                let bingo = if tiles == RACK_SIZE { 50 } else { 0 };
+                best = best.max((reach.main + top[tiles]) * reach.word_mul + reach.cross + bingo);
+            }
+        }
+        best
+    }
+
+    /// `Reach` of the squares `cells` walks through (in order, from the first)
+    /// until `j` empty ones are filled, plus the run of tiles just past them,
+    /// for each `j` up to `max_tiles`; `None` where `j` tiles cannot fit —
+    /// the walk hits the edge, or a square no letter's cross-check allows.
+    fn reach(
+        &self,
+        (checks, scores, has): &CrossData,
+        cells: impl Iterator<Item = (usize, usize)>,
+        rack_max: u32,
+        max_tiles: usize,
+    ) -> [Option<Reach>; RACK_SIZE + 1] {
+        let mut row = [None; RACK_SIZE + 1];
+        let mut acc = Reach::NONE;
+        let mut j = 0;
+        for (r, c) in cells {
+            if self.board[r][c] != EMPTY {
+                acc.main += self.tile_points(r, c);
+                continue;
+            }
+            // An empty square: a word with `j` new tiles can end before it.
+            row[j] = Some(acc);
+            if j == max_tiles || checks[r][c] == 0 {
+                return row;
+            }
+            let (lm, wm) = quadrant_bonus(r, c);
+            let (lm, wm) = (lm as u32, wm as u32);
+            acc.main += rack_max * (lm - 1);
+            acc.word_mul *= wm;
+            if has[r][c] {
+                acc.cross += (rack_max * lm + scores[r][c]) * wm;
+            }
+            j += 1;
+        }
+        row[j] = Some(acc); // the edge
+        row
+    }
+
     /// Precompute, for every empty square and plays in the given direction
     /// (`horizontal` → vertical cross-words): the cross-check bitset, the sum of
     /// the perpendicular neighbours' face values (`cross_score`), and whether a
     /// cross-word forms (`has_cross`). Squares with no perpendicular neighbour
     /// keep `CROSS_ANY` / 0 / false. One neighbour walk feeds all three.
-    #[allow(clippy::type_complexity)]
-    fn compute_cross_data(
+    fn compute_cross_data(&self, dawg: &Dawg, horizontal: bool) -> CrossData {
+        let mut data = (
+            [[CROSS_ANY; BOARD_SIZE]; BOARD_SIZE],
+            [[0u32; BOARD_SIZE]; BOARD_SIZE],
+            [[false; BOARD_SIZE]; BOARD_SIZE],
+        );
+        for r in 0..BOARD_SIZE {
+            for c in 0..BOARD_SIZE {
+                self.update_cross_data(dawg, horizontal, &mut data, r, c);
+            }
+        }
+        data
+    }
+
+    /// Recompute one square of `compute_cross_data`'s output in place.
+    fn update_cross_data(
         &self,
         dawg: &Dawg,
         horizontal: bool,
-    ) -> (
-        [[u32; BOARD_SIZE]; BOARD_SIZE],
-        [[u32; BOARD_SIZE]; BOARD_SIZE],
-        [[bool; BOARD_SIZE]; BOARD_SIZE],
+        (checks, scores, has): &mut CrossData,
+        r: usize,
+        c: usize,
     ) {
-        let mut checks = [[CROSS_ANY; BOARD_SIZE]; BOARD_SIZE];
-        let mut scores = [[0u32; BOARD_SIZE]; BOARD_SIZE];
-        let mut has = [[false; BOARD_SIZE]; BOARD_SIZE];
+        (checks[r][c], scores[r][c], has[r][c]) = (CROSS_ANY, 0, false);
+        if self.board[r][c] != EMPTY {
+            return;
+        }
+        // Perpendicular to the play direction.
+        let (prefix, suffix) = (
+            self.tiles_before(r, c, !horizontal),
+            self.tiles_after(r, c, !horizontal),
+        );
+        if prefix.is_empty() && suffix.is_empty() {
+            return;
+        }
+        has[r][c] = true;
+        scores[r][c] = self.cross_neighbor_points(r, c, horizontal).unwrap_or(0);
+        checks[r][c] = cross_bits(dawg, &prefix, &suffix);
+    }
+
+    /// The rack-independent half of generation for this position.
+    fn gen_setup(&self, dawg: &Dawg) -> GenSetup {
+        let (is_anchor, anchors) = self.anchor_grid();
+        GenSetup {
+            horizontal: self.compute_cross_data(dawg, true),
+            vertical: self.compute_cross_data(dawg, false),
+            is_anchor,
+            anchors,
+            opening: self.is_opening(),
+        }
+    }
+
+    /// Bring `gen_cache` up to date for `dawg`. A cache built against another
+    /// DAWG, or on the other side of the opening move, is rebuilt from
+    /// scratch; otherwise only the squares touched by
+    /// tiles placed since the last call are repaired.
+    fn refresh_gen_cache(&mut self, dawg: &Dawg) {
+        let mut cache = match self.gen_cache.take() {
+            Some(cache) if cache.dawg_id == dawg.id && cache.setup.opening == self.is_opening() => cache,
+            _ => GenCache {
+                dawg_id: dawg.id,
+                setup: self.gen_setup(dawg),
+                dirty: Vec::new(),
+            },
+        };
+        if !cache.dirty.is_empty() {
+            self.repair_setup(dawg, &mut cache.setup, &cache.dirty);
+            cache.dirty.clear();
+        }
+        self.gen_cache = Some(cache);
+    }
+
+    /// Patch `setup` after tiles were placed on `filled`. A square's
+    /// cross-word is the tile run directly above/below it (or left/right), so
+    /// the only empty squares whose cross data can change are the first empty
+    /// square past each end of the runs through the new tiles; the new tiles'
+    /// own squares drop out. Anchors change only on and next to new tiles.
+    fn repair_setup(&self, dawg: &Dawg, setup: &mut GenSetup, filled: &[(usize, usize)]) {
+        const STEPS: [(isize, isize); 4] = [(-1, 0), (1, 0), (0, -1), (0, 1)];
+        let mut touched = [[false; BOARD_SIZE]; BOARD_SIZE];
+        for &(r, c) in filled {
+            touched[r][c] = true;
+            for (dr, dc) in STEPS {
+                let (mut rr, mut cc) = (r as isize, c as isize);
+                loop {
+                    rr += dr;
+                    cc += dc;
+                    if !in_bounds_signed(rr, cc) {
+                        break;
+                    }
+                    if self.board[rr as usize][cc as usize] == EMPTY {
+                        touched[rr as usize][cc as usize] = true;
+                        break;
+                    }
+                }
+            }
+        }
         for r in 0..BOARD_SIZE {
             for c in 0..BOARD_SIZE {
-                if self.board[r][c] != '-' {
-                    continue;
+                if touched[r][c] {
+                    self.update_cross_data(dawg, true, &mut setup.horizontal, r, c);
+                    self.update_cross_data(dawg, false, &mut setup.vertical, r, c);
                 }
-                // Perpendicular to the play direction.
-                let (prefix, suffix) = (
-                    self.tiles_before(r, c, !horizontal),
-                    self.tiles_after(r, c, !horizontal),
-                );
-                if prefix.is_empty() && suffix.is_empty() {
-                    continue;
+            }
+        }
+
+        for &(r, c) in filled {
+            setup.is_anchor[r][c] = false;
+            for (dr, dc) in STEPS {
+                let (rr, cc) = (r as isize + dr, c as isize + dc);
+                if in_bounds_signed(rr, cc) && self.board[rr as usize][cc as usize] == EMPTY {
+                    setup.is_anchor[rr as usize][cc as usize] = true;
+                }
+            }
+        }
+        // Row-major, as `anchor_grid` lists them, so generation order (and
+        // with it the order of equal-scoring moves) matches a fresh setup.
+        setup.anchors.clear();
+        for r in 0..BOARD_SIZE {
+            for c in 0..BOARD_SIZE {
+                if setup.is_anchor[r][c] {
+                    setup.anchors.push((r, c));
                 }
-                has[r][c] = true;
-                scores[r][c] = prefix
-                    .iter()
-                    .chain(suffix.iter())
-                    .map(|&ch| letter_points(ch))
-                    .sum();
-                checks[r][c] = cross_bits(dawg, &prefix, &suffix);
             }
         }
-        (checks, scores, has)
+    }
+
+    /// Squares of the contiguous run of tiles next to (r, c) along a row
+    /// (`horizontal`) or column, nearest first: the run after it with
+    /// `forward`, else the one before it.
+    fn tile_run(
+        &self,
+        r: usize,
+        c: usize,
+        horizontal: bool,
+        forward: bool,
+    ) -> impl Iterator<Item = (usize, usize)> + '_ {
+        let step = move |(r, c): (usize, usize)| {
+            let (r, c) = match (horizontal, forward) {
+                (true, true) => (r, c + 1),
+                (true, false) => (r, c.checked_sub(1)?),
+                (false, true) => (r + 1, c),
+                (false, false) => (r.checked_sub(1)?, c),
+            };
+            (in_bounds(r, c) && self.board[r][c] != EMPTY).then_some((r, c))
+        };
+        std::iter::successors(step((r, c)), move |&rc| step(rc))
     }
 
     /// Contiguous run of tiles immediately before (r, c) along a row
     /// (`horizontal`) or column, in reading order (left→right / top→down).
-    fn tiles_before(&self, r: usize, c: usize, horizontal: bool) -> Vec<char> {
-        let mut run = Vec::new();
-        let mut k = 1usize;
-        loop {
-            let cell = if horizontal {
-                c.checked_sub(k).map(|cc| (r, cc))
-            } else {
-                r.checked_sub(k).map(|rr| (rr, c))
-            };
-            let (rr, cc) = match cell {
-                Some(rc) => rc,
-                None => break,
-            };
-            if self.board[rr][cc] == '-' {
-                break;
-            }
-            run.push(self.board[rr][cc]);
-            k += 1;
-        }
+    fn tiles_before(&self, r: usize, c: usize, horizontal: bool) -> Vec<Cell> {
+        let mut run: Vec<Cell> = self
+            .tile_run(r, c, horizontal, false)
+            .map(|(rr, cc)| self.board[rr][cc])
+            .collect();
         run.reverse(); // collected nearest-first; reading order wants farthest-first
         run
     }
 
     /// Contiguous run of tiles immediately after (r, c), in reading order.
-    fn tiles_after(&self, r: usize, c: usize, horizontal: bool) -> Vec<char> {
-        let mut run = Vec::new();
-        let mut k = 1usize;
-        loop {
-            let (rr, cc) = if horizontal { (r, c + k) } else { (r + k, c) };
-            if rr >= BOARD_SIZE || cc >= BOARD_SIZE || self.board[rr][cc] == '-' {
-                break;
-            }
-            run.push(self.board[rr][cc]);
-            k += 1;
-        }
-        run
+    fn tiles_after(&self, r: usize, c: usize, horizontal: bool) -> Vec<Cell> {
+        self.tile_run(r, c, horizontal, true)
+            .map(|(rr, cc)| self.board[rr][cc])
+            .collect()
     }
 
     /// Generate every legal play via anchor + cross-check + bidirectional
@@ -1873,34 +3896,113 @@ impl Board {
         parallel: bool,
         use_limit: bool,
     ) -> Vec<GenMove> {
-        let (checks_h, scores_h, has_h) = self.compute_cross_data(dawg, true);
-        let (checks_v, scores_v, has_v) = self.compute_cross_data(dawg, false);
-        let (is_anchor, anchors) = self.anchor_grid();
+        self.gaddag_generate_with(&self.gen_setup(dawg), gaddag, letters, parallel, use_limit)
+    }
+
+    /// `gaddag_generate` against a precomputed `GenSetup` for this position.
+    fn gaddag_generate_with(
+        &self,
+        setup: &GenSetup,
+        gaddag: &Dawg,
+        letters: &str,
+        parallel: bool,
+        use_limit: bool,
+    ) -> Vec<GenMove> {
+        self.gaddag_sinks(setup, gaddag, letters, parallel, use_limit, false, Vec::new)
+            .into_iter()
+            .flatten()
+            .collect()
+    }
 
-        // Real (non-blank) rack letter counts, computed once and shared read-only
-        // by every anchor's GenCtx so `score_word` needn't rebuild a map per word.
-        let mut rack_counts = [0u8; ALPHABET_SIZE];
-        for ch in letters.chars() {
-            if let Some(i) = letter_index(ch) {
-                rack_counts[i] += 1;
+    /// Run generation from every anchor, each into its own sink from
+    /// `new_sink`; the sinks come back in anchor order. One sink per anchor
+    /// keeps rayon tasks free of shared state — callers merge the results.
+    /// The opening (`GenCtx::gen_opening`) has a single anchor, so when
+    /// `parallel` it is split into one task (and sink) per first letter the
+    /// rack can play, in the order a serial search would try them.
+    ///
+    /// With `prune`, anchors are visited in descending order of
+    /// `anchor_bound`, and an anchor direction is skipped outright when its
+    /// bound is below the floor of the sink it would fill.
+    #[allow(clippy::too_many_arguments)]
+    fn gaddag_sinks<S: MoveSink + Send>(
+        &self,
+        setup: &GenSetup,
+        gaddag: &Dawg,
+        letters: &str,
+        parallel: bool,
+        use_limit: bool,
+        prune: bool,
+        new_sink: impl Fn() -> S + Sync,
+    ) -> Vec<S> {
+        let (checks_h, scores_h, has_h) = &setup.horizontal;
+        let (checks_v, scores_v, has_v) = &setup.vertical;
+        let (is_anchor, anchors) = (&setup.is_anchor, &setup.anchors);
+
+        // Rack tile counts, computed once: every anchor's search spends its
+        // own copy, and `score_word` reads them to allocate reals vs blanks.
+        let rack_counts = rack_counts(letters);
+
+        let budget = |ar: usize, ac: usize, horizontal: bool| {
+            if use_limit {
+                self.left_budget(is_anchor, ar, ac, horizontal)
+            } else {
+                BOARD_SIZE
             }
-        }
+        };
+
+        // Per anchor, the (horizontal, vertical) score ceilings when pruning.
+        let bounds: Vec<[u32; 2]> = if prune {
+            let mut values: Vec<u32> = letters.chars().map(letter_points).collect();
+            values.sort_unstable_by(|a, b| b.cmp(a));
+            values.truncate(RACK_SIZE);
+            let top: Vec<u32> = std::iter::once(0)
+                .chain(values.iter().scan(0, |sum, &v| {
+                    *sum += v;
+                    Some(*sum)
+                }))
+                .collect();
+            anchors
+                .iter()
+                .map(|&(ar, ac)| {
+                    [(true, &setup.horizontal), (false, &setup.vertical)].map(|(horizontal, data)| {
+                        let left_max = budget(ar, ac, horizontal).saturating_add(1);
+                        self.anchor_bound(data, ar, ac, horizontal, left_max, &top)
+                    })
+                })
+                .collect()
+        } else {
+            Vec::new()
+        };
+
+        // (anchor index, first letters to try for the opening) per task.
+        let tasks: Vec<(usize, u32)> = if setup.opening && parallel {
+            (0..ALPHABET_SIZE)
+                .filter(|&l| rack_counts[l] > 0 || rack_counts[BLANK] > 0)
+                .map(|l| (0, 1u32 << l))
+                .collect()
+        } else {
+            (0..anchors.len()).map(|i| (i, CROSS_ANY)).collect()
+        };
 
-        let gen_one = |(ar, ac): (usize, usize)| -> Vec<GenMove> {
-            let mut out = Vec::new();
-            let (mut freq, _) = build_freq(letters);
+        let gen_one = |(i, first): (usize, u32)| -> S {
+            let (ar, ac) = anchors[i];
+            let mut out = new_sink();
+            let mut freq = rack_counts;
             let mut left = Vec::new();
             let mut right = Vec::new();
             let dirs = [
-                (true, &checks_h, &scores_h, &has_h),
-                (false, &checks_v, &scores_v, &has_v),
+                (true, checks_h, scores_h, has_h),
+                (false, checks_v, scores_v, has_v),
             ];
-            for (horizontal, cross, cross_score, has_cross) in dirs {
-                let budget = if use_limit {
-                    self.left_budget(&is_anchor, ar, ac, horizontal)
-                } else {
-                    BOARD_SIZE
-                };
+            let dirs = &dirs[..if setup.opening { 1 } else { 2 }];
+            for (d, &(horizontal, cross, cross_score, has_cross)) in dirs.iter().enumerate() {
+                if let (Some(bound), Some(floor)) = (bounds.get(i), out.floor()) {
+                    if bound[d] < floor {
+                        continue;
+                    }
+                }
+                let budget = budget(ar, ac, horizontal);
                 let ctx = GenCtx {
                     board: self,
                     gaddag,
@@ -1912,42 +4014,317 @@ impl Board {
                     ac,
                     horizontal,
                 };
-                ctx.gen(gaddag.root, 0, budget, &mut freq, &mut left, &mut right, &mut out);
+                if setup.opening {
+                    ctx.gen_opening(first, &mut freq, &mut left, &mut out);
+                } else {
+                    ctx.gen(gaddag.root, 0, budget, &mut freq, &mut left, &mut right, &mut out);
+                }
                 left.clear();
                 right.clear();
             }
             out
         };
 
-        if parallel {
-            // Run on the engine's own (default 8-thread) pool, not rayon's
-            // all-cores global pool — see `gen_pool`.
-            gen_pool().install(|| anchors.par_iter().flat_map_iter(|&a| gen_one(a)).collect())
-        } else {
-            anchors.iter().flat_map(|&a| gen_one(a)).collect()
+        if !prune {
+            return if parallel {
+                // Run on the engine's own (default 8-thread) pool, not rayon's
+                // all-cores global pool — see `gen_pool`.
+                gen_pool().install(|| tasks.into_par_iter().map(gen_one).collect())
+            } else {
+                tasks.into_iter().map(gen_one).collect()
+            };
+        }
+        // Most promising anchors first, so the floor rises early; the sinks
+        // still go back in task order.
+        let mut order: Vec<usize> = (0..tasks.len()).collect();
+        order.sort_by_key(|&t| {
+            let i = tasks[t].0;
+            std::cmp::Reverse(bounds[i][0].max(bounds[i][1]))
+        });
+        let mut sinks: Vec<(usize, S)> = if parallel {
+            gen_pool().install(|| order.into_par_iter().map(|t| (t, gen_one(tasks[t]))).collect())
+        } else {
+            order.into_iter().map(|t| (t, gen_one(tasks[t]))).collect()
+        };
+        sinks.sort_unstable_by_key(|&(i, _)| i);
+        sinks.into_iter().map(|(_, sink)| sink).collect()
+    }
+
+    /// GADDAG-based replacement for `best_words_from_patterns`: generate every
+    /// legal play (already scored, no duplicates), keep the top `n`. `dawg`
+    /// supplies cross-word checks; `gaddag` drives the traversal.
+    fn gaddag_best_words(
+        &self,
+        dawg: &Dawg,
+        gaddag: &Dawg,
+        letters: &str,
+        n: usize,
+        parallel: bool,
+        prune: bool,
+    ) -> Vec<BestWord> {
+        self.gaddag_best_words_with(&self.gen_setup(dawg), gaddag, letters, n, parallel, prune)
+    }
+
+    /// `gaddag_best_words` against a precomputed `GenSetup` for this position.
+    /// With `prune` (which only bites for `n == 1`), anchors whose
+    /// `anchor_bound` cannot reach the best score found so far are skipped.
+    /// The result is identical either way; `gen-verify` checks.
+    fn gaddag_best_words_with(
+        &self,
+        setup: &GenSetup,
+        gaddag: &Dawg,
+        letters: &str,
+        n: usize,
+        parallel: bool,
+        prune: bool,
+    ) -> Vec<BestWord> {
+        self.gaddag_top_moves(setup, gaddag, letters, n, parallel, prune)
+            .into_iter()
+            .map(|m| m.to_best_word(self))
+            .collect()
+    }
+
+    /// The moves behind `gaddag_best_words_with`, before they are spelled
+    /// out.
+    fn gaddag_top_moves(
+        &self,
+        setup: &GenSetup,
+        gaddag: &Dawg,
+        letters: &str,
+        n: usize,
+        parallel: bool,
+        prune: bool,
+    ) -> Vec<GenMove> {
+        let shared = AtomicU32::new(0);
+        let shared = prune.then_some(&shared);
+        // Each anchor keeps only its own top `n`; concatenated in anchor order,
+        // a stable sort of those is the global top `n` of a full sort.
+        let new_sink = || TopN::with_shared(n, shared);
+        let mut best: Vec<GenMove> = self
+            .gaddag_sinks(setup, gaddag, letters, parallel, true, prune, new_sink)
+            .into_iter()
+            .flat_map(TopN::into_sorted)
+            .collect();
+        best.sort_by_key(|m| std::cmp::Reverse(m.score));
+        best.truncate(n);
+        best
+    }
+}
+
+impl Board {
+    /// Zobrist hash of the position, recomputed from scratch: the XOR of the
+    /// keys of every tile with its blank flag, and of `Zobrist::opening` while
+    /// the opening is still to be played. `hash` holds the same value,
+    /// maintained incrementally.
+    fn zobrist(&self) -> u64 {
+        let keys = zobrist();
+        let mut hash = if self.first { keys.opening } else { 0 };
+        for (r, row) in self.board.iter().enumerate() {
+            for (c, &tile) in row.iter().enumerate() {
+                if tile != EMPTY {
+                    hash ^= keys.tile(r, c, tile, self.blanks[r] & (1 << c) != 0);
+                }
+            }
+        }
+        hash
+    }
+
+    /// Open premium squares by kind and occupied squares, counted from
+    /// scratch; `open_premiums` and `filled` hold the same, maintained
+    /// incrementally.
+    fn count_features(&self) -> ([u8; PREMIUM_KINDS], u8) {
+        let mut open = *premium_totals();
+        let mut filled = 0;
+        for (r, row) in self.board.iter().enumerate() {
+            for (c, _) in row.iter().enumerate().filter(|&(_, &tile)| tile != EMPTY) {
+                filled += 1;
+                if let Some(kind) = premium_kind(r, c) {
+                    open[kind] -= 1;
+                }
+            }
+        }
+        (open, filled)
+    }
+
+    /// Rust half of `get_best_words_by_leave`.
+    fn best_words_by_leave(
+        &mut self,
+        dawg: &DawgPy,
+        letters: &str,
+        model: &LeaveModel,
+        n: usize,
+        candidates: usize,
+        parallel: bool,
+    ) -> Vec<LeaveRankedWord> {
+        let moves = self.best_words(dawg, letters, candidates, parallel, true);
+        let rack = rack_counts(letters);
+        let unseen = self.unseen_total(letters);
+        let (tw, dw, tl, dl, fill) = self.features();
+        let features = [tw, dw, tl, dl, fill];
+        let mut ranked: Vec<LeaveRankedWord> = moves
+            .into_iter()
+            .map(|(word, score, pos, used)| {
+                let value = model.value(&leave_after(&rack, &used), unseen, &features);
+                (word, score, pos, used, value)
+            })
+            .collect();
+        // Python's `round` (half to even) on the value, as SmartPlayer ranks;
+        // the sort is stable, so the first of equal totals wins like `max`.
+        ranked.sort_by_key(|m| std::cmp::Reverse(m.1 as i64 + m.4.round_ties_even() as i64));
+        ranked.truncate(n);
+        ranked
+    }
+
+    /// Tiles on the board per bag letter, counted from scratch; `on_board`
+    /// holds the same, maintained incrementally.
+    fn count_tiles(&self) -> RackCounts {
+        let mut counts = [0; ALPHABET_SIZE + 1];
+        for (r, row) in self.board.iter().enumerate() {
+            for (c, &tile) in row.iter().enumerate().filter(|&(_, &tile)| tile != EMPTY) {
+                counts[bag_slot(tile, self.blanks[r] & (1 << c) != 0)] += 1;
+            }
+        }
+        counts
+    }
+
+    /// The full bag less the tiles on the board and in `rack`, per letter.
+    fn unseen(&self, rack: &str) -> RackCounts {
+        let full = full_bag_counts();
+        let held = rack_counts(rack);
+        std::array::from_fn(|i| full[i].saturating_sub(self.on_board[i]).saturating_sub(held[i]))
+    }
+
+    /// Rust half of `get_best_words`: `dawg`'s move cache, else
+    /// `generate_best_words`.
+    fn best_words(
+        &mut self,
+        dawg: &DawgPy,
+        letters: &str,
+        n: usize,
+        parallel: bool,
+        prune: bool,
+    ) -> Vec<BestWord> {
+        let key = (self.hash, rack_counts(letters));
+        if let Some(moves) = dawg.move_cache().get(&key, n) {
+            return moves;
+        }
+        let moves = self.generate_best_words(dawg, letters, n, parallel, prune);
+        dawg.move_cache().insert(key, n, &moves);
+        moves
+    }
+
+    /// The opening book, GADDAG generation or the legacy opening / pattern
+    /// search, depending on the position and `dawg`.
+    fn generate_best_words(
+        &mut self,
+        dawg: &DawgPy,
+        letters: &str,
+        n: usize,
+        parallel: bool,
+        prune: bool,
+    ) -> Vec<BestWord> {
+        if let Some(moves) = self.book_openings(dawg, letters, n) {
+            return moves;
+        }
+        if let Some(gaddag) = &dawg.gaddag {
+            // Fast path: GADDAG anchor generation (equivalent to the legacy
+            // opening and pattern searches, verified by the `gen-verify` CLI
+            // command), against cross-checks carried over from the previous
+            // move.
+            self.refresh_gen_cache(&dawg.inner);
+            let setup = &self.gen_cache.as_ref().expect("refreshed above").setup;
+            self.gaddag_best_words_with(setup, gaddag, letters, n, parallel, prune)
+        } else if self.first {
+            self.best_opening_words(dawg, letters, n)
+        } else {
+            self.best_words_from_patterns(dawg, letters, n, parallel)
+        }
+    }
+
+    /// The top `n` openings for `letters` from `dawg`'s opening book, if this
+    /// is the opening move and the book covers the rack and `n`.
+    fn book_openings(&self, dawg: &DawgPy, letters: &str, n: usize) -> Option<Vec<BestWord>> {
+        if !self.is_opening() {
+            return None;
         }
+        let moves = dawg.openings.as_ref()?.lookup(letters, n)?;
+        Some(moves.into_iter().map(|m| m.to_best_word(self)).collect())
     }
 
-    /// GADDAG-based replacement for `best_words_from_patterns`: generate every
-    /// legal play (already scored, no duplicates), keep the top `n`. `dawg`
-    /// supplies cross-word checks; `gaddag` drives the traversal.
-    fn gaddag_best_words(
-        &self,
-        dawg: &Dawg,
-        gaddag: &Dawg,
-        letters: &str,
+    /// Rust half of `get_best_word`.
+    fn best_word(&mut self, dawg: &DawgPy, letters: &str, parallel: bool, prune: bool) -> BestWord {
+        self.best_words(dawg, letters, 1, parallel, prune)
+            .into_iter()
+            .next()
+            .unwrap_or_else(|| (String::new(), 0, (0, 0, true), Vec::new()))
+    }
+
+    /// Rust half of `get_best_words_many`; same per-rack dispatch as
+    /// `get_best_words` (opening / GADDAG / legacy patterns).
+    fn best_words_many(
+        &mut self,
+        dawg: &DawgPy,
+        racks: &[String],
         n: usize,
         parallel: bool,
-    ) -> Vec<BestWord> {
-        let mut best = self.gaddag_generate(dawg, gaddag, letters, parallel, true);
-        best.sort_by_key(|m| std::cmp::Reverse(m.4));
-        best.truncate(n);
-        best.into_iter()
-            .map(|(r, c, horizontal, word, score)| {
-                let used = self.hand_tiles_for_word(&word, r, c, horizontal, letters);
-                (word, score, (r, c, horizontal), used)
-            })
-            .collect()
+        prune: bool,
+    ) -> Vec<Vec<BestWord>> {
+        let across_racks = parallel && racks.len() > 1;
+        let inner_parallel = parallel && !across_racks;
+        if dawg.gaddag.is_some() {
+            self.refresh_gen_cache(&dawg.inner);
+        }
+        let this = &*self;
+        let hash = self.hash;
+        let one = |letters: &String| -> Vec<BestWord> {
+            let key = (hash, rack_counts(letters));
+            if let Some(moves) = dawg.move_cache().get(&key, n) {
+                return moves;
+            }
+            let moves = if let Some(moves) = this.book_openings(dawg, letters, n) {
+                moves
+            } else {
+                match (&dawg.gaddag, &this.gen_cache) {
+                    (Some(gaddag), Some(cache)) => {
+                        this.gaddag_best_words_with(&cache.setup, gaddag, letters, n, inner_parallel, prune)
+                    }
+                    _ if this.first => this.best_opening_words(dawg, letters, n),
+                    _ => this.best_words_from_patterns(dawg, letters, n, inner_parallel),
+                }
+            };
+            dawg.move_cache().insert(key, n, &moves);
+            moves
+        };
+        if across_racks {
+            gen_pool().install(|| racks.par_iter().map(one).collect())
+        } else {
+            racks.iter().map(one).collect()
+        }
+    }
+
+    /// Rust half of `get_score_stats`: every legal play for `letters` is
+    /// generated but only its score is kept, so nothing is materialised
+    /// beyond the histogram. Without a GADDAG the legacy pattern search only
+    /// yields the best play per placement pattern, so that is all it counts.
+    fn score_stats(&mut self, dawg: &DawgPy, letters: &str, parallel: bool) -> ScoreStats {
+        let mut stats = ScoreStats::default();
+        if let Some(gaddag) = &dawg.gaddag {
+            self.refresh_gen_cache(&dawg.inner);
+            let setup = &self.gen_cache.as_ref().expect("refreshed above").setup;
+            stats = self
+                .gaddag_sinks(setup, gaddag, letters, parallel, true, false, ScoreStats::default)
+                .into_iter()
+                .fold(stats, ScoreStats::merge);
+        } else if self.first {
+            for (_, score, _, _) in self.best_opening_words(dawg, letters, usize::MAX) {
+                stats.add(score);
+            }
+        } else {
+            for (_, score, _, _) in self.best_words_from_patterns(dawg, letters, usize::MAX, parallel) {
+                stats.add(score);
+            }
+        }
+        stats
     }
 }
 
@@ -2068,24 +4445,18 @@ fn compact(arena: &Arena, root: u32) -> (Arena, u32) {
     (new_arena, 0)
 }
 
+/// Serialize the arena into the flat, mmap-able file format (see `FlatLayout`).
 fn serialize(arena: &Arena, root: u32) -> Vec<u8> {
     let n = arena.nodes.len();
-    let mut buf: Vec<u8> = Vec::new();
-    buf.extend_from_slice(&root.to_le_bytes());
-    buf.extend_from_slice(&(n as u32).to_le_bytes());
+    let mut parts = FlatParts::with_capacity(root, n);
     for id in 0..n as u32 {
         let node = arena.node(id);
-        buf.push(node.is_terminal as u8);
         let mut children: Vec<(char, u32)> =
             node.children.iter().map(|(&c, &cid)| (c, cid)).collect();
         children.sort_unstable_by_key(|&(c, _)| c);
-        buf.extend_from_slice(&(children.len() as u32).to_le_bytes());
-        for (c, cid) in children {
-            buf.extend_from_slice(&(c as u32).to_le_bytes());
-            buf.extend_from_slice(&cid.to_le_bytes());
-        }
+        parts.push_node(node.is_terminal, children);
     }
-    buf
+    parts.finish().encode()
 }
 
 // ---------------------------------------------------------------------------
@@ -2098,8 +4469,10 @@ fn usage(prog: &str) {
                     {prog} build-gaddag  <words.txt>  <gaddag.bin>\n  \
                     {prog} lookup        <dawg.bin>   <word>\n  \
                     {prog} bench         <dawg.bin>   <words.txt>\n  \
+                    {prog} convert       <in.bin>     <out.bin>     [wide|packed]\n  \
                     {prog} gen-verify    <dawg.bin>   <gaddag.bin>  [games]\n  \
-                    {prog} gen-bench     <dawg.bin>   <gaddag.bin>  [games]"
+                    {prog} gen-bench     <dawg.bin>   <gaddag.bin>  [games]\n  \
+                    {prog} build-openings <dawg.bin>  <gaddag.bin>  <openings.bin>  [n]"
     );
 }
 
@@ -2196,6 +4569,37 @@ fn cmd_build_gaddag(words_path: &str, gaddag_path: &str) -> io::Result<()> {
     Ok(())
 }
 
+/// Rewrite a DAWG/GADDAG file (legacy or flat) into the flat, mmap-able
+/// format with the given edge encoding, without needing the source word list.
+fn cmd_convert(in_path: &str, out_path: &str, encoding: &str) -> io::Result<()> {
+    let input = fs::read(in_path)?;
+    let parts = if input.starts_with(FLAT_MAGIC) {
+        Dawg::from_bytes(input.clone())?.to_parts()
+    } else {
+        FlatParts::from_legacy(&input)?
+    };
+    let data = match encoding {
+        "wide" => parts.encode(),
+        "packed" => parts.encode_packed()?,
+        other => {
+            return Err(io::Error::new(
+                io::ErrorKind::InvalidInput,
+                format!("unknown edge encoding '{other}' (expected 'wide' or 'packed')"),
+            ))
+        }
+    };
+    {
+        let file = fs::File::create(out_path)?;
+        BufWriter::new(file).write_all(&data)?;
+    }
+    eprintln!(
+        "  {:.3} MiB → {:.3} MiB '{out_path}' ({encoding} edges)",
+        input.len() as f64 / (1 << 20) as f64,
+        data.len() as f64 / (1 << 20) as f64
+    );
+    Ok(())
+}
+
 fn cmd_lookup(dawg_path: &str, word: &str) -> io::Result<()> {
     let dawg = Dawg::load(dawg_path)?;
     let t0 = Instant::now();
@@ -2253,12 +4657,12 @@ fn selfplay_step(board: &mut Board, dpy: &DawgPy, rack: &mut String) -> bool {
     if rack.is_empty() {
         return false;
     }
-    let (word, _score, (r, c, horizontal), used) = board.get_best_word(dpy, rack, false);
-    if word.is_empty() {
+    let best = board.best_word(dpy, rack, false, true);
+    if best.0.is_empty() {
         return false;
     }
-    let _ = board.place_word(&word, r, c, horizontal);
-    for ch in used {
+    let _ = board.place_move(&best);
+    for &ch in &best.3 {
         if let Some(pos) = rack.char_indices().find(|&(_, x)| x == ch).map(|(i, _)| i) {
             rack.remove(pos);
         }
@@ -2271,9 +4675,16 @@ fn selfplay_step(board: &mut Board, dpy: &DawgPy, rack: &mut String) -> bool {
 fn cmd_gen_verify(dawg_path: &str, gaddag_path: &str, games: usize) -> io::Result<()> {
     let dawg = Dawg::load(dawg_path)?;
     let gaddag = Dawg::load(gaddag_path)?;
+    // A sibling opening book, if present, is checked against generation too.
+    let book = match sibling_path(dawg_path, "openings") {
+        Some(p) if std::path::Path::new(&p).exists() => Some(OpeningBook::load(&p, &dawg)?),
+        _ => None,
+    };
     let dpy = DawgPy {
         inner: dawg,
         gaddag: Some(gaddag),
+        openings: None,
+        move_cache: Mutex::new(MoveCache::new(0)),
     };
     let gad = dpy.gaddag.as_ref().unwrap();
 
@@ -2282,8 +4693,13 @@ fn cmd_gen_verify(dawg_path: &str, gaddag_path: &str, games: usize) -> io::Resul
     let mut score_mismatches = 0usize; // fast in-place score != calculate_word_points
     let mut limit_mismatches = 0usize; // limited moves != unlimited deduped
     let mut dup_found = 0usize; // duplicate placement survived the left-limit
+    let mut cache_mismatches = 0usize; // incrementally repaired setup/hash/features != fresh one
+    let mut topn_mismatches = 0usize; // bounded top-n != full sort truncated
+    let mut openings = 0usize;
+    let mut opening_mismatches = 0usize; // centre-anchor opening != legacy search
+    let mut book_checks = 0usize; // openings also looked up in the opening book
     for g in 0..games {
-        let mut board = Board::new().expect("new board");
+        let mut board = Board::new(None).expect("new board");
         let mut rack = String::new();
         for _ in 0..40 {
             // Draw first so the comparison sees the same rack the move uses.
@@ -2292,11 +4708,61 @@ fn cmd_gen_verify(dawg_path: &str, gaddag_path: &str, games: usize) -> io::Resul
             if rack.is_empty() {
                 break;
             }
-            if !board.first {
+            if board.first {
+                // The centre-anchor GADDAG opening must find exactly the plays
+                // (and blank use) of the legacy word-list search.
+                openings += 1;
+                let mut want: Vec<BestWord> = board.best_opening_words(&dpy, &rack, usize::MAX);
+                let mut got: Vec<BestWord> = board
+                    .gaddag_generate(&dpy.inner, gad, &rack, false, true)
+                    .iter()
+                    .map(|m| m.to_best_word(&board))
+                    .filter(|m| m.1 > 0)
+                    .collect();
+                if let Some((book, moves)) = book.as_ref().and_then(|b| Some((b, b.lookup(&rack, b.n)?))) {
+                    book_checks += 1;
+                    let setup = board.gen_setup(&dpy.inner);
+                    if moves != board.gaddag_top_moves(&setup, gad, &rack, book.n, false, true) {
+                        opening_mismatches += 1;
+                        eprintln!("OPENING BOOK MISMATCH game {g}\nrack: {rack}");
+                    }
+                }
+                want.sort();
+                got.sort();
+                if want != got {
+                    opening_mismatches += 1;
+                    if opening_mismatches <= 10 {
+                        eprintln!(
+                            "OPENING MISMATCH game {g}: legacy={} gaddag={}\nrack: {rack}",
+                            want.len(),
+                            got.len()
+                        );
+                    }
+                }
+            } else {
                 positions += 1;
+                // The cross-checks/anchors carried across place_word must equal
+                // a from-scratch computation for this position.
+                board.refresh_gen_cache(&dpy.inner);
+                let fresh = board.gen_setup(&dpy.inner);
+                if board.gen_cache.as_ref().is_some_and(|cache| cache.setup != fresh) {
+                    cache_mismatches += 1;
+                    if cache_mismatches <= 10 {
+                        eprintln!("CACHE MISMATCH game {g}\n{}", board.__str__());
+                    }
+                }
+                if board.hash != board.zobrist()
+                    || (board.open_premiums, board.filled) != board.count_features()
+                    || board.on_board != board.count_tiles()
+                {
+                    cache_mismatches += 1;
+                    if cache_mismatches <= 10 {
+                        eprintln!("HASH/FEATURE MISMATCH game {g}\n{}", board.__str__());
+                    }
+                }
                 // Production path: generate with the left-limit, already scored.
                 let limited = board.gaddag_generate(&dpy.inner, gad, &rack, false, true);
-                let gs = limited.iter().map(|m| m.4).max().unwrap_or(0);
+                let gs = limited.iter().map(|m| m.score).max().unwrap_or(0);
 
                 // Best-move parity vs the legacy pattern search.
                 let legacy = board.best_words_from_patterns(&dpy, &rack, 1, false);
@@ -2312,13 +4778,34 @@ fn cmd_gen_verify(dawg_path: &str, gaddag_path: &str, games: usize) -> io::Resul
                     }
                 }
 
-                // (a) The in-place fast score must equal calculate_word_points.
-                for (r, c, h, word, score) in &limited {
-                    let auth = board.calculate_word_points(word, *r, *c, *h, &rack).unwrap_or(0);
-                    if *score != auth {
+                // (a) The in-place fast score must equal calculate_word_points,
+                // and its blank allocation hand_tiles_for_word's.
+                for m in &limited {
+                    let (word, score, (r, c, h), used) = m.to_best_word(&board);
+                    let auth = board.calculate_word_points_inner(&word, r, c, h, &rack).unwrap_or(0);
+                    let auth_used = board.hand_tiles_for_word(&word, r, c, h, &rack);
+                    if score != auth || used != auth_used {
                         score_mismatches += 1;
                         if score_mismatches <= 10 {
-                            eprintln!("SCORE MISMATCH {word} @({r},{c},{h}): fast={score} auth={auth}");
+                            eprintln!(
+                                "SCORE MISMATCH {word} @({r},{c},{h}): fast={score} {used:?} auth={auth} {auth_used:?}"
+                            );
+                        }
+                    }
+                }
+
+                // The per-anchor bounded heaps must pick exactly the moves (and
+                // tie order) of a full stable sort of every generated move, with
+                // and without branch-and-bound pruning.
+                let mut sorted = limited.clone();
+                sorted.sort_by_key(|m| std::cmp::Reverse(m.score));
+                for (n, prune) in [(1, false), (1, true), (30, false), (30, true)] {
+                    let top = board.gaddag_best_words(&dpy.inner, gad, &rack, n, false, prune);
+                    let want = sorted.iter().take(n).map(|m| m.to_best_word(&board));
+                    if !top.iter().cloned().eq(want) {
+                        topn_mismatches += 1;
+                        if topn_mismatches <= 10 {
+                            eprintln!("TOP-N MISMATCH (n={n}, prune={prune}) game {g}\nrack: {rack}");
                         }
                     }
                 }
@@ -2327,20 +4814,20 @@ fn cmd_gen_verify(dawg_path: &str, gaddag_path: &str, games: usize) -> io::Resul
                 // set (which should already be duplicate-free) must equal the
                 // unlimited set after deduping.
                 let mut placements = std::collections::HashSet::new();
-                for (r, c, h, w, _) in &limited {
-                    if !placements.insert((w.clone(), *r, *c, *h)) {
+                for m in &limited {
+                    if !placements.insert(GenMove { score: 0, ..*m }) {
                         dup_found += 1;
                     }
                 }
                 let unlimited = board.gaddag_generate(&dpy.inner, gad, &rack, false, false);
                 let mut seen = std::collections::HashSet::new();
                 let mut unl_scores: Vec<u32> = Vec::new();
-                for (r, c, h, w, s) in &unlimited {
-                    if seen.insert((w.clone(), *r, *c, *h)) {
-                        unl_scores.push(*s);
+                for m in &unlimited {
+                    if seen.insert(GenMove { score: 0, ..*m }) {
+                        unl_scores.push(m.score);
                     }
                 }
-                let mut lim_scores: Vec<u32> = limited.iter().map(|m| m.4).collect();
+                let mut lim_scores: Vec<u32> = limited.iter().map(|m| m.score).collect();
                 lim_scores.sort_unstable();
                 unl_scores.sort_unstable();
                 if lim_scores != unl_scores {
@@ -2355,12 +4842,12 @@ fn cmd_gen_verify(dawg_path: &str, gaddag_path: &str, games: usize) -> io::Resul
                 }
             }
             // Advance the position with the (gaddag) best move.
-            let (word, _s, (r, c, h), used) = board.get_best_word(&dpy, &rack, false);
-            if word.is_empty() {
+            let best = board.best_word(&dpy, &rack, false, true);
+            if best.0.is_empty() {
                 break;
             }
-            let _ = board.place_word(&word, r, c, h);
-            for ch in used {
+            let _ = board.place_move(&best);
+            for &ch in &best.3 {
                 if let Some(p) = rack.char_indices().find(|&(_, x)| x == ch).map(|(i, _)| i) {
                     rack.remove(p);
                 }
@@ -2370,9 +4857,18 @@ fn cmd_gen_verify(dawg_path: &str, gaddag_path: &str, games: usize) -> io::Resul
     println!(
         "\ngen-verify: {positions} positions | best-score mismatches={mismatches} | \
          fast-score mismatches={score_mismatches} | limit mismatches={limit_mismatches} | \
-         duplicates past limit={dup_found}"
+         duplicates past limit={dup_found} | cache mismatches={cache_mismatches} | \
+         top-n mismatches={topn_mismatches} | opening mismatches={opening_mismatches}/{openings} \
+         ({book_checks} also in the opening book)"
     );
-    if mismatches + score_mismatches + limit_mismatches + dup_found > 0 {
+    let failures = mismatches
+        + score_mismatches
+        + limit_mismatches
+        + dup_found
+        + cache_mismatches
+        + topn_mismatches
+        + opening_mismatches;
+    if failures > 0 {
         std::process::exit(2);
     }
     Ok(())
@@ -2386,14 +4882,20 @@ fn cmd_gen_bench(dawg_path: &str, gaddag_path: &str, games: usize) -> io::Result
     let dpy = DawgPy {
         inner: dawg,
         gaddag: Some(gaddag),
+        openings: None,
+        move_cache: Mutex::new(MoveCache::new(0)),
     };
     let gad = dpy.gaddag.as_ref().unwrap();
 
     let mut positions = 0usize;
     let mut leg_secs = 0.0f64;
     let mut gad_secs = 0.0f64;
+    let mut pruned_secs = 0.0f64;
+    let mut openings = 0usize;
+    let mut open_leg_secs = 0.0f64;
+    let mut open_gad_secs = 0.0f64;
     for _ in 0..games {
-        let mut board = Board::new().expect("new board");
+        let mut board = Board::new(None).expect("new board");
         let mut rack = String::new();
         for _ in 0..40 {
             let drawn = board.give_letters(&rack);
@@ -2401,14 +4903,29 @@ fn cmd_gen_bench(dawg_path: &str, gaddag_path: &str, games: usize) -> io::Result
             if rack.is_empty() {
                 break;
             }
-            if !board.first {
+            if board.first {
+                std::hint::black_box(board.best_opening_words(&dpy, &rack, 1)); // warm-up
+                let t = Instant::now();
+                std::hint::black_box(board.best_opening_words(&dpy, &rack, 1));
+                open_leg_secs += t.elapsed().as_secs_f64();
+                let t = Instant::now();
+                std::hint::black_box(board.gaddag_best_words(&dpy.inner, gad, &rack, 1, false, true));
+                open_gad_secs += t.elapsed().as_secs_f64();
+                openings += 1;
+            } else {
                 let t = Instant::now();
                 let leg = std::hint::black_box(board.best_words_from_patterns(&dpy, &rack, 1, false));
                 leg_secs += t.elapsed().as_secs_f64();
+                // Untimed warm-up: whichever GADDAG run goes first pays for the
+                // cold cache, which would otherwise swamp the pruning delta.
+                std::hint::black_box(board.gaddag_best_words(&dpy.inner, gad, &rack, 1, false, false));
                 let t = Instant::now();
-                let g = std::hint::black_box(board.gaddag_best_words(&dpy.inner, gad, &rack, 1, false));
+                let g = std::hint::black_box(board.gaddag_best_words(&dpy.inner, gad, &rack, 1, false, false));
                 gad_secs += t.elapsed().as_secs_f64();
-                let _ = (leg, g);
+                let t = Instant::now();
+                let p = std::hint::black_box(board.gaddag_best_words(&dpy.inner, gad, &rack, 1, false, true));
+                pruned_secs += t.elapsed().as_secs_f64();
+                let _ = (leg, g, p);
                 positions += 1;
             }
             if !selfplay_step(&mut board, &dpy, &mut rack) {
@@ -2423,6 +4940,35 @@ fn cmd_gen_bench(dawg_path: &str, gaddag_path: &str, games: usize) -> io::Result
     println!("  legacy pattern search : {leg_ms:.3} ms/position");
     println!("  gaddag generation     : {gad_ms:.3} ms/position");
     println!("  speedup               : {:.2}x", leg_secs / gad_secs.max(1e-12));
+    println!("  gaddag + pruning      : {:.3} ms/position", 1e3 * pruned_secs / positions.max(1) as f64);
+    println!("  pruning speedup       : {:.2}x", gad_secs / pruned_secs.max(1e-12));
+    println!("  openings ({openings}):");
+    println!("    legacy word search  : {:.3} ms/position", 1e3 * open_leg_secs / openings.max(1) as f64);
+    println!("    gaddag from centre  : {:.3} ms/position", 1e3 * open_gad_secs / openings.max(1) as f64);
+    println!("    speedup             : {:.2}x", open_leg_secs / open_gad_secs.max(1e-12));
+    Ok(())
+}
+
+/// Precompute the opening book for `dawg_path`'s lexicon: the top `n`
+/// openings of every full, blank-free rack (see `OpeningBook`).
+fn cmd_build_openings(dawg_path: &str, gaddag_path: &str, book_path: &str, n: usize) -> io::Result<()> {
+    if n == 0 {
+        return Err(io::Error::new(io::ErrorKind::InvalidInput, "n must be at least 1"));
+    }
+    let dawg = Dawg::load(dawg_path)?;
+    let gaddag = Dawg::load(gaddag_path)?;
+    eprintln!("Generating the top {n} openings of {} racks…", rack_index().len());
+    let t0 = Instant::now();
+    let data = build_opening_book(&dawg, &gaddag, n);
+    eprintln!("  done in {:.2?}", t0.elapsed());
+    {
+        let file = fs::File::create(book_path)?;
+        BufWriter::new(file).write_all(&data)?;
+    }
+    eprintln!(
+        "  {:.3} MiB → '{book_path}'",
+        data.len() as f64 / (1 << 20) as f64
+    );
     Ok(())
 }
 
@@ -2433,6 +4979,10 @@ pub fn main_cli() -> io::Result<()> {
         Some("build-gaddag") if args.len() == 4 => cmd_build_gaddag(&args[2], &args[3]),
         Some("lookup") if args.len() == 4 => cmd_lookup(&args[2], &args[3]),
         Some("bench") if args.len() == 4 => cmd_bench(&args[2], &args[3]),
+        Some("convert") if args.len() == 4 || args.len() == 5 => {
+            let encoding = args.get(4).map_or("wide", String::as_str);
+            cmd_convert(&args[2], &args[3], encoding)
+        }
         Some("gen-verify") if args.len() == 4 || args.len() == 5 => {
             let games = args.get(4).and_then(|s| s.parse().ok()).unwrap_or(200);
             cmd_gen_verify(&args[2], &args[3], games)
@@ -2441,6 +4991,10 @@ pub fn main_cli() -> io::Result<()> {
             let games = args.get(4).and_then(|s| s.parse().ok()).unwrap_or(200);
             cmd_gen_bench(&args[2], &args[3], games)
         }
+        Some("build-openings") if args.len() == 5 || args.len() == 6 => {
+            let n = args.get(5).and_then(|s| s.parse().ok()).unwrap_or(1);
+            cmd_build_openings(&args[2], &args[3], &args[4], n)
+        }
         _ => {
             usage(&args[0]);
             std::process::exit(1);
@@ -2448,6 +5002,161 @@ pub fn main_cli() -> io::Result<()> {
     }
 }
 
+// ---------------------------------------------------------------------------
+// Native self-play: whole games for the built-in policies
+// ---------------------------------------------------------------------------
+
+/// Turn cap per game, like web/game.py's `MAX_BENCHMARK_GAME_MOVES`: real
+/// games end long before it; it only stops an endless exchange loop.
+const MAX_GAME_TURNS: usize = 200;
+
+const VOWELS: &str = "aąeęioóuy";
+const CONSONANTS: &str = "bcćdfghjklłmnńprsśtwzżź";
+
+/// How a built-in player picks its move (src/strategy.py).
+#[derive(Clone, Copy, PartialEq, Eq, Debug)]
+enum Policy {
+    /// `SimplePlayer`: the best-scoring word; exchanges only without one.
+    Greedy,
+    /// `StrategicPlayer`: the best-scoring word, but exchanges whenever it
+    /// scores under 6 and the bag allows it.
+    Strategic,
+}
+
+impl Policy {
+    fn parse(name: &str) -> PyResult<Self> {
+        match name {
+            "greedy" => Ok(Policy::Greedy),
+            "strategic" => Ok(Policy::Strategic),
+            _ => Err(pyo3::exceptions::PyValueError::new_err(format!(
+                "unknown policy '{name}' (expected 'greedy' or 'strategic')"
+            ))),
+        }
+    }
+}
+
+/// One finished game: `(score_1, score_2, player_1_opened, moves)`, where
+/// `moves[t]` is what turn `t` did -- the word played, `""` for no action,
+/// `None` for an exchange (`play_word`'s return convention). Turns alternate
+/// starting with the opener.
+type GameResult = (i32, i32, bool, Vec<Option<String>>);
+
+/// The tiles a built-in player trades in: the lowest-valued three of the
+/// majority kind when vowels or consonants are short, else all but its best
+/// vowel and two best consonants (`get_letters_to_exchange`).
+fn letters_to_exchange(rack: &str) -> String {
+    let by_points = |set: &str| {
+        let mut kept: Vec<char> = rack.chars().filter(|&c| set.contains(c)).collect();
+        kept.sort_by_key(|&c| letter_points(c));
+        kept
+    };
+    let (vowels, consonants) = (by_points(VOWELS), by_points(CONSONANTS));
+    if vowels.len() < 3 {
+        consonants.iter().take(3).collect()
+    } else if consonants.len() < 3 {
+        vowels.iter().take(3).collect()
+    } else {
+        let (v, c) = (vowels.len(), consonants.len());
+        vowels[..v - 1]
+            .iter()
+            .rev()
+            .chain(consonants[..c - 2].iter().rev())
+            .collect()
+    }
+}
+
+/// One turn of `policy` for the player holding `rack`: play the best word
+/// (scoring it and refilling the rack) or exchange. Returns the move as in
+/// `GameResult`.
+fn play_turn(
+    board: &mut Board,
+    dpy: &DawgPy,
+    policy: Policy,
+    rack: &mut String,
+    score: &mut i32,
+) -> Option<String> {
+    // Straight to generation: self-play positions never repeat, so the
+    // shared move cache would only add lock traffic.
+    let best = board
+        .generate_best_words(dpy, rack, 1, false, true)
+        .into_iter()
+        .next();
+    let weak = match (&best, policy) {
+        (None, _) => true,
+        (Some(_), Policy::Greedy) => false,
+        (Some(best), Policy::Strategic) => best.1 < 6,
+    };
+    if weak && board.can_exchange() {
+        *rack = board.exchange_letters(rack, &letters_to_exchange(rack));
+        return None;
+    }
+    let Some(best) = best else {
+        return Some(String::new());
+    };
+    *score += best.1 as i32;
+    board
+        .place_move(&best)
+        .expect("generated moves fit the board");
+    for &ch in &best.3 {
+        let tile = if rack.contains(ch) { ch } else { '?' };
+        if let Some(pos) = rack.find(tile) {
+            rack.remove(pos);
+        }
+    }
+    let drawn = board.give_letters(rack);
+    rack.push_str(&drawn);
+    Some(best.0)
+}
+
+/// Play one game between `policies[0]` (player 1) and `policies[1]`, with
+/// every draw and the opener taken from `seed`. Racks are dealt player 1
+/// first, then the opener is picked, like src/main.py's `graj`; the game ends
+/// when a player goes out or after `no_play_limit` consecutive no-action
+/// turns (no legal word and no exchange).
+fn play_game(dpy: &DawgPy, policies: [Policy; 2], seed: u64, no_play_limit: u32) -> GameResult {
+    let mut board = Board::new(Some(seed)).expect("new board");
+    let mut racks = [String::new(), String::new()];
+    for rack in &mut racks {
+        *rack = board.give_letters("");
+    }
+    let mut scores = [0i32; 2];
+    let p1_opened = mix_seed(seed) & 1 == 0;
+    let order = if p1_opened { [0, 1] } else { [1, 0] };
+
+    let mut moves = Vec::new();
+    let mut no_play_streak = 0;
+    let mut went_out = None;
+    while moves.len() < MAX_GAME_TURNS {
+        let p = order[moves.len() % 2];
+        let mv = play_turn(&mut board, dpy, policies[p], &mut racks[p], &mut scores[p]);
+        let ended = match mv.as_deref() {
+            Some("") => {
+                no_play_streak += 1;
+                no_play_streak >= no_play_limit
+            }
+            Some(_) => {
+                no_play_streak = 0;
+                racks[p].is_empty()
+            }
+            None => false, // an exchange never counts toward the streak
+        };
+        moves.push(mv);
+        if ended {
+            went_out = racks[p].is_empty().then_some(p);
+            break;
+        }
+    }
+
+    let values = racks.each_ref().map(|rack| Board::rack_value(rack) as i32);
+    for p in 0..2 {
+        match went_out {
+            Some(out) if out == p => scores[p] += values[1 - p],
+            _ => scores[p] -= values[p],
+        }
+    }
+    (scores[0], scores[1], p1_opened, moves)
+}
+
 // ---------------------------------------------------------------------------
 // Python module
 // ---------------------------------------------------------------------------
@@ -2479,12 +5188,61 @@ fn num_threads() -> usize {
     gen_pool().current_num_threads()
 }
 
+/// Play `n` whole games in the engine between two built-in policies --
+/// `policy` for player 1, `opponent` (default: the same) for player 2 -- and
+/// return one `GameResult` per game, in order. Game `i` draws from
+/// `seed + i`, so a seeded run is reproducible whatever the thread count;
+/// without a seed it is clock-seeded. A game ends when a player goes out or
+/// after `no_play_limit` consecutive no-action turns (2 is the rule of
+/// `smart_player/simulate.py` and the web game; `graj` allows 4). With
+/// `parallel`, games run concurrently on the move-generation pool, each
+/// single-threaded. The GIL is released throughout.
+#[pyfunction]
+#[pyo3(signature = (dawg, n, policy="greedy", seed=None, opponent=None, parallel=true, no_play_limit=2))]
+fn play_games(
+    py: Python<'_>,
+    dawg: &DawgPy,
+    n: usize,
+    policy: &str,
+    seed: Option<u64>,
+    opponent: Option<&str>,
+    parallel: bool,
+    no_play_limit: u32,
+) -> PyResult<Vec<GameResult>> {
+    if no_play_limit == 0 {
+        return Err(pyo3::exceptions::PyValueError::new_err(
+            "no_play_limit must be >= 1",
+        ));
+    }
+    let policies = [
+        Policy::parse(policy)?,
+        Policy::parse(opponent.unwrap_or(policy))?,
+    ];
+    let base = seed.unwrap_or_else(|| draw_seed(n));
+    let game = |i: usize| {
+        let seed = mix_seed(base.wrapping_add(i as u64));
+        play_game(dawg, policies, seed, no_play_limit)
+    };
+    Ok(py.detach(|| {
+        if parallel {
+            gen_pool().install(|| (0..n).into_par_iter().map(game).collect())
+        } else {
+            (0..n).map(game).collect()
+        }
+    }))
+}
+
 #[pymodule]
 fn scrablozaur(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<DawgPy>()?;
     m.add_class::<Board>()?;
+    m.add_class::<LeaveModel>()?;
+    m.add("ALPHABET", POLISH_ALPHABET)?;
+    m.add("EMPTY_CELL", EMPTY)?;
+    m.add("UNKNOWN_CELL", UNKNOWN_TILE)?;
     m.add_function(pyo3::wrap_pyfunction!(set_num_threads, m)?)?;
     m.add_function(pyo3::wrap_pyfunction!(num_threads, m)?)?;
+    m.add_function(pyo3::wrap_pyfunction!(play_games, m)?)?;
     Ok(())
 }
 
@@ -2516,6 +5274,10 @@ mod gaddag_tests {
         compile(&refs)
     }
 
+    fn cells(word: &str) -> Vec<Cell> {
+        word.chars().map(|c| tile_cell(c).unwrap()).collect()
+    }
+
     /// Every word in the lexicon must be reconstructible from every one of its
     /// letters (anchors), following the reversed-prefix / SEP / suffix path.
     #[test]
@@ -2550,18 +5312,176 @@ mod gaddag_tests {
         assert!(n.is_none() || !g.node_is_terminal(g.find_child(n.unwrap(), SEP).unwrap_or(g.root)));
     }
 
+    /// The legacy per-node file format, as `build` wrote it before the flat one.
+    fn serialize_legacy(arena: &Arena, root: u32) -> Vec<u8> {
+        let n = arena.nodes.len();
+        let mut buf: Vec<u8> = Vec::new();
+        buf.extend_from_slice(&root.to_le_bytes());
+        buf.extend_from_slice(&(n as u32).to_le_bytes());
+        for id in 0..n as u32 {
+            let node = arena.node(id);
+            buf.push(node.is_terminal as u8);
+            let mut children: Vec<(char, u32)> =
+                node.children.iter().map(|(&c, &cid)| (c, cid)).collect();
+            children.sort_unstable_by_key(|&(c, _)| c);
+            buf.extend_from_slice(&(children.len() as u32).to_le_bytes());
+            for (c, cid) in children {
+                buf.extend_from_slice(&(c as u32).to_le_bytes());
+                buf.extend_from_slice(&cid.to_le_bytes());
+            }
+        }
+        buf
+    }
+
+    /// A legacy file, its flat conversion, and the flat file mapped from disk
+    /// all answer lookups identically.
+    #[test]
+    fn flat_format_matches_legacy_and_maps_from_disk() {
+        let words = ["al", "ala", "kot", "kota", "żółw"];
+        let (arena, root, _) = build_dawg(&words);
+        let (arena, root) = compact(&arena, root);
+        let legacy = Dawg::from_bytes(serialize_legacy(&arena, root)).unwrap();
+        let flat_bytes = serialize(&arena, root);
+        assert!(flat_bytes.starts_with(FLAT_MAGIC));
+        assert_eq!(FlatParts::from_legacy(&serialize_legacy(&arena, root)).unwrap().encode(), flat_bytes);
+
+        let path = std::env::temp_dir().join(format!("scrablozaur-flat-{}.bin", std::process::id()));
+        fs::write(&path, &flat_bytes).unwrap();
+        let mapped = Dawg::load(path.to_str().unwrap()).unwrap();
+        fs::remove_file(&path).unwrap();
+        assert!(mapped.is_mapped());
+        assert!(!legacy.is_mapped());
+
+        for g in [&legacy, &mapped] {
+            assert_eq!(g.node_count(), arena.nodes.len());
+            for w in words {
+                assert!(g.contains(w), "{w} missing");
+            }
+            for w in ["a", "ko", "kotak", "żół"] {
+                assert!(!g.contains(w), "{w} should be absent");
+            }
+        }
+
+        // A truncated flat file is rejected up front, not at lookup time.
+        let truncated = flat_bytes[..flat_bytes.len() - 1].to_vec();
+        assert!(Dawg::from_bytes(truncated).is_err());
+    }
+
+    /// Batched generation returns, rack for rack, exactly what one
+    /// `get_best_words` call per rack does — serially and across the pool.
+    #[test]
+    fn best_words_many_matches_per_rack() {
+        let words = ["kot", "koty", "ty", "oto", "tok", "kto", "oko"];
+        let dpy = DawgPy {
+            inner: compile(&words),
+            gaddag: Some(compile_gaddag(&words)),
+            openings: None,
+            move_cache: Mutex::new(MoveCache::new(0)),
+        };
+        let mut board = Board::new(None).unwrap();
+        board.place_word("kot", 7, 7, true, Vec::new()).unwrap();
+        board.first = false;
+        let racks: Vec<String> = ["y", "ok?", "tko", "", "zzz"].iter().map(|r| r.to_string()).collect();
+        let expected: Vec<Vec<BestWord>> = racks
+            .iter()
+            .map(|r| board.best_words(&dpy, r, 4, false, true))
+            .collect();
+        assert!(expected.iter().any(|moves| !moves.is_empty()));
+        assert_eq!(board.best_words_many(&dpy, &racks, 4, false, true), expected);
+        assert_eq!(board.best_words_many(&dpy, &racks, 4, true, true), expected);
+    }
+
+    /// Anchor-level pruning never changes the best move, even when anchors
+    /// are visited out of order and several tie for the top score.
+    #[test]
+    fn pruning_keeps_best_word() {
+        let words = ["kot", "koty", "ty", "oto", "tok", "kto", "oko", "okot", "to", "ok"];
+        let (dawg, gaddag) = (compile(&words), compile_gaddag(&words));
+        let mut board = Board::new(None).unwrap();
+        board.place_word("kot", 7, 7, true, Vec::new()).unwrap();
+        board.place_word("kot", 6, 8, false, Vec::new()).unwrap();
+        board.first = false;
+        for rack in ["y", "ok?", "tko", "", "zzz", "ttoooky"] {
+            for parallel in [false, true] {
+                let want = board.gaddag_best_words(&dawg, &gaddag, rack, 1, parallel, false);
+                let got = board.gaddag_best_words(&dawg, &gaddag, rack, 1, parallel, true);
+                assert_eq!(got, want, "rack {rack:?}");
+            }
+        }
+    }
+
+    /// The cross-check/anchor cache repaired across `place_word` always
+    /// equals a from-scratch `gen_setup`, including for crossing, extending
+    /// and edge-of-board placements.
+    #[test]
+    fn gen_cache_tracks_place_word() {
+        let dawg = compile(&["kot", "koty", "ty", "oto", "tok", "kto", "oko", "okot"]);
+        let mut board = Board::new(None).unwrap();
+        board.place_word("kot", 7, 7, true, Vec::new()).unwrap();
+        board.refresh_gen_cache(&dawg);
+        for (word, r, c, h) in [
+            ("kot", 6, 8, false),
+            ("y", 7, 10, true),
+            ("ty", 9, 8, true),
+            ("oto", 0, 0, true),
+            ("kto", 0, 14, false),
+            ("o", 7, 6, true),
+        ] {
+            board.place_word(word, r, c, h, Vec::new()).unwrap();
+            board.refresh_gen_cache(&dawg);
+            let fresh = board.gen_setup(&dawg);
+            assert!(board.gen_cache.as_ref().unwrap().setup == fresh, "after {word}");
+        }
+
+        // A different DAWG invalidates the cache rather than reusing it.
+        let other = compile(&["kot"]);
+        board.refresh_gen_cache(&other);
+        assert_eq!(board.gen_cache.as_ref().unwrap().dawg_id, other.id);
+        assert!(board.gen_cache.as_ref().unwrap().setup == board.gen_setup(&other));
+    }
+
+    /// A packed GADDAG answers every lookup and edge walk exactly like the
+    /// wide one, and drives identical move generation.
+    #[test]
+    fn packed_edges_match_wide() {
+        let words = ["kot", "koty", "ty", "oto", "żółw", "źle"];
+        let wide = compile_gaddag(&words);
+        let packed = Dawg::from_bytes(wide.to_parts().encode_packed().unwrap()).unwrap();
+        assert!(packed.is_compact() && !wide.is_compact());
+        assert!(packed.layout.total < wide.layout.total);
+        for id in 0..wide.node_count() as u32 {
+            assert_eq!(wide.node_is_terminal(id), packed.node_is_terminal(id));
+            let a: Vec<(char, u32, u32)> = wide.node_children(id).map(|e| (e.ch, e.bit, e.id)).collect();
+            let b: Vec<(char, u32, u32)> = packed.node_children(id).map(|e| (e.ch, e.bit, e.id)).collect();
+            assert_eq!(a, b, "node {id}");
+            for &(c, _, child) in &a {
+                assert_eq!(packed.find_child(id, c), Some(child));
+            }
+        }
+
+        let dawg = compile(&words);
+        let mut board = Board::new(None).unwrap();
+        board.place_word("kot", 7, 7, true, Vec::new()).unwrap();
+        let mut a = board.gaddag_generate(&dawg, &wide, "yo?", false, true);
+        let mut b = board.gaddag_generate(&dawg, &packed, "yo?", false, true);
+        a.sort();
+        b.sort();
+        assert!(!a.is_empty());
+        assert_eq!(a, b);
+    }
+
     /// cross_bits sets exactly the letters that complete a valid cross-word.
     #[test]
     fn cross_bits_matches_dictionary() {
         // Dictionary where only some completions of "k_t" / "_t" are words.
         let dawg = compile(&["kot", "kit", "at", "ot", "ma"]);
         // prefix "k", suffix "t": allowed middles are o (kot) and i (kit).
-        let bits = cross_bits(&dawg, &['k'], &['t']);
+        let bits = cross_bits(&dawg, &cells("k"), &cells("t"));
         assert_ne!(bits & letter_bit('o'), 0);
         assert_ne!(bits & letter_bit('i'), 0);
         assert_eq!(bits & letter_bit('a'), 0, "kat is not in the lexicon");
         // prefix empty, suffix "t": allowed leaders are a (at) and o (ot).
-        let bits = cross_bits(&dawg, &[], &['t']);
+        let bits = cross_bits(&dawg, &[], &cells("t"));
         assert_ne!(bits & letter_bit('a'), 0);
         assert_ne!(bits & letter_bit('o'), 0);
         assert_eq!(bits & letter_bit('k'), 0);
@@ -2573,12 +5493,12 @@ mod gaddag_tests {
     fn generator_finds_hook_and_uses_blank() {
         let dawg = compile(&["kot", "koty", "ty", "oto"]);
         let gaddag = compile_gaddag(&["kot", "koty", "ty", "oto"]);
-        let mut board = Board::new().unwrap();
-        board.place_word("kot", 7, 7, true).unwrap();
+        let mut board = Board::new(None).unwrap();
+        board.place_word("kot", 7, 7, true, Vec::new()).unwrap();
         board.first = false;
 
         // With a 'y' in hand, "koty" (hooking 'y' after "kot") must be found.
-        let moves = board.gaddag_best_words(&dawg, &gaddag, "y", 5, false);
+        let moves = board.gaddag_best_words(&dawg, &gaddag, "y", 5, false, true);
         assert!(
             moves.iter().any(|(w, ..)| w == "koty"),
             "expected 'koty' hook, got {:?}",
@@ -2586,11 +5506,466 @@ mod gaddag_tests {
         );
 
         // With only a blank, the same hook must still be found (blank = y).
-        let moves_blank = board.gaddag_best_words(&dawg, &gaddag, "?", 5, false);
+        let moves_blank = board.gaddag_best_words(&dawg, &gaddag, "?", 5, false, true);
         assert!(
             moves_blank.iter().any(|(w, ..)| w == "koty"),
             "expected 'koty' via blank, got {:?}",
             moves_blank.iter().map(|m| &m.0).collect::<Vec<_>>()
         );
     }
+
+    /// A tile placed as a blank keeps its letter for the lexicon but scores 0
+    /// in every later word, in both the generator and `calculate_word_points`.
+    #[test]
+    fn blank_tiles_on_board_score_zero() {
+        let dawg = compile(&["kot", "koty"]);
+        let gaddag = compile_gaddag(&["kot", "koty"]);
+        let mut board = Board::new(None).unwrap();
+        board.place_word("kot", 7, 7, true, vec![0]).unwrap();
+        assert_eq!(board.char_at(7, 7), 'k');
+        assert_eq!(board.tile_points(7, 7), 0);
+        assert_eq!(board.tile_points(7, 8), 1);
+        // Running through the blank leaves it a blank.
+        board.place_word("koty", 7, 7, true, Vec::new()).unwrap();
+        assert_eq!(board.tile_points(7, 7), 0);
+
+        let mut board = Board::new(None).unwrap();
+        board.place_word("kot", 7, 7, true, vec![0]).unwrap();
+        // o + t + y: 1 + 2 + 2, and (7, 10) is a plain square.
+        let want = board.calculate_word_points_inner("koty", 7, 7, true, "y").unwrap();
+        assert_eq!(want, 5);
+        let moves = board.gaddag_best_words(&dawg, &gaddag, "y", 1, false, true);
+        assert_eq!(moves[0].0, "koty");
+        assert_eq!(moves[0].1, want);
+    }
+
+    /// `score_stats` counts exactly the plays `gaddag_generate` produces,
+    /// score for score, serially and in parallel.
+    #[test]
+    fn score_stats_match_generated_moves() {
+        let words = ["kot", "koty", "ty", "oto", "tok", "kto", "oko", "okot", "to", "ok"];
+        let dpy = DawgPy {
+            inner: compile(&words),
+            gaddag: Some(compile_gaddag(&words)),
+            openings: None,
+            move_cache: Mutex::new(MoveCache::new(0)),
+        };
+        let mut board = Board::new(None).unwrap();
+        board.place_word("kot", 7, 7, true, Vec::new()).unwrap();
+        board.place_word("kot", 6, 8, false, Vec::new()).unwrap();
+        board.first = false;
+        for rack in ["y", "ok?", "tko", "", "ttoooky"] {
+            let mut want = ScoreStats::default();
+            let gaddag = dpy.gaddag.as_ref().unwrap();
+            for mv in board.gaddag_generate(&dpy.inner, gaddag, rack, false, true) {
+                want.add(mv.score);
+            }
+            let want = want.summary();
+            for parallel in [false, true] {
+                assert_eq!(board.score_stats(&dpy, rack, parallel).summary(), want, "rack {rack:?}");
+            }
+            if rack.is_empty() {
+                assert_eq!(want, (0, 0, 0, Vec::new()));
+            } else {
+                assert!(want.0 > 0 && want.2 <= want.1, "rack {rack:?}");
+            }
+        }
+    }
+
+    /// With a GADDAG the opening is generated from the centre anchor; it must
+    /// find exactly the plays of the word-list search, blanks included, and
+    /// the cached setup must not outlive the opening.
+    #[test]
+    fn opening_from_centre_matches_word_search() {
+        let words = ["kot", "koty", "ty", "oto", "tok", "kto", "oko", "okot", "to", "ok"];
+        let dpy = DawgPy {
+            inner: compile(&words),
+            gaddag: Some(compile_gaddag(&words)),
+            openings: None,
+            move_cache: Mutex::new(MoveCache::new(0)),
+        };
+        let mut board = Board::new(None).unwrap();
+        for rack in ["kot", "ok?", "ttoooky", "y", ""] {
+            let mut want = board.best_opening_words(&dpy, rack, usize::MAX);
+            let mut got = board.best_words(&dpy, rack, usize::MAX, false, false);
+            // Split across tasks by the centre letter, in the same order.
+            assert_eq!(board.best_words(&dpy, rack, usize::MAX, true, false), got);
+            assert_eq!(
+                board.score_stats(&dpy, rack, true).summary(),
+                board.score_stats(&dpy, rack, false).summary()
+            );
+            assert!(got.iter().all(|m| m.2 .0 == CENTER && m.2 .2), "rack {rack:?}");
+            got.retain(|m| m.1 > 0);
+            want.sort();
+            got.sort();
+            assert_eq!(got, want, "rack {rack:?}");
+            let best = board.best_opening_words(&dpy, rack, 1).first().map(|m| m.1);
+            assert_eq!(board.best_words(&dpy, rack, 1, true, true).first().map(|m| m.1), best);
+        }
+        board.place_word("kot", CENTER, CENTER, true, Vec::new()).unwrap();
+        board.refresh_gen_cache(&dpy.inner);
+        assert!(board.gen_cache.as_ref().unwrap().setup == board.gen_setup(&dpy.inner));
+        assert!(!board.gen_cache.as_ref().unwrap().setup.opening);
+    }
+
+    /// Racks rank densely and round-trip; blanks, short racks and more
+    /// copies of a letter than the bag holds have no rank.
+    #[test]
+    fn rack_index_round_trips() {
+        let index = rack_index();
+        assert_eq!(index.len(), 9_112_709);
+        for rank in [0, 1, 4095, 4_000_000, index.len() - 1] {
+            let letters = index.letters(rank);
+            assert_eq!(letters.chars().count(), RACK_SIZE);
+            assert_eq!(index.rank(&rack_counts(&letters)), Some(rank), "{letters}");
+        }
+        assert_eq!(index.rank(&rack_counts("aaaaaaa")), Some(index.len() - 1));
+        for letters in ["kot?kot", "kotkot", "ąąkotek", "kotkotek"] {
+            assert_eq!(index.rank(&rack_counts(letters)), None, "{letters}");
+        }
+    }
+
+    /// A book answers the opening with the moves it stores, which are what
+    /// generation finds, and only for racks and `n` it covers.
+    #[test]
+    fn opening_book_serves_openings() {
+        let words = ["kot", "koty", "kotek", "tok", "okot", "to", "ok", "eko"];
+        let (dawg, gaddag) = (compile(&words), compile_gaddag(&words));
+        let mut board = Board::new(None).unwrap();
+        let setup = board.gen_setup(&dawg);
+        let racks = ["kotekyz", "ttoookk", "abcdefg"];
+
+        let mut data = OpeningBook::header(1, &dawg);
+        data.resize(BOOK_HEADER_LEN + 8 * rack_index().len(), 0);
+        for letters in racks {
+            let rank = rack_index().rank(&rack_counts(letters)).unwrap();
+            if let Some(mv) = board.gaddag_top_moves(&setup, &gaddag, letters, 1, false, true).first() {
+                let at = BOOK_HEADER_LEN + 8 * rank;
+                data[at..at + 8].copy_from_slice(&OpeningBook::pack(mv).to_le_bytes());
+            }
+        }
+        let book = OpeningBook::from_backing(Backing::heap(&data), &dawg).unwrap();
+        assert!(OpeningBook::from_backing(Backing::heap(&data), &gaddag).is_err());
+        let dpy = DawgPy {
+            inner: dawg,
+            gaddag: Some(gaddag),
+            openings: Some(book),
+            move_cache: Mutex::new(MoveCache::new(0)),
+        };
+        for letters in racks {
+            let want = {
+                let gaddag = dpy.gaddag.as_ref().unwrap();
+                board.gaddag_best_words_with(&setup, gaddag, letters, 1, false, true)
+            };
+            assert_eq!(board.book_openings(&dpy, letters, 1), Some(want.clone()), "{letters}");
+            assert_eq!(board.best_words(&dpy, letters, 1, false, true), want);
+        }
+        assert!(!board.book_openings(&dpy, "kotekyz", 1).unwrap().is_empty());
+        assert_eq!(board.book_openings(&dpy, "abcdefg", 1), Some(Vec::new()));
+        assert_eq!(board.book_openings(&dpy, "kotekyz", 2), None);
+        assert_eq!(board.book_openings(&dpy, "koteky?", 1), None);
+        board.place_word("kot", CENTER, CENTER, true, Vec::new()).unwrap();
+        assert_eq!(board.book_openings(&dpy, "kotekyz", 1), None);
+    }
+
+    /// Repeated queries hit the move cache with the generated result, in
+    /// any rack order and for any smaller `n`; `place_word` moves the board
+    /// to new entries, and the least recently used entry is evicted first.
+    #[test]
+    fn move_cache_serves_repeats() {
+        let words = ["kot", "koty", "ty", "oto", "tok", "kto", "oko", "okot", "to", "ok"];
+        let dpy = DawgPy {
+            inner: compile(&words),
+            gaddag: Some(compile_gaddag(&words)),
+            openings: None,
+            move_cache: Mutex::new(MoveCache::new(2)),
+        };
+        let mut board = Board::new(None).unwrap();
+        board.place_word("kot", 7, 7, true, Vec::new()).unwrap();
+        let want = board.generate_best_words(&dpy, "tko", 5, false, true);
+        assert_eq!(board.best_words(&dpy, "tko", 5, false, true), want);
+        assert_eq!(board.best_words(&dpy, "okt", 5, true, false), want);
+        assert_eq!(board.best_words(&dpy, "kot", 2, false, true), want[..2].to_vec());
+        assert_eq!(dpy.cache_stats(), (2, 1, 1, 2));
+        // More than was generated: a miss, and the entry is regenerated.
+        let more = board.generate_best_words(&dpy, "kot", 9, false, true);
+        assert_eq!(board.best_words(&dpy, "kot", 9, false, true), more);
+        assert_eq!(dpy.cache_stats(), (2, 2, 1, 2));
+
+        let before = board.zobrist();
+        board.place_word("koty", 7, 7, true, Vec::new()).unwrap();
+        assert_ne!(board.zobrist(), before);
+        let after = board.generate_best_words(&dpy, "tko", 5, false, true);
+        assert_eq!(board.best_words(&dpy, "tko", 5, false, true), after);
+        assert_eq!(dpy.cache_stats(), (2, 3, 2, 2));
+        // A third entry evicts the least recently used (the first position).
+        board.best_words(&dpy, "y", 5, false, true);
+        let mut earlier = Board::new(None).unwrap();
+        earlier.place_word("kot", 7, 7, true, Vec::new()).unwrap();
+        assert_eq!(earlier.zobrist(), before);
+        earlier.best_words(&dpy, "tko", 5, false, true);
+        assert_eq!(dpy.cache_stats(), (2, 5, 2, 2));
+        dpy.clear_cache();
+        assert_eq!(dpy.cache_stats(), (0, 0, 0, 2));
+    }
+
+    /// `place_word` keeps the hash equal to a full recomputation, through
+    /// blanks, overwrites and the end of the opening, and a board rebuilt
+    /// with `from_grid` hashes the same.
+    #[test]
+    fn incremental_hash_matches_scan() {
+        let mut board = Board::new(None).unwrap();
+        assert_eq!(board.hash(), board.zobrist());
+        let empty = board.hash();
+        board.place_word("kot", 7, 7, true, vec![1]).unwrap();
+        assert_eq!(board.hash(), board.zobrist());
+        assert_ne!(board.hash(), empty);
+        let kot = board.hash();
+        board.place_word("koty", 7, 7, true, Vec::new()).unwrap();
+        board.place_word("t?", 7, 9, false, Vec::new()).unwrap();
+        assert_eq!(board.hash(), board.zobrist());
+        // A grid and its blank cells rebuild the position, blanks included.
+        let rebuild = |board: &Board| {
+            let grid: Vec<Vec<String>> = board
+                .grid()
+                .iter()
+                .map(|row| row.iter().map(char::to_string).collect())
+                .collect();
+            Board::from_grid(grid, board.blank_cells()).unwrap()
+        };
+        assert_eq!(board.blank_cells(), vec![(7, 8), (8, 9)]);
+        let rebuilt = rebuild(&board);
+        assert_eq!(rebuilt.hash(), board.hash());
+        assert_eq!(rebuilt.unseen(""), board.unseen(""));
+        // Overwriting a tile replaces its key.
+        board.place_word("kat", 7, 7, true, Vec::new()).unwrap();
+        assert_eq!(board.hash(), board.zobrist());
+        assert_eq!(rebuild(&board).hash(), board.hash());
+
+        // The same tiles as a blank hash differently.
+        let mut plain = Board::new(None).unwrap();
+        plain.place_word("kot", 7, 7, true, Vec::new()).unwrap();
+        assert_ne!(plain.hash(), kot);
+    }
+
+    /// `rack_blanks` marks exactly the new tiles a rack needs a blank for,
+    /// and placing with them scores those tiles at 0 in a later word.
+    #[test]
+    fn rack_blanks_follow_the_rack() {
+        let mut board = Board::new(None).unwrap();
+        assert_eq!(board.rack_blanks("kot", 7, 7, true, "ko?"), vec![2]);
+        assert_eq!(board.rack_blanks("oko", 7, 7, true, "ok?"), vec![2]);
+        assert!(board.rack_blanks("kot", 7, 7, true, "kot").is_empty());
+        let blanks = board.rack_blanks("kot", 7, 7, true, "ko?");
+        board.place_word("kot", 7, 7, true, blanks).unwrap();
+        // "koty" through the blank 't': only the new 'y' and the real tiles count.
+        assert!(board.rack_blanks("koty", 7, 7, true, "y").is_empty());
+        let plain = {
+            let mut b = Board::new(None).unwrap();
+            b.place_word("kot", 7, 7, true, Vec::new()).unwrap();
+            b.calculate_word_points_inner("koty", 7, 7, true, "y")
+                .unwrap()
+        };
+        let with_blank = board
+            .calculate_word_points_inner("koty", 7, 7, true, "y")
+            .unwrap();
+        assert_eq!(plain - with_blank, letter_points('t'));
+    }
+
+    /// `grid` holds exactly the cells `__str__` prints.
+    #[test]
+    fn grid_matches_str() {
+        let mut board = Board::new(None).unwrap();
+        board.place_word("kąt", 7, 7, true, vec![1]).unwrap();
+        board.place_word("t?", 7, 9, false, Vec::new()).unwrap();
+        let printed: Vec<Vec<char>> = board
+            .__str__()
+            .lines()
+            .map(|row| row.split(' ').map(|cell| cell.chars().next().unwrap()).collect())
+            .collect();
+        assert_eq!(board.grid(), printed);
+        assert_eq!(board.grid()[7][8], 'ą');
+        assert_eq!(board.grid()[8][9], '?');
+    }
+
+    /// `features` counts every premium kind, follows `place_word` and agrees
+    /// with a recount (and with `from_grid`).
+    #[test]
+    fn features_track_placed_tiles() {
+        assert_eq!(premium_totals(), &[8, 17, 12, 24]);
+        let mut board = Board::new(None).unwrap();
+        assert_eq!(board.features(), (1.0, 1.0, 1.0, 1.0, 0.0));
+        // Centre (DW), then (7, 11): a DL.
+        board.place_word("kotał", 7, 7, true, Vec::new()).unwrap();
+        board.place_word("kot", 7, 7, true, Vec::new()).unwrap();
+        board.place_word("ał", 7, 10, false, Vec::new()).unwrap();
+        assert_eq!((board.open_premiums, board.filled), board.count_features());
+        assert_eq!(board.open_premiums, [8, 16, 12, 23]);
+        assert_eq!(board.features().4, 6.0 / 225.0);
+
+        let grid: Vec<Vec<String>> = board
+            .grid()
+            .iter()
+            .map(|row| row.iter().map(char::to_string).collect())
+            .collect();
+        assert_eq!(
+            Board::from_grid(grid, Vec::new()).unwrap().features(),
+            board.features()
+        );
+    }
+
+    /// `unseen_counts` is the full bag less the board (blanks as `'?'`) and
+    /// the rack, and `on_board` follows overwrites.
+    #[test]
+    fn unseen_tiles_track_board_and_rack() {
+        let mut board = Board::new(None).unwrap();
+        assert_eq!(board.unseen_total(""), 100);
+        assert_eq!(board.unseen_total("aaaaaaa"), 93);
+        // The 'o' is a blank.
+        board.place_word("kot", 7, 7, true, vec![1]).unwrap();
+        board.place_word("t?", 7, 9, false, Vec::new()).unwrap();
+        let unseen = board.unseen_counts("kkz");
+        assert_eq!(unseen.get(&'k'), None);
+        assert_eq!(unseen[&'o'], 6);
+        assert_eq!(unseen[&'t'], 2);
+        assert_eq!(unseen.get(&'?'), None);
+        assert_eq!(unseen[&'z'], 4);
+        assert_eq!(board.unseen_total("kkz"), 100 - 4 - 3);
+
+        board.place_word("kat", 7, 7, true, Vec::new()).unwrap();
+        assert_eq!(board.on_board, board.count_tiles());
+        assert_eq!(board.unseen_counts("")[&'?'], 1);
+        assert_eq!(board.unseen_counts("")[&'a'], 8);
+    }
+
+    /// `LeaveModel` runs the MLP (ReLU between layers) over `encode_leave`'s
+    /// inputs, and `best_words_by_leave` re-ranks the score-ordered
+    /// candidates by score plus rounded leave value.
+    #[test]
+    fn leave_model_reranks_candidates() {
+        // Python's `sorted(set(fresh_tile_bag()))`: code-point order.
+        let mut alphabet: Vec<char> = fresh_tile_bag();
+        alphabet.sort();
+        alphabet.dedup();
+        let alphabet: String = alphabet.into_iter().collect();
+        let at = |c: char| alphabet.chars().position(|a| a == c).unwrap();
+        // Hidden unit 0 counts kept 'k's (worth 10 each), unit 1 is
+        // -unseen/100 and is cut by the ReLU; output is their sum - 1.
+        let mut hidden = vec![vec![0.0; LEAVE_INPUTS]; 2];
+        hidden[0][at('k')] = 10.0;
+        hidden[1][ALPHABET_SIZE + 1] = -1.0;
+        let model = LeaveModel::new(
+            &alphabet,
+            vec![(hidden, vec![0.0, 0.0]), (vec![vec![1.0, 1.0]], vec![-1.0])],
+        )
+        .unwrap();
+        assert!(LeaveModel::new(&alphabet[1..], Vec::new()).is_err());
+        assert!(LeaveModel::new(&alphabet, vec![(vec![vec![0.0; 3]], vec![0.0])]).is_err());
+        assert_eq!(
+            model.evaluate(vec!["kk?".into(), "".into()], 50, [0.0; 5]),
+            vec![19.0, -1.0]
+        );
+
+        assert_eq!(
+            leave_after(&rack_counts("kot?"), &['k', 'y']),
+            rack_counts("ot")
+        );
+
+        let words = [
+            "kot", "koty", "ty", "oto", "tok", "kto", "oko", "okot", "to", "ok",
+        ];
+        let dpy = DawgPy {
+            inner: compile(&words),
+            gaddag: Some(compile_gaddag(&words)),
+            openings: None,
+            move_cache: Mutex::new(MoveCache::new(0)),
+        };
+        let mut board = Board::new(None).unwrap();
+        board.place_word("kot", 7, 7, true, Vec::new()).unwrap();
+        let rack = "kkoty";
+        let moves = board.best_words(&dpy, rack, 50, false, true);
+        let total = |m: &BestWord| {
+            let kept = leave_after(&rack_counts(rack), &m.3)[letter_index('k').unwrap()];
+            m.1 as i64 + 10 * kept as i64 - 1
+        };
+        let best = moves
+            .iter()
+            .max_by_key(|m| {
+                (
+                    total(m),
+                    std::cmp::Reverse(moves.iter().position(|o| o == *m)),
+                )
+            })
+            .unwrap();
+        let ranked = board.best_words_by_leave(&dpy, rack, &model, 3, 50, false);
+        assert_eq!(ranked.len(), 3);
+        assert_eq!(
+            (&ranked[0].0, ranked[0].1, ranked[0].2),
+            (&best.0, best.1, best.2)
+        );
+        assert_eq!(ranked[0].1 as i64 + ranked[0].4 as i64, total(best));
+        assert!(ranked
+            .windows(2)
+            .all(|w| w[0].1 as f64 + w[0].4 >= w[1].1 as f64 + w[1].4));
+    }
+
+    /// A seeded board draws the same tiles for the same calls, including
+    /// through exchanges; different seeds give different racks.
+    #[test]
+    fn seeded_board_draws_reproducibly() {
+        let draws = |seed| {
+            let mut board = Board::new(Some(seed)).unwrap();
+            let rack = board.give_letters("");
+            let swapped =
+                board.exchange_letters(&rack, &rack[..rack.char_indices().nth(3).unwrap().0]);
+            (
+                rack,
+                swapped,
+                board.give_letters(""),
+                board.tile_bag.clone(),
+            )
+        };
+        assert_eq!(draws(42), draws(42));
+        assert_ne!(draws(42).0, draws(43).0);
+        assert_eq!(draws(42).3.len(), 100 - 2 * RACK_SIZE);
+    }
+
+    /// Native self-play is a pure function of its seed, plays only words the
+    /// lexicon holds, and follows `get_letters_to_exchange`'s choice.
+    #[test]
+    fn self_play_is_reproducible() {
+        assert_eq!(letters_to_exchange("aeiknrz"), "earn");
+        assert_eq!(letters_to_exchange("akrstwz"), "rsw");
+        assert_eq!(letters_to_exchange("aeiouyk"), "aei");
+        assert!(Policy::parse("random").is_err());
+
+        let words = [
+            "kot", "koty", "ty", "oto", "tok", "kto", "oko", "okot", "to", "ok", "na", "ona",
+            "tam", "mata", "kat", "rak", "ser", "las", "dom", "nos", "sok", "pies", "lato",
+        ];
+        let dpy = DawgPy {
+            inner: compile(&words),
+            gaddag: Some(compile_gaddag(&words)),
+            openings: None,
+            move_cache: Mutex::new(MoveCache::new(0)),
+        };
+        for (policies, limit) in [
+            ([Policy::Greedy; 2], 2),
+            ([Policy::Strategic, Policy::Greedy], 2),
+            ([Policy::Greedy; 2], 4),
+        ] {
+            let game = play_game(&dpy, policies, mix_seed(7), limit);
+            assert_eq!(game, play_game(&dpy, policies, mix_seed(7), limit));
+            assert!(game.3.len() <= MAX_GAME_TURNS);
+            assert!(game
+                .3
+                .iter()
+                .flatten()
+                .all(|w| w.is_empty() || words.contains(&w.as_str())));
+        }
+        assert_ne!(
+            play_game(&dpy, [Policy::Greedy; 2], mix_seed(7), 2),
+            play_game(&dpy, [Policy::Greedy; 2], mix_seed(8), 2)
+        );
+    }
 }
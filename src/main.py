@@ -5,7 +5,8 @@ import sys
 import time
 from collections import Counter
 from concurrent.futures import ProcessPoolExecutor, as_completed
-from random import random
+from dataclasses import dataclass, field
+from random import Random
 
 from matplotlib import pyplot as plt  # type: ignore
 from tqdm import tqdm  # type: ignore
@@ -13,11 +14,35 @@ from tqdm import tqdm  # type: ignore
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "smart_player"))
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
-from scrablozaur import Board, Dawg
+from engine_server import EngineClient
+from scrablozaur import Board, Dawg, num_threads, play_games
 from smart_player.player import SmartPlayer
 from strategy import SimplePlayer, StrategicPlayer
 
-d = Dawg("words/dawg.bin", "words/gaddag.bin")
+# Where `graj` gets its moves: this process's own `Dawg`, loaded on first use,
+# or an `EngineClient` once `_use_engine` points it at a shared engine daemon.
+_moves: Dawg | EngineClient | None = None
+
+
+def _move_source() -> Dawg | EngineClient:
+    global _moves
+    if _moves is None:
+        _moves = Dawg("words/dawg.bin", "words/gaddag.bin")
+    return _moves
+
+
+def _use_engine(socket_path: str) -> None:
+    """Generate this process's moves on the engine daemon at `socket_path`
+    (src/engine_server.py) instead of loading a `Dawg`. Also the benchmark
+    worker initializer for `--engine-socket`."""
+    global _moves
+    _moves = EngineClient(socket_path)
+
+# Player types `play_games` runs entirely in the engine (see --native).
+NATIVE_POLICIES = {"1": "greedy", "2": "strategic"}
+# Consecutive no-action turns that end a `graj` game; `--native` passes the
+# same limit to `play_games` so both benchmarks play by one rule.
+GRAJ_NO_PLAY_LIMIT = 4
 
 
 def _rusage_self_now() -> float:
@@ -90,8 +115,17 @@ def _render_table(headers: list[str], rows: list[list[str]], align: str | None =
 
 
 def graj(
-    p1_type: str, p2_type: str, parallel: bool = False, debug: bool = False
+    p1_type: str,
+    p2_type: str,
+    parallel: bool = False,
+    debug: bool = False,
+    seed: int | None = None,
+    record: bool = True,
 ) -> tuple[int, int, str, float, Counter[str], float, int]:
+    """Play one game. A `seed` fixes the tile draws and the opener, so the
+    same seed and player types replay the same game. With `record=False`
+    the transcript comes back empty and the board is never rendered (unless
+    `debug` prints it)."""
     cpu_start = _rusage_self_now()
 
     log: list[str] = []
@@ -101,22 +135,26 @@ def graj(
 
     def emit(*parts: object) -> None:
         """Record a line to the game transcript, and print it too if debug is on."""
+        if not (record or debug):
+            return
         line = " ".join(str(p) for p in parts)
         log.append(line)
         if debug:
             print(line)
 
+    moves = _move_source()
+
     def play(player: SimplePlayer | StrategicPlayer | SmartPlayer) -> str | None:
         nonlocal move_time_total, move_count
         move_start = time.perf_counter()
-        word = player.play_word(d, parallel=parallel)
+        word = player.play_word(moves, parallel=parallel)
         move_time_total += time.perf_counter() - move_start
         move_count += 1
         if word:
             words_played[word] += 1
         return word
 
-    b = Board()
+    b = Board(seed=seed)
 
     match p1_type:
         case "1":
@@ -138,7 +176,7 @@ def graj(
         case _:
             raise ValueError(f"Unknown player type: {p2_type}")
 
-    opener = p1 if random() < 0.5 else p2
+    opener = p1 if Random(seed).random() < 0.5 else p2
     second = p2 if opener is p1 else p1
     players = [opener, second]
 
@@ -170,7 +208,7 @@ def graj(
             no_play_streak += 1
             emit(f"{name} cannot play.")
             emit(b)
-            if no_play_streak >= 4:
+            if no_play_streak >= GRAJ_NO_PLAY_LIMIT:
                 break
         turn += 1
 
@@ -191,6 +229,49 @@ def graj(
     return p1.score, p2.score, "\n".join(log), cpu_end - cpu_start, words_played, move_time_total, move_count
 
 
+@dataclass
+class _BatchSummary:
+    """What a benchmark worker sends back for a batch of games: the running
+    totals `benchmark` aggregates, plus the seed of the batch's best game
+    instead of any transcript -- the parent replays just the overall best."""
+
+    games: int = 0
+    p1_scores: Counter[int] = field(default_factory=Counter)
+    p2_scores: Counter[int] = field(default_factory=Counter)
+    wins: list[int] = field(default_factory=lambda: [0, 0])
+    cpu_time: float = 0.0
+    move_time: float = 0.0
+    moves: int = 0
+    word_counts: Counter[str] = field(default_factory=Counter)
+    best_score: int = -1
+    best_seed: int = 0
+
+
+def _play_batch(p1_type: str, p2_type: str, parallel: bool, debug: bool, seeds: range) -> _BatchSummary:
+    """Play one seeded game per entry of `seeds` without transcripts and
+    fold the results into one summary, so a whole batch crosses the process
+    boundary as a handful of counters."""
+    summary = _BatchSummary()
+    for game_seed in seeds:
+        p1, p2, _, cpu_time, game_words, move_time, move_count = graj(
+            p1_type, p2_type, parallel, debug, game_seed, record=False
+        )
+        summary.games += 1
+        summary.p1_scores[p1] += 1
+        summary.p2_scores[p2] += 1
+        summary.cpu_time += cpu_time
+        summary.move_time += move_time
+        summary.moves += move_count
+        summary.word_counts.update(game_words)
+        if p1 > p2:
+            summary.wins[0] += 1
+        elif p2 > p1:
+            summary.wins[1] += 1
+        if max(p1, p2) > summary.best_score:
+            summary.best_score, summary.best_seed = max(p1, p2), game_seed
+    return summary
+
+
 def _print_benchmark_results(
     n_workers: int,
     games_played: int,
@@ -258,7 +339,132 @@ def _print_benchmark_results(
     # plt.show()
 
 
-def benchmark(N: int, p1_type: str, p2_type: str, n_workers: int | None = None, debug: bool = False) -> None:
+def _native_transcript(p1: int, p2: int, p1_opened: bool, moves: list[str | None]) -> str:
+    """`graj`'s transcript for a `play_games` result -- the moves without the
+    board diagrams, which the engine doesn't hand back."""
+    names = ["Player 1", "Player 2"] if p1_opened else ["Player 2", "Player 1"]
+    lines = []
+    for turn, word in enumerate(moves):
+        name = names[turn % 2]
+        if word:
+            lines.append(f"{name} plays: {word}")
+        elif word is None:
+            lines.append(f"{name} exchanged letters")
+        else:
+            lines.append(f"{name} cannot play.")
+    lines.append(f"Final Scores: Player 1: {p1}, Player 2: {p2}")
+    return "\n".join(lines)
+
+
+def benchmark_native(N: int, p1_type: str, p2_type: str, seed: int | None = None) -> None:
+    """`benchmark` with every game played inside the engine by `play_games`:
+    no worker processes and no per-move Python round trip, with games spread
+    over the engine's thread pool. Only the built-in Simple/Strategic players
+    have a native policy. Games end after `GRAJ_NO_PLAY_LIMIT` consecutive
+    no-action turns, as in `graj`."""
+    policy, opponent = NATIVE_POLICIES[p1_type], NATIVE_POLICIES[p2_type]
+    p1_scores: Counter[int] = Counter()
+    p2_scores: Counter[int] = Counter()
+    wins = [0, 0]
+    best_score = -1
+    best_transcript = ""
+    word_counts: Counter[str] = Counter()
+    total_moves = 0
+    games_played = 0
+
+    n_workers = num_threads()
+    print(f"Running {N} games natively on {n_workers} engine thread(s)...")
+    cpu_start = _rusage_self_now()
+    wall_start = time.perf_counter()
+    try:
+        with tqdm(total=N, desc="Games played") as pbar:
+            # Chunked so the progress bar moves and Ctrl-C lands between chunks.
+            chunk = n_workers * 100
+            for i in range(0, N, chunk):
+                chunk_seed = None if seed is None else seed + i
+                games = play_games(
+                    _move_source(),
+                    min(chunk, N - i),
+                    policy,
+                    seed=chunk_seed,
+                    opponent=opponent,
+                    no_play_limit=GRAJ_NO_PLAY_LIMIT,
+                )
+                for p1, p2, p1_opened, moves in games:
+                    games_played += 1
+                    p1_scores[p1] += 1
+                    p2_scores[p2] += 1
+                    total_moves += len(moves)
+                    word_counts.update(w for w in moves if w)
+                    if p1 > p2:
+                        wins[0] += 1
+                    elif p2 > p1:
+                        wins[1] += 1
+                    if p1 > best_score or p2 > best_score:
+                        best_score = max(p1, p2)
+                        best_transcript = _native_transcript(p1, p2, p1_opened, moves)
+                    pbar.update(1)
+    except KeyboardInterrupt:
+        print(f"\nInterrupted -- stopping after {games_played}/{N} games.")
+
+    if games_played == 0:
+        print("No games completed.")
+        return
+
+    best_game_path = "_best_game.txt"
+    with open(best_game_path, "w") as f:
+        f.write(best_transcript + "\n")
+
+    wall_elapsed = time.perf_counter() - wall_start
+    cpu_total = _rusage_self_now() - cpu_start
+
+    ties = games_played - wins[0] - wins[1]
+    decisive_games = games_played - ties
+    win_rate_p1 = f"{wins[0] / decisive_games * 100:.2f}%" if decisive_games else "N/A"
+    win_rate_p2 = f"{wins[1] / decisive_games * 100:.2f}%" if decisive_games else "N/A"
+
+    _print_benchmark_results(
+        n_workers=n_workers,
+        games_played=games_played,
+        wall_elapsed=wall_elapsed,
+        cpu_total=cpu_total,
+        avg_cpu_per_core=cpu_total / n_workers,
+        # Games run concurrently, so per-move time is thread time, not wall.
+        avg_move_time_ms=cpu_total / total_moves * 1000,
+        wins=wins,
+        ties=ties,
+        win_rate_p1=win_rate_p1,
+        win_rate_p2=win_rate_p2,
+        word_counts=word_counts,
+        best_score=best_score,
+        best_game_path=best_game_path,
+        p1_scores=p1_scores,
+        p2_scores=p2_scores,
+    )
+
+
+def benchmark(
+    N: int,
+    p1_type: str,
+    p2_type: str,
+    n_workers: int | None = None,
+    debug: bool = False,
+    seed: int | None = None,
+    engine_socket: str | None = None,
+) -> None:
+    """Play `N` games across worker processes and print the aggregate
+    results. With a `seed`, game `i` is `graj(..., seed=seed + i)`, so a rerun
+    (or a run with other player types) sees the same bags and seatings.
+
+    With `engine_socket`, no worker loads a `Dawg`: each opens an
+    `EngineClient` to the daemon listening there (src/engine_server.py) and
+    asks it for every move, so one lexicon and one move-generation pool serve
+    all of them. The workers' CPU time then leaves out the daemon's.
+
+    Workers play batches of games and send back only `_BatchSummary`
+    totals. Every game is seeded (from a random base without `seed`), so
+    the best game's transcript is rebuilt at the end by replaying its seed
+    rather than recorded for every game."""
     # Scores are heavily repeated across thousands of games, so track
     # {score: occurrences} per player instead of one entry per game -- keeps
     # memory bounded by the number of distinct scores rather than N.
@@ -266,7 +472,7 @@ def benchmark(N: int, p1_type: str, p2_type: str, n_workers: int | None = None,
     p2_scores: Counter[int] = Counter()
     wins = [0, 0]
     best_score = -1
-    best_transcript = ""
+    best_seed = 0
     cpu_total = 0.0
     total_move_time = 0.0
     total_moves = 0
@@ -279,44 +485,52 @@ def benchmark(N: int, p1_type: str, p2_type: str, n_workers: int | None = None,
 
     # Per-move rayon parallelism is only engaged with a single worker; with
     # several workers each game runs single-threaded (process-level parallelism).
-    if parallel:
+    if engine_socket:
+        _use_engine(engine_socket)
+        print(f"Engine move generation: on the engine daemon at {engine_socket}")
+    elif parallel:
         engine_threads = int(os.environ.get("RAYON_NUM_THREADS") or min(8, os.cpu_count() or 1))
         print(f"Engine move generation: parallel, {engine_threads} rayon thread(s) per move")
     else:
         print("Engine move generation: single-threaded per move (parallelism is across workers)")
 
+    if seed is None:
+        seed = Random().randrange(2**32)
     wall_start = time.perf_counter()
 
-    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+    pool_args = {"initializer": _use_engine, "initargs": (engine_socket,)} if engine_socket else {}
+    with ProcessPoolExecutor(max_workers=n_workers, **pool_args) as executor:
         n_workers = executor._max_workers
         print(f"Running {N} games with {n_workers} worker process(es)...")
         try:
             with tqdm(total=N, desc="Games played") as pbar:
-                batch_size = n_workers * 1000
-                for i in range(0, N, batch_size):
-                    futures = [
-                        executor.submit(graj, p1_type, p2_type, parallel, debug) for _ in range(min(batch_size, N - i))
-                    ]
-
-                    for future in as_completed(futures):
-                        p1, p2, transcript, cpu_time, game_words, move_time, move_count = future.result()
-                        games_played += 1
-                        p1_scores[p1] += 1
-                        p2_scores[p2] += 1
-                        cpu_total += cpu_time
-                        total_move_time += move_time
-                        total_moves += move_count
-                        pbar.update(1)
-
-                        word_counts.update(game_words)
-                        if p1 > p2:
-                            wins[0] += 1
-                        elif p2 > p1:
-                            wins[1] += 1
-
-                        if p1 > best_score or p2 > best_score:
-                            best_score = max(p1, p2)
-                            best_transcript = transcript
+                # Small enough to keep every worker busy to the end and the
+                # progress bar moving, large enough that one summary stands
+                # for many games.
+                games_per_task = max(1, min(50, N // (n_workers * 4)))
+                end = seed + N
+                futures = [
+                    executor.submit(
+                        _play_batch, p1_type, p2_type, parallel, debug, range(j, min(j + games_per_task, end))
+                    )
+                    for j in range(seed, end, games_per_task)
+                ]
+
+                for future in as_completed(futures):
+                    batch = future.result()
+                    games_played += batch.games
+                    p1_scores.update(batch.p1_scores)
+                    p2_scores.update(batch.p2_scores)
+                    wins[0] += batch.wins[0]
+                    wins[1] += batch.wins[1]
+                    cpu_total += batch.cpu_time
+                    total_move_time += batch.move_time
+                    total_moves += batch.moves
+                    word_counts.update(batch.word_counts)
+                    pbar.update(batch.games)
+
+                    if batch.best_score > best_score:
+                        best_score, best_seed = batch.best_score, batch.best_seed
 
         except KeyboardInterrupt:
             # Drop not-yet-started games so shutdown doesn't run through the
@@ -328,11 +542,13 @@ def benchmark(N: int, p1_type: str, p2_type: str, n_workers: int | None = None,
         print("No games completed.")
         return
 
+    wall_elapsed = time.perf_counter() - wall_start
+
+    best_transcript = graj(p1_type, p2_type, parallel, seed=best_seed)[2]
     best_game_path = "_best_game.txt"
     with open(best_game_path, "w") as f:
         f.write(best_transcript + "\n")
 
-    wall_elapsed = time.perf_counter() - wall_start
     avg_cpu_per_core = cpu_total / n_workers
     avg_move_time_ms = total_move_time / total_moves * 1000
 
@@ -391,11 +607,35 @@ if __name__ == "__main__":
         "(default: min(8, cores)); only engaged when a single worker runs move-gen in parallel",
     )
     parser.add_argument("--debug", action="store_true", help="Print detailed game logs for debugging purposes")
+    parser.add_argument(
+        "--native",
+        action="store_true",
+        help="Play whole games inside the engine (scrablozaur.play_games); player types 1 and 2 only",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Seed game i's tile bag and opener with seed + i, for reproducible runs (default: random)",
+    )
+    parser.add_argument(
+        "--engine-socket",
+        default=None,
+        help="Ask a running src/engine_server.py daemon on this socket for every move "
+        "instead of loading a Dawg in each worker",
+    )
     args = parser.parse_args()
+    if args.native and not {args.p1, args.p2} <= NATIVE_POLICIES.keys():
+        parser.error("--native supports player types 1 (Simple) and 2 (Strategic) only")
+    if args.native and args.engine_socket:
+        parser.error("--native plays inside this process's engine; it cannot use --engine-socket")
 
     if args.threads is not None:
         # Set before any worker is spawned so each inherits it; the Rust engine
         # reads RAYON_NUM_THREADS when it builds its move-generation pool.
         os.environ["RAYON_NUM_THREADS"] = str(args.threads)
 
-    benchmark(args.games, args.p1, args.p2, args.workers, args.debug)
+    if args.native:
+        benchmark_native(args.games, args.p1, args.p2, args.seed)
+    else:
+        benchmark(args.games, args.p1, args.p2, args.workers, args.debug, args.seed, args.engine_socket)
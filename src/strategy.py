@@ -1,11 +1,36 @@
-from collections import Counter
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
 from scrablozaur import Board, Dawg
 
+if TYPE_CHECKING:
+    from engine_server import EngineClient
+
 VOWELS = "aąeęioóuy"
 CONSONANTS = "bcćdfghjklłmnńprsśtwzżź"
 
 
+def best_words(
+    board: Board, dawg: Dawg | EngineClient, letters: str, n: int, parallel: bool
+) -> list[tuple[str, int, tuple[int, int, bool], list[str]]]:
+    """`board.get_best_words` against a local `Dawg`, or the same query sent to
+    the engine daemon when `dawg` is an `engine_server.EngineClient` (the
+    daemon picks its own parallelism)."""
+    if isinstance(dawg, Dawg):
+        return board.get_best_words(dawg, letters, n=n, parallel=parallel)
+    return dawg.get_best_words(board, letters, n)
+
+
+def best_word(
+    board: Board, dawg: Dawg | EngineClient, letters: str, parallel: bool
+) -> tuple[str, int, tuple[int, int, bool], list[str]]:
+    """`board.get_best_word` for either kind of move source (see `best_words`)."""
+    if isinstance(dawg, Dawg):
+        return board.get_best_word(dawg, letters, parallel)
+    return dawg.get_best_word(board, letters)
+
+
 class SimplePlayer:
     def __init__(self, board: Board) -> None:
         self.board = board
@@ -49,7 +74,7 @@ class SimplePlayer:
 
         return letters_to_exchange
 
-    def play_word(self, dawg: Dawg, parallel: bool = False) -> str | None:
+    def play_word(self, dawg: Dawg | EngineClient, parallel: bool = False) -> str | None:
         """Find and play the best word from the player's letters on the board.
 
         This method should:
@@ -58,13 +83,14 @@ class SimplePlayer:
             the player's letters and fits one of the patterns.
           - Place the word on the board and update the player's letters.
 
+        `dawg` may also be an `engine_server.EngineClient`, to generate moves
+        on a shared engine daemon instead of a local `Dawg`.
+
         Returns the played word, `None` if letters were exchanged instead
         (a real, repeatable action -- not "no play"), or `""` only when
         genuinely no action is available (no legal word and can't exchange).
         """
-        word, points, position, used = self.board.get_best_word(
-            dawg, self.letters, parallel
-        )
+        word, points, position, used = best_word(self.board, dawg, self.letters, parallel)
         if not word:
             if self.board.can_exchange():
                 self.exchange_letters(self.get_letters_to_exchange())
@@ -75,7 +101,7 @@ class SimplePlayer:
 
         self.last_exchanged = False
         self.score += points
-        self.board.place_word(word, position[0], position[1], position[2])
+        self.board.place_move((word, points, position, used))
         for ch in used:
             if ch in self.letters:
                 self.letters = self.letters.replace(ch, "", 1)
@@ -112,25 +138,20 @@ class StrategicPlayer:
         self.letters += self.board.give_letters(self.letters)
 
     def get_letters_left(self) -> list[str]:
-        """Return the letters used in the last played word for scoring purposes."""
-        used_letters = [ch for ch in self.board.__str__().split() if ch != "-"] + [
-            ch for ch in self.letters
-        ]
-
-        return list(
-            (Counter(self.board.fresh_tile_bag()) - Counter(used_letters)).elements()
-        )
+        """Return the tiles not on the board or in this hand (still in the bag or
+        the opponent's hand), one entry per tile."""
+        return [ch for ch, k in self.board.unseen_counts(self.letters).items() for _ in range(k)]
 
     def get_best_words(
-        self, dawg: Dawg, letters: str, parallel: bool
+        self, dawg: Dawg | EngineClient, letters: str, parallel: bool
     ) -> list[tuple[str, int, tuple[int, int, bool], list[str]]]:
         """Find the best scoring words that can be placed on the board with the given letters."""
-        words = self.board.get_best_words(dawg, letters, n=50, parallel=parallel)
+        words = best_words(self.board, dawg, letters, 50, parallel)
 
         return words
 
     def get_best_word(
-        self, dawg: Dawg, parallel: bool
+        self, dawg: Dawg | EngineClient, parallel: bool
     ) -> tuple[str, int, tuple[int, int, bool], list[str]]:
         """Find the best scoring word from the player's letters on the board."""
         words = self.get_best_words(dawg, self.letters, parallel)
@@ -139,7 +160,8 @@ class StrategicPlayer:
         # the board and rack, not the candidate -- so compute it once here
         # instead of re-deriving it inside evaluate_word for all ~50 candidates.
         self._leave_points = sum(
-            self.board.letter_points(ch) for ch in self.get_letters_left()
+            self.board.letter_points(ch) * k
+            for ch, k in self.board.unseen_counts(self.letters).items()
         )
         best_word = max(words, key=lambda w: self.evaluate_word(dawg, *w), default=None)
 
@@ -151,7 +173,7 @@ class StrategicPlayer:
 
     def evaluate_word(
         self,
-        dawg: Dawg,
+        dawg: Dawg | EngineClient,
         word: str,
         points: int,
         position: tuple[int, int, bool],
@@ -183,7 +205,7 @@ class StrategicPlayer:
 
         return letters_to_exchange
 
-    def play_word(self, dawg: Dawg, parallel: bool = False) -> str | None:
+    def play_word(self, dawg: Dawg | EngineClient, parallel: bool = False) -> str | None:
         """Find and play the best word from the player's letters on the board.
 
         This method should:
@@ -192,6 +214,9 @@ class StrategicPlayer:
             the player's letters and fits one of the patterns.
           - Place the word on the board and update the player's letters.
 
+        `dawg` may also be an `engine_server.EngineClient` (see
+        `SimplePlayer.play_word`).
+
         Returns the played word, `None` if letters were exchanged instead
         (a real, repeatable action -- not "no play"), or `""` only when
         genuinely no action is available (no legal word and can't exchange).
@@ -209,7 +234,7 @@ class StrategicPlayer:
             return ""
 
         self.score += points
-        self.board.place_word(word, position[0], position[1], position[2])
+        self.board.place_move((word, points, position, used))
         for ch in used:
             if ch in self.letters:
                 self.letters = self.letters.replace(ch, "", 1)
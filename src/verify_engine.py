@@ -22,7 +22,7 @@ GADDAG_PATH = _ROOT / "words" / "gaddag.bin"
 
 
 def board_grid(board: Board) -> list[list[str]]:
-    return [row.split(" ") for row in str(board).strip().split("\n")]
+    return board.grid()
 
 
 def check_cross_word_scoring() -> list[str]:
@@ -111,12 +111,40 @@ def check_min_word_length() -> list[str]:
     return errors
 
 
+def check_hash_tracks_position() -> list[str]:
+    """Board.hash() is updated incrementally by place_word, so it must agree
+    with a board rebuilt from the same grid and blank cells, differ once a
+    tile is added, and come back when a position is restored (as undo does
+    via from_grid)."""
+    board = Board()
+    empty = board.hash()
+    board.place_word("kot", 7, 7, True, [1])
+    after_kot = board.hash()
+    board.place_word("ty", 7, 9, False)
+
+    errors = []
+    if after_kot == empty or board.hash() == after_kot:
+        errors.append("placing tiles did not change the hash")
+    if Board.from_grid(board_grid(board), board.blank_cells()).hash() != board.hash():
+        errors.append("from_grid of the same grid and blanks hashes differently from the played board")
+    if Board.from_grid(board_grid(board)).hash() == board.hash():
+        errors.append("a blank hashes the same as a real tile of its letter")
+    if Board().hash() != empty:
+        errors.append("two empty boards hash differently")
+    restored = Board()
+    restored.place_word("kot", 7, 7, True, [1])
+    if restored.hash() != after_kot:
+        errors.append("replaying the same move gives a different hash")
+    return errors
+
+
 def main() -> None:
     checks = [
         ("cross-word scoring uses its own word multiplier", check_cross_word_scoring),
         ("first-move search covers offset 0 (word starting exactly on centre)", check_first_move_covers_every_offset),
         ("every pattern is bounded by an empty cell or the board edge", check_pattern_boundaries),
         ("a play must be at least 2 letters", check_min_word_length),
+        ("Board.hash() tracks the position through place_word", check_hash_tracks_position),
     ]
 
     failed = False
@@ -0,0 +1,134 @@
+import os
+import sys
+import tempfile
+import threading
+
+from scrablozaur import Board, Dawg
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from engine_server import (
+    DAWG_PATH,
+    GADDAG_PATH,
+    EngineClient,
+    EngineError,
+    EngineServer,
+    _same_board_groups,
+    board_grid,
+)
+from strategy import SimplePlayer, StrategicPlayer
+
+
+def _serve() -> tuple[EngineServer, str]:
+    socket_path = os.path.join(tempfile.mkdtemp(), "engine.sock")
+    server = EngineServer(socket_path, Dawg(str(DAWG_PATH), str(GADDAG_PATH)))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, socket_path
+
+
+def test_remote_moves_match_local():
+    server, socket_path = _serve()
+    dawg = Dawg(str(DAWG_PATH), str(GADDAG_PATH))
+    board = Board()
+    board.place_word("hamulec", 7, 4, True)
+    try:
+        with EngineClient(socket_path) as engine:
+            assert engine.contains("hamulec")
+            assert engine.get_best_words(board, "aeimnrt", 5) == board.get_best_words(dawg, "aeimnrt", 5)
+            racks = ["aeimnrt", "kotyzw?"]
+            assert engine.get_best_words_many(board, racks, 3) == [board.get_best_words(dawg, r, 3) for r in racks]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_bad_request_reports_error_and_keeps_serving():
+    server, socket_path = _serve()
+    try:
+        with EngineClient(socket_path) as engine:
+            try:
+                engine.get_best_words([["-"] * 15], "abc", 1)
+                raise AssertionError("expected a malformed grid to be rejected")
+            except EngineError:
+                pass
+            assert engine.contains("hamulec")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_same_board_requests_are_grouped():
+    board = Board()
+    board.place_word("hamulec", 7, 4, True)
+    other = Board()
+    grid, other_grid = board_grid(board), board_grid(other)
+    requests = [
+        {"op": "best_words", "grid": grid, "letters": "aeimnrt", "n": 3},
+        {"op": "contains", "word": "hamulec"},
+        {"op": "best_words", "grid": other_grid, "letters": "aeimnrt", "n": 3},
+        {"op": "best_words", "grid": grid, "letters": "kotyzw?", "n": 3},
+        {"op": "best_words", "grid": grid, "letters": "kotyzw?", "n": 5},
+    ]
+    groups = _same_board_groups([(request, None) for request in requests])
+    assert [[requests.index(r) for r, _ in group] for group in groups] == [[0, 3], [1], [2], [4]]
+
+    server, _ = _serve()
+    dawg = Dawg(str(DAWG_PATH), str(GADDAG_PATH))
+    try:
+        racks = ["aeimnrt", "kotyzw?", "bcdeilo", "??aeiou"]
+        futures = [server.submit({"op": "best_words", "grid": grid, "letters": r, "n": 4}) for r in racks]
+        futures.append(server.submit({"op": "best_words", "grid": grid, "letters": 7, "n": 4}))
+        replies = [future.result() for future in futures]
+        # A bad rack sinks its group's shared call, so every request is
+        # retried alone: the good ones still get their moves.
+        assert [reply["ok"] for reply in replies[:-1]] == [board.get_best_words(dawg, r, 4) for r in racks]
+        assert "error" in replies[-1]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_players_play_the_same_through_the_daemon():
+    server, socket_path = _serve()
+    dawg = Dawg(str(DAWG_PATH), str(GADDAG_PATH))
+    try:
+        with EngineClient(socket_path) as engine:
+            for player_type in (SimplePlayer, StrategicPlayer):
+                local_board, remote_board = Board(seed=21), Board(seed=21)
+                local, remote = player_type(local_board), player_type(remote_board)
+                for _ in range(12):
+                    assert remote.play_word(engine) == local.play_word(dawg)
+                    assert (remote.score, remote.letters) == (local.score, local.letters)
+                assert board_grid(remote_board) == board_grid(local_board)
+                assert remote_board.blank_cells() == local_board.blank_cells()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_benchmark_games_through_the_daemon():
+    # What `src/main.py --engine-socket` does in each benchmark worker.
+    import main
+
+    server, socket_path = _serve()
+    try:
+        main._moves = Dawg(str(DAWG_PATH), str(GADDAG_PATH))
+        local = main.graj("2", "1", seed=5)
+        main._use_engine(socket_path)
+        remote = main.graj("2", "1", seed=5)
+        main._moves.close()
+        assert remote[:3] == local[:3]
+        assert remote[4] == local[4]
+    finally:
+        main._moves = None
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    test_remote_moves_match_local()
+    test_bad_request_reports_error_and_keeps_serving()
+    test_same_board_requests_are_grouped()
+    test_players_play_the_same_through_the_daemon()
+    test_benchmark_games_through_the_daemon()
+    print("All tests passed.")
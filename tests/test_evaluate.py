@@ -0,0 +1,196 @@
+import math
+import os
+import statistics
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from statistics import NormalDist
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "smart_player"))
+
+import evaluate  # noqa: E402
+from evaluate import _RunningMean, _Sprt, run_duplicate  # noqa: E402
+
+Z95 = NormalDist().inv_cdf(0.975)  # run_duplicate's z at confidence=0.95
+
+
+def _run_pairs(pair_games, **kwargs):
+    """run_duplicate over synthetic pairs: pair `i` returns `pair_games[i]`,
+    played in order on one thread instead of worker processes."""
+    base = 1000
+    calls = []
+
+    def fake_pair(opponent_name, model_path, candidate_path, seed):
+        calls.append(seed)
+        return pair_games[seed - base]
+
+    with (
+        mock.patch.object(evaluate, "_play_pair", fake_pair),
+        mock.patch.object(evaluate, "ProcessPoolExecutor", ThreadPoolExecutor),
+    ):
+        result = run_duplicate(2 * len(pair_games), n_workers=1, quiet=True, seed=base, **kwargs)
+    return result, calls
+
+
+def _expected_stop(pair_scores, stop_at, min_pairs, z=Z95):
+    """First pair count at which the score-rate interval excludes stop_at."""
+    for n in range(max(2, min_pairs), len(pair_scores) + 1):
+        mean = statistics.fmean(pair_scores[:n])
+        half = z * statistics.stdev(pair_scores[:n]) / math.sqrt(n)
+        if mean - half > stop_at or mean + half < stop_at:
+            return n
+    return None
+
+
+WON, LOST, SPLIT = ((300, 200), (310, 250)), ((200, 300), (250, 310)), ((300, 200), (250, 310))
+
+
+def test_running_mean_interval():
+    values = [0.0, 0.5, 1.0, 1.0, 0.5, 0.0, 1.0]
+    stats = _RunningMean()
+    assert math.isnan(stats.mean)
+    assert stats.interval(Z95) == (float("-inf"), float("inf"))
+    for x in values:
+        stats.add(x)
+    assert stats.n == len(values)
+    assert math.isclose(stats.mean, statistics.fmean(values))
+    assert math.isclose(stats.variance, statistics.variance(values))
+    half = Z95 * statistics.stdev(values) / math.sqrt(len(values))
+    low, high = stats.interval(Z95)
+    assert math.isclose(low, stats.mean - half)
+    assert math.isclose(high, stats.mean + half)
+
+
+def test_running_mean_constant_stream_has_zero_width():
+    stats = _RunningMean()
+    for _ in range(5):
+        stats.add(0.5)
+    assert stats.variance == 0.0
+    assert stats.interval(Z95) == (0.5, 0.5)
+
+
+def test_duplicate_pair_statistics():
+    result, _ = _run_pairs([WON, LOST, SPLIT, WON])
+    assert result["pairs"] == 4
+    assert result["games"] == 8
+    assert (result["wins"], result["losses"], result["ties"]) == (5, 3, 0)
+    assert math.isclose(result["score_rate"], statistics.fmean([1.0, 0.0, 0.5, 1.0]))
+    margins = [(100 + 60) / 2, -(100 + 60) / 2, (100 - 60) / 2, (100 + 60) / 2]
+    assert math.isclose(result["margin"], statistics.fmean(margins))
+    assert not result["stopped_early"]
+
+
+def test_stop_at_waits_for_min_pairs():
+    # Every pair won: the interval is [1, 1] from the second pair on, but
+    # the run may not stop before min_pairs.
+    result, _ = _run_pairs([WON] * 50, stop_at=0.5, min_pairs=20)
+    assert result["pairs"] == 20
+    assert result["stopped_early"]
+
+
+def test_stop_at_waits_for_interval_to_exclude_threshold():
+    # Alternating wins and losses keep 0.5 inside the interval; the run
+    # stops only once the trailing wins pull the interval above it.
+    pairs = [WON, LOST] * 10 + [WON] * 40
+    scores = [1.0, 0.0] * 10 + [1.0] * 40
+    expected = _expected_stop(scores, 0.5, 5)
+    assert expected is not None and expected > 20
+    result, _ = _run_pairs(pairs, stop_at=0.5, min_pairs=5)
+    assert result["pairs"] == expected
+    assert result["stopped_early"]
+    assert result["score_rate_low"] > 0.5
+
+
+def test_stop_at_never_met_plays_every_pair():
+    result, calls = _run_pairs([WON, LOST] * 15, stop_at=0.5, min_pairs=5)
+    assert result["pairs"] == 30
+    assert sorted(calls) == list(range(1000, 1030))
+    assert not result["stopped_early"]
+
+
+def test_play_pair_swaps_seats_with_same_seed():
+    calls = []
+
+    def record(*args, **kwargs):
+        calls.append((args, kwargs))
+        return len(calls), 0
+
+    with mock.patch.object(evaluate, "_play_vs_baseline", record):
+        games = evaluate._play_pair("simple", "champion.pt", None, 42)
+    assert games == ((1, 0), (2, 0))
+    assert calls == [
+        (("simple", "champion.pt", 42), {"smart_first": True}),
+        (("simple", "champion.pt", 42), {"smart_first": False}),
+    ]
+
+    calls.clear()
+    with mock.patch.object(evaluate, "_play_candidate", record):
+        evaluate._play_pair("simple", "champion.pt", "candidate.pt", 7)
+    assert calls == [
+        (("champion.pt", "candidate.pt", 7), {"candidate_first": True}),
+        (("champion.pt", "candidate.pt", 7), {"candidate_first": False}),
+    ]
+
+
+def _decide(test, pattern, limit=10_000):
+    for i in range(limit):
+        test.add(pattern[i % len(pattern)])
+        if test.decision:
+            break
+    return test.decision
+
+
+def test_sprt_bounds():
+    test = _Sprt(0.5, 0.55, alpha=0.05, beta=0.1)
+    assert math.isclose(test.lower, math.log(0.1 / 0.95))
+    assert math.isclose(test.upper, math.log(0.9 / 0.05))
+    for p0, p1 in [(0.55, 0.5), (0.5, 0.5), (-0.1, 0.5), (0.5, 1.1)]:
+        try:
+            _Sprt(p0, p1)
+            raise AssertionError(f"expected p0={p0}, p1={p1} to be rejected")
+        except ValueError:
+            pass
+
+
+def test_sprt_llr_formula():
+    values = [1.0, 0.5, 0.0, 1.0, 1.0, 0.5]
+    test = _Sprt(0.5, 0.6)
+    for x in values:
+        test.add(x)
+    n = len(values)
+    expected = (0.6 - 0.5) * (sum(values) - n * (0.5 + 0.6) / 2) / statistics.variance(values)
+    assert math.isclose(test.llr, expected)
+
+
+def test_sprt_zero_variance_is_undecided():
+    test = _Sprt(0.5, 0.55)
+    assert test.llr == 0.0
+    test.add(1.0)
+    assert test.llr == 0.0  # one result: variance is nan
+    for _ in range(50):
+        test.add(1.0)
+    assert test.llr == 0.0
+    assert test.decision is None
+
+
+def test_sprt_accepts_good_and_rejects_bad():
+    assert _decide(_Sprt(0.5, 0.55), [1.0, 1.0, 0.5, 1.0, 0.0]) == "accept"
+    assert _decide(_Sprt(0.5, 0.55), [0.0, 0.0, 0.5, 0.0, 1.0]) == "reject"
+    # A stream right at p0 or p1 drifts to that hypothesis too.
+    assert _decide(_Sprt(0.5, 0.55), [1.0, 0.0]) == "reject"
+    assert _decide(_Sprt(0.45, 0.5), [1.0, 0.0]) == "accept"
+
+
+if __name__ == "__main__":
+    test_running_mean_interval()
+    test_running_mean_constant_stream_has_zero_width()
+    test_duplicate_pair_statistics()
+    test_stop_at_waits_for_min_pairs()
+    test_stop_at_waits_for_interval_to_exclude_threshold()
+    test_stop_at_never_met_plays_every_pair()
+    test_play_pair_swaps_seats_with_same_seed()
+    test_sprt_bounds()
+    test_sprt_llr_formula()
+    test_sprt_zero_variance_is_undecided()
+    test_sprt_accepts_good_and_rejects_bad()
+    print("All tests passed.")
@@ -0,0 +1,71 @@
+import os
+import sys
+import tempfile
+
+import torch
+
+from scrablozaur import Board, Dawg
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+sys.path.insert(0, os.path.join(ROOT, "smart_player"))
+
+from model import ALPHABET, INPUT_DIM, LeaveValueNet, encode_leave, get_engine_model  # noqa: E402
+from player import SmartPlayer  # noqa: E402
+
+WORDS_DIR = os.path.join(ROOT, "words")
+
+
+def _random_checkpoint(seed: int = 0) -> str:
+    """Save a small untrained LeaveValueNet the way train.py does."""
+    torch.manual_seed(seed)
+    net = LeaveValueNet(16, 8)
+    path = os.path.join(tempfile.mkdtemp(), "leave_value.pt")
+    torch.save(
+        {"state_dict": net.state_dict(), "alphabet": ALPHABET, "hidden1": 16, "hidden2": 8, "input_dim": INPUT_DIM},
+        path,
+    )
+    return path
+
+
+def _torch_values(path: str, leaves: list[str], unseen_tiles: int, features: tuple[float, ...]) -> list[float]:
+    ckpt = torch.load(path, map_location="cpu", weights_only=True)
+    net = LeaveValueNet(ckpt["hidden1"], ckpt["hidden2"])
+    net.load_state_dict(ckpt["state_dict"])
+    net.eval()
+    with torch.inference_mode():
+        x = torch.stack([encode_leave(leave, unseen_tiles, features) for leave in leaves])
+        return net(x).tolist()
+
+
+def test_engine_model_matches_torch_forward():
+    path = _random_checkpoint()
+    engine = get_engine_model(path)
+    leaves = ["", "a", "?", "ąęźż", "aaeiouy", "kot??", "rstwzcn"]
+
+    board = Board(seed=3)
+    board.place_word("hamulec", 7, 4, True)
+    for unseen_tiles, features in [(86, (1.0, 1.0, 1.0, 1.0, 0.0)), (41, board.features())]:
+        expected = _torch_values(path, leaves, unseen_tiles, features)
+        got = engine.evaluate(leaves, unseen_tiles, features)
+        assert len(got) == len(leaves)
+        for leave, e, g in zip(leaves, expected, got):
+            assert abs(e - g) <= 1e-4 * max(1.0, abs(e)), (leave, e, g)
+
+
+def test_native_smart_player_picks_the_same_move():
+    path = _random_checkpoint(1)
+    dawg = Dawg(os.path.join(WORDS_DIR, "dawg.bin"), os.path.join(WORDS_DIR, "gaddag.bin"))
+    board = Board(seed=11)
+    board.place_word("hamulec", 7, 4, True)
+    board.place_word("mak", 7, 6, False)
+    for rack in ["aeikrtz", "ąbcęnoy", "eio?sdw", "zzźżśćń"]:
+        torch_player = SmartPlayer(board, path, native=False)
+        native_player = SmartPlayer(board, path, native=True)
+        torch_player.letters = native_player.letters = rack
+        assert native_player.get_best_word(dawg, False) == torch_player.get_best_word(dawg, False), rack
+
+
+if __name__ == "__main__":
+    test_engine_model_matches_torch_forward()
+    test_native_smart_player_picks_the_same_move()
+    print("All tests passed.")
@@ -0,0 +1,37 @@
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from web.game import compute_move_rating  # noqa: E402
+
+
+def _session(stats):
+    """A stand-in session whose board reports the given get_score_stats."""
+    return SimpleNamespace(board=SimpleNamespace(get_score_stats=lambda dawg, letters: stats))
+
+
+def test_no_legal_play_rates_100():
+    assert compute_move_rating(_session((0, 0, 0, [])), None, "abc", 0) == 100
+
+
+def test_only_zero_point_plays_rate_100():
+    assert compute_move_rating(_session((3, 0, 0, [3])), None, "??", 0) == 100
+
+
+def test_rating_is_percentile_of_scoring_plays():
+    # Plays scoring 0, 0, 2, 4, 4, 10: the 0-point plays are left out.
+    stats = (6, 10, 0, [2, 0, 1, 0, 2, 0, 0, 0, 0, 0, 1])
+    assert compute_move_rating(_session(stats), None, "abc", 0) == 0
+    assert compute_move_rating(_session(stats), None, "abc", 2) == 25
+    assert compute_move_rating(_session(stats), None, "abc", 4) == 75
+    assert compute_move_rating(_session(stats), None, "abc", 10) == 100
+    assert compute_move_rating(_session(stats), None, "abc", 50) == 100
+
+
+if __name__ == "__main__":
+    test_no_legal_play_rates_100()
+    test_only_zero_point_plays_rate_100()
+    test_rating_is_percentile_of_scoring_plays()
+    print("All tests passed.")
@@ -0,0 +1,49 @@
+import os
+import sys
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "src"))
+os.chdir(ROOT)  # src/main.py loads words/*.bin relative to the repo root
+
+from main import graj  # noqa: E402
+from web import game  # noqa: E402
+from web.engine import DAWG_PATH, GADDAG_PATH  # noqa: E402
+
+SPECS = [("Alice", game.Difficulty.MEDIUM), ("Bob", game.Difficulty.HARD)]
+
+
+def test_graj_seed_replays_the_game():
+    first = graj("2", "1", seed=123)
+    again = graj("2", "1", seed=123)
+    # Scores, transcript and words played; CPU and move timings vary.
+    assert first[:3] == again[:3]
+    assert first[4] == again[4]
+    assert first[2]
+
+
+def test_graj_record_does_not_change_the_game():
+    recorded = graj("2", "1", seed=7)
+    silent = graj("2", "1", seed=7, record=False)
+    assert silent[:2] == recorded[:2]
+    assert silent[2] == ""
+    assert silent[4] == recorded[4]
+
+
+def test_simulate_game_record_does_not_change_the_game():
+    game._init_worker(str(DAWG_PATH), str(GADDAG_PATH))
+    for seed in (1, 2, 3):
+        recorded = game._simulate_game(SPECS, seed)
+        silent = game._simulate_game(SPECS, seed, record=False)
+        assert [p.score for p in silent.players] == [p.score for p in recorded.players]
+        assert silent.move_count == recorded.move_count == len(recorded.moves)
+        assert silent.words_played == recorded.words_played
+        assert silent.word_scores == recorded.word_scores
+        assert silent.moves == []
+
+
+if __name__ == "__main__":
+    test_graj_seed_replays_the_game()
+    test_graj_record_does_not_change_the_game()
+    test_simulate_game_record_does_not_change_the_game()
+    print("All tests passed.")
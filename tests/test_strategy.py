@@ -33,8 +33,29 @@ def test_exchange_letters():
     assert len(player.letters) == 7
 
 
+def test_place_move_keeps_blanks():
+    board = Board()
+    board.place_move(("kot", 3, (7, 7, True), ["k", "o", "?"]))
+    unseen = board.unseen_counts("")
+    full = Counter(board.fresh_tile_bag())
+    assert unseen["?"] == full["?"] - 1
+    assert unseen["t"] == full["t"]
+
+
+def test_rack_blanks_matches_scoring():
+    board = Board()
+    blanks = board.rack_blanks("kot", 7, 7, True, "ko?")
+    assert blanks == [2]
+    board.place_word("kot", 7, 7, True, blanks)
+    played = Board()
+    played.place_move(("kot", 3, (7, 7, True), ["k", "o", "?"]))
+    assert board.hash() == played.hash()
+
+
 if __name__ == "__main__":
     test_save_letters_left()
     test_save_letters_left_with_duplicates()
     test_exchange_letters()
+    test_place_move_keeps_blanks()
+    test_rack_blanks_matches_scoring()
     print("All tests passed.")
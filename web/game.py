@@ -1,11 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import random
 import sys
 import threading
 import time
 import uuid
-from collections import Counter
 from collections.abc import Callable
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass, field
@@ -83,12 +83,16 @@ TILE_COUNTS: dict[str, int] = {
 @dataclass
 class TileBag:
     tiles: list[str]
+    # Every shuffle goes through this, so a bag built from a seeded
+    # `random.Random` deals the same tiles on every run.
+    rng: random.Random = field(default_factory=random.Random, repr=False, compare=False)
 
     @classmethod
-    def full(cls) -> TileBag:
+    def full(cls, rng: random.Random | None = None) -> TileBag:
         bag = [letter for letter, count in TILE_COUNTS.items() for _ in range(count)]
-        random.shuffle(bag)
-        return cls(tiles=bag)
+        rng = rng or random.Random()
+        rng.shuffle(bag)
+        return cls(tiles=bag, rng=rng)
 
     def draw(self, n: int) -> list[str]:
         n = min(n, len(self.tiles))
@@ -99,7 +103,7 @@ class TileBag:
         """Return `return_tiles` to the bag, shuffle, then draw the same
         count of new tiles. Caller must check Board.can_exchange first."""
         self.tiles.extend(return_tiles)
-        random.shuffle(self.tiles)
+        self.rng.shuffle(self.tiles)
         return self.draw(len(return_tiles))
 
     def remaining(self) -> int:
@@ -128,6 +132,7 @@ class Player:
 @dataclass
 class UndoEntry:
     board_grid: list[list[str]]
+    blank_cells: list[tuple[int, int]]
     player_scores: list[int]
     player_letters: list[str]
     current_player_idx: int
@@ -156,6 +161,13 @@ class GameSession:
     consecutive_no_play: int = 0
     passed_players: set[int] = field(default_factory=set)
     last_move_rating: int | None = None
+    # Source of the game's random choices (the bag's shuffles and the
+    # computer's difficulty-weighted picks); seeded for reproducible games.
+    rng: random.Random = field(default_factory=random.Random, repr=False, compare=False)
+    # Held by every request on this game: the routers run engine work on
+    # worker threads, so without it two requests could interleave their
+    # changes (or touch `board` from two threads at once).
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False, compare=False)
 
     @property
     def current_player(self) -> Player:
@@ -166,12 +178,13 @@ class GameSession:
         self.move_number += 1
 
     def board_grid(self) -> list[list[str]]:
-        return [row.split(" ") for row in str(self.board).strip().split("\n")]
+        return self.board.grid()
 
     def push_undo(self) -> None:
         self.move_history.append(
             UndoEntry(
                 board_grid=self.board_grid(),
+                blank_cells=self.board.blank_cells(),
                 player_scores=[p.score for p in self.players],
                 player_letters=[p.letters for p in self.players],
                 current_player_idx=self.current_player_idx,
@@ -188,7 +201,7 @@ class GameSession:
         if not self.move_history:
             return False
         entry = self.move_history.pop()
-        self.board = Board.from_grid(entry.board_grid)
+        self.board = Board.from_grid(entry.board_grid, entry.blank_cells)
         for i, p in enumerate(self.players):
             p.score = entry.player_scores[i]
             p.letters = entry.player_letters[i]
@@ -219,11 +232,13 @@ _DEFAULT_PLAYERS = [
 ]
 
 
-def _deal_new_game(players: list[Player], game_mode: GameMode) -> GameSession:
+def _deal_new_game(players: list[Player], game_mode: GameMode, seed: int | None = None) -> GameSession:
     """Build a fresh GameSession for *players*, dealing a real bag + random
     racks for the modes that use one. Shared by SessionStore.create (a real,
     registered game) and run_benchmark (ephemeral simulated games that never
-    touch the session store)."""
+    touch the session store). A *seed* makes the deal, and every later random
+    choice of the session, reproducible."""
+    rng = random.Random(seed)
     tile_bag: TileBag | None = None
     first_player_idx = 0
 
@@ -231,14 +246,14 @@ def _deal_new_game(players: list[Player], game_mode: GameMode) -> GameSession:
     # both play with a real bag and random racks -- only the referee-style
     # plain SANDBOX mode has no bag at all.
     if game_mode in (GameMode.COMPETITIVE, GameMode.SANDBOX_AUTO):
-        tile_bag = TileBag.full()
+        tile_bag = TileBag.full(rng)
         # Standard rule: each player draws one tile, closest to 'A'
         # (blank beats everything) goes first; drawn tiles go back to
         # the bag and get reshuffled in before dealing real racks.
         draws = tile_bag.draw(len(players))
         first_player_idx = Board.first_draw_winner(draws)
         tile_bag.tiles.extend(draws)
-        random.shuffle(tile_bag.tiles)
+        rng.shuffle(tile_bag.tiles)
         for p in players:
             p.letters = "".join(tile_bag.draw(7))
 
@@ -249,6 +264,7 @@ def _deal_new_game(players: list[Player], game_mode: GameMode) -> GameSession:
         current_player_idx=first_player_idx,
         game_mode=game_mode,
         tile_bag=tile_bag,
+        rng=rng,
     )
 
 
@@ -400,7 +416,7 @@ def _check_game_over(session: GameSession, just_played_idx: int) -> None:
         session.game_over = True
 
 
-def _pick_by_difficulty(suggestions: list[dict], difficulty: Difficulty) -> dict:
+def _pick_by_difficulty(suggestions: list[dict], difficulty: Difficulty, rng: random.Random) -> dict:
     """Weighted-random choice: lower difficulty → higher weight for worse moves."""
     if difficulty == Difficulty.IMPOSSIBLE or len(suggestions) == 1:
         return suggestions[0]
@@ -409,7 +425,7 @@ def _pick_by_difficulty(suggestions: list[dict], difficulty: Difficulty) -> dict
     best, worst = max(scores), min(scores)
 
     if best == worst:
-        return random.choice(suggestions)
+        return rng.choice(suggestions)
 
     # Normalise each score to [0, 1] relative to range (0 = worst, 1 = best)
     norm = [(s - worst) / (best - worst) for s in scores]
@@ -427,16 +443,14 @@ def _pick_by_difficulty(suggestions: list[dict], difficulty: Difficulty) -> dict
     else:  # HARD
         weights = [v**3 + 0.02 for v in norm]
 
-    return random.choices(suggestions, weights=weights, k=1)[0]
+    return rng.choices(suggestions, weights=weights, k=1)[0]
 
 
 def _unseen_tile_count(session: GameSession, rack: str) -> int:
     """Tiles not yet on the board or in this player's own hand -- still in
-    the bag or an opponent's rack. Mirrors StrategicPlayer.get_letters_left
-    (src/strategy.py), the feature the leave-value model was trained on."""
-    board_letters = [ch for grid_row in session.board_grid() for ch in grid_row if ch != "-"]
-    seen = Counter(board_letters) + Counter(rack)
-    return sum((Counter(Board.fresh_tile_bag()) - seen).values())
+    the bag or an opponent's rack. The same count smart_player's players use
+    (`Board.unseen_total`), the feature the leave-value model was trained on."""
+    return session.board.unseen_total(rack)
 
 
 def _pick_smart(session: GameSession, suggestions: list[dict]) -> dict:
@@ -487,12 +501,17 @@ def computer_auto_play(session: GameSession, dawg: Dawg) -> ComputerMoveInfo:
             session.advance_turn()
         return ComputerMoveInfo(word="", score=0, row=0, col=0, horizontal=True, passed=True)
 
-    sug = _pick_smart(session, suggestions) if difficulty == Difficulty.SMART else _pick_by_difficulty(suggestions, difficulty)
+    sug = (
+        _pick_smart(session, suggestions)
+        if difficulty == Difficulty.SMART
+        else _pick_by_difficulty(suggestions, difficulty, session.rng)
+    )
     word, row, col, horizontal = sug["word"], sug["row"], sug["col"], sug["horizontal"]
 
     grid = session.board_grid()
     session.record_placement(word, row, col, horizontal, player_idx)
-    session.board.place_word(word, row, col, horizontal)
+    blanks = session.board.rack_blanks(word, row, col, horizontal, session.current_player.letters)
+    session.board.place_word(word, row, col, horizontal, blanks)
     session.current_player.score += sug["score"]
     session.is_first_move = False
 
@@ -510,107 +529,56 @@ def computer_auto_play(session: GameSession, dawg: Dawg) -> ComputerMoveInfo:
 
 
 def get_suggestions(session: GameSession, dawg: Dawg, n: int = 10) -> list[dict]:
-    letters = session.current_player.letters
-    if not letters:
-        return []
-    if session.is_first_move:
-        return _first_move_suggestions(session.board, dawg, letters, n)
-    return _subsequent_suggestions(session.board, dawg, letters, n)
-
-
-def _first_move_suggestions(board: Board, dawg: Dawg, letters: str, n: int) -> list[dict]:
-    candidates: list[dict] = []
-    seen: set[tuple[str, int, int, bool]] = set()
-
-    for word in dawg.search("*", letters):
-        word_len = len(word)
-        for offset in range(min(7, word_len)):
-            col = 7 - offset
-            if col + word_len - 1 > 14:
-                continue
-            key = (word, 7, col, True)
-            if key in seen:
-                continue
-            seen.add(key)
-            try:
-                score = board.calculate_word_points(word, 7, col, True, letters)
-                if score > 0:
-                    candidates.append(
-                        {
-                            "word": word,
-                            "score": score,
-                            "row": 7,
-                            "col": col,
-                            "horizontal": True,
-                            "cells": [(7, col + i) for i in range(word_len)],
-                        }
-                    )
-            except Exception:
-                pass
-
-    candidates.sort(key=lambda x: -x["score"])
-    return candidates[:n]
-
-
-def _subsequent_suggestions(board: Board, dawg: Dawg, letters: str, n: int) -> list[dict]:
-    candidates: list[dict] = []
-    seen: set[tuple[str, int, int, bool]] = set()
-
-    for index, start, end, horizontal in board.get_all_patterns():
-        row, col = (index, start) if horizontal else (start, index)
-        word = board.best_word_from_pattern(dawg, row, col, end, horizontal, letters)
-        if not word:
-            continue
-        key = (word, row, col, horizontal)
-        if key in seen:
-            continue
-        seen.add(key)
-        try:
-            score = board.calculate_word_points(word, row, col, horizontal, letters)
-            if score <= 0:
-                continue
-            word_len = len(word)
-            cells = (
-                [(row, col + i) for i in range(word_len)] if horizontal else [(row + i, col) for i in range(word_len)]
-            )
-            candidates.append(
-                {
-                    "word": word,
-                    "score": score,
-                    "row": row,
-                    "col": col,
-                    "horizontal": horizontal,
-                    "cells": cells,
-                }
-            )
-        except Exception:
-            pass
-
-    candidates.sort(key=lambda x: -x["score"])
-    return candidates[:n]
+    return suggest_moves(session.board, dawg, session.current_player.letters, n)
 
 
 def get_suggestions_for_letters(session: GameSession, dawg: Dawg, letters: str, n: int = 10) -> list[dict]:
     """Like get_suggestions but uses the supplied letters instead of current player's rack."""
+    return suggest_moves(session.board, dawg, letters, n)
+
+
+def suggest_moves(board: Board, dawg: Dawg, letters: str, n: int) -> list[dict]:
+    """The *n* best plays for *letters* on *board*, best first, as suggestion
+    dicts: word, score, placement and the cells the word covers.
+
+    A single engine call -- `get_best_words` enumerates every legal play
+    through the GADDAG (the opening search while the board is empty), scores
+    each one exactly and never yields the same placement twice, with the GIL
+    released throughout."""
     if not letters:
         return []
-    if session.is_first_move:
-        return _first_move_suggestions(session.board, dawg, letters, n)
-    return _subsequent_suggestions(session.board, dawg, letters, n)
+    return [
+        {
+            "word": word,
+            "score": score,
+            "row": row,
+            "col": col,
+            "horizontal": horizontal,
+            "cells": _word_cells(row, col, horizontal, len(word)),
+        }
+        for word, score, (row, col, horizontal), _used in board.get_best_words(dawg, letters, n)
+        if score > 0
+    ]
+
+
+def _word_cells(row: int, col: int, horizontal: bool, length: int) -> list[tuple[int, int]]:
+    if horizontal:
+        return [(row, col + i) for i in range(length)]
+    return [(row + i, col) for i in range(length)]
 
 
 def compute_move_rating(session: GameSession, dawg: Dawg, letters: str, actual_score: int) -> int:
-    """Rate actual_score 0–100 relative to best and worst possible scores with *letters*."""
-    all_moves = get_suggestions_for_letters(session, dawg, letters, n=999)
-    if not all_moves:
+    """Rate actual_score 0–100 as its percentile among every scoring play with *letters*:
+    the share of plays scoring no more than it, from the engine's score histogram.
+    0-point plays (blanks only) are left out so they do not pad the bottom of the scale."""
+    count, _best, _worst, histogram = session.board.get_score_stats(dawg, letters)
+    if not histogram:  # no legal play at all
         return 100
-    scores = [m["score"] for m in all_moves]
-    best = max(scores)
-    worst = min(scores)
-    if best == worst:
+    count -= histogram[0]
+    if count == 0:
         return 100
-    rating = (actual_score - worst) / (best - worst) * 100
-    return max(0, min(100, round(rating)))
+    at_most = sum(histogram[1 : max(0, actual_score) + 1])
+    return max(0, min(100, round(at_most / count * 100)))
 
 
 # ── Benchmark simulation (SANDBOX_AUTO, no human ever involved) ──────────────
@@ -680,9 +648,19 @@ class BenchmarkResult:
 
 @dataclass
 class _SimulatedGame:
+    """One game's result as sent back from a benchmark worker: final players
+    and per-player word totals, plus the move-by-move record only when it
+    was asked for (the best game's replay) -- a board snapshot per move is
+    most of the pickling cost otherwise."""
+
     players: list[Player]
     moves: list[BenchmarkMoveRecord]
     move_count: int
+    words_played: list[int]
+    word_scores: list[int]
+    longest_word: str | None = None
+    longest_word_score: int = 0
+    highest_move_score: int = 0
 
 
 # Each simulated game runs in its own process (games are independent, so this
@@ -690,7 +668,9 @@ class _SimulatedGame:
 # can't be pickled across the process boundary, so instead of passing one in,
 # every worker loads its own copy once at startup and keeps it in a
 # process-local global -- mirrors how src/main.py's `benchmark` gets a fresh
-# `d = Dawg(...)` per worker for free via module re-import under spawn.
+# `d = Dawg(...)` per worker for free via module re-import under spawn. The
+# graph files are memory-mapped, so each "copy" is just a view of the same
+# page-cache pages, and loading one costs a header check, not a decode.
 _worker_dawg: Dawg | None = None
 
 
@@ -699,18 +679,29 @@ def _init_worker(dawg_path: str, gaddag_path: str) -> None:
     _worker_dawg = Dawg(dawg_path, gaddag_path)
 
 
-def _simulate_game(player_specs: list[tuple[str, Difficulty]]) -> _SimulatedGame:
+def _simulate_game(
+    player_specs: list[tuple[str, Difficulty]], seed: int | None = None, record: bool = True
+) -> _SimulatedGame:
     assert _worker_dawg is not None, "worker executor initializer did not run"
     players = [Player(name=name, is_computer=True, difficulty=difficulty) for name, difficulty in player_specs]
-    session = _deal_new_game(players, GameMode.SANDBOX_AUTO)
+    session = _deal_new_game(players, GameMode.SANDBOX_AUTO, seed)
+    sim = _SimulatedGame(
+        players=players, moves=[], move_count=0, words_played=[0] * len(players), word_scores=[0] * len(players)
+    )
 
-    moves: list[BenchmarkMoveRecord] = []
-    move_count = 0
-    while not session.game_over and move_count < MAX_BENCHMARK_GAME_MOVES:
+    while not session.game_over and sim.move_count < MAX_BENCHMARK_GAME_MOVES:
         player_idx = session.current_player_idx
         move = computer_auto_play(session, _worker_dawg)
-        move_count += 1
-        moves.append(
+        sim.move_count += 1
+        if not move.passed:
+            sim.words_played[player_idx] += 1
+            sim.word_scores[player_idx] += move.score
+            sim.highest_move_score = max(sim.highest_move_score, move.score)
+            if sim.longest_word is None or len(move.word) > len(sim.longest_word):
+                sim.longest_word, sim.longest_word_score = move.word, move.score
+        if not record:
+            continue
+        sim.moves.append(
             BenchmarkMoveRecord(
                 player_idx=player_idx,
                 word=move.word,
@@ -726,7 +717,7 @@ def _simulate_game(player_specs: list[tuple[str, Difficulty]]) -> _SimulatedGame
             )
         )
 
-    return _SimulatedGame(players=players, moves=moves, move_count=move_count)
+    return sim
 
 
 # Lazily-created, process-lifetime pool shared by every benchmark run so
@@ -750,6 +741,7 @@ def run_benchmark(
     player_specs: list[tuple[str, Difficulty]],
     games: int,
     on_game_done: Callable[[int], None] | None = None,
+    seed: int | None = None,
 ) -> BenchmarkResult:
     """Simulate *games* full SANDBOX_AUTO games with the given (name,
     difficulty) players end-to-end using the same engine primitives as a
@@ -757,31 +749,39 @@ def run_benchmark(
     SessionStore. Games are independent, so they're farmed out across a
     process pool (see _get_executor) instead of run one at a time. Returns
     aggregate per-player stats plus the full move-by-move detail of whichever
-    single game had the highest final score for any one player."""
+    single game had the highest final score for any one player (the earliest
+    such game on a tie). With a *seed*, game i is dealt from seed + i, so the
+    same seed reproduces the same result.
+
+    Workers return only per-game totals; every game is seeded (from a random
+    base without *seed*), so the best game's detail comes from replaying its
+    seed once at the end rather than recording every game."""
     start = time.perf_counter()
     stats = [BenchmarkPlayerStats(name=name, difficulty=difficulty.value) for name, difficulty in player_specs]
     best_game: BenchmarkBestGame | None = None
     best_score = -1
+    best_winner = ""
     total_moves = 0
     longest_word: str | None = None
     longest_word_score = 0
     highest_single_move_score = 0
 
+    if seed is None:
+        seed = random.randrange(2**32)
     executor = _get_executor()
-    futures = [executor.submit(_simulate_game, player_specs) for _ in range(games)]
+    futures = {executor.submit(_simulate_game, player_specs, seed + i, False): i for i in range(games)}
+    best_index = games
     for done, future in enumerate(as_completed(futures), start=1):
         sim = future.result()
-        players, moves = sim.players, sim.moves
+        players = sim.players
         total_moves += sim.move_count
 
-        for move in moves:
-            if not move.passed:
-                s = stats[move.player_idx]
-                s.words_played += 1
-                s.total_word_score += move.score
-                highest_single_move_score = max(highest_single_move_score, move.score)
-                if longest_word is None or len(move.word) > len(longest_word):
-                    longest_word, longest_word_score = move.word, move.score
+        for s, words, word_score in zip(stats, sim.words_played, sim.word_scores):
+            s.words_played += words
+            s.total_word_score += word_score
+        highest_single_move_score = max(highest_single_move_score, sim.highest_move_score)
+        if sim.longest_word is not None and (longest_word is None or len(sim.longest_word) > len(longest_word)):
+            longest_word, longest_word_score = sim.longest_word, sim.longest_word_score
 
         top_score = max(p.score for p in players)
         winners = [p for p in players if p.score == top_score]
@@ -800,18 +800,24 @@ def run_benchmark(
                 else:
                     s.wins += 1
 
-        if top_score > best_score:
-            best_score = top_score
-            best_game = BenchmarkBestGame(
-                winner_name=winners[0].name if len(winners) == 1 else "Remis",
-                winner_score=top_score,
-                final_players=list(players),
-                moves=moves,
-            )
+        # Ties go to the lowest game index, not whichever finished first.
+        index = futures[future]
+        if top_score > best_score or (top_score == best_score and index < best_index):
+            best_score, best_index = top_score, index
+            best_winner = winners[0].name if len(winners) == 1 else "Remis"
 
         if on_game_done:
             on_game_done(done)
 
+    if best_index < games:
+        replay = executor.submit(_simulate_game, player_specs, seed + best_index).result()
+        best_game = BenchmarkBestGame(
+            winner_name=best_winner,
+            winner_score=best_score,
+            final_players=list(replay.players),
+            moves=replay.moves,
+        )
+
     duration_ms = int((time.perf_counter() - start) * 1000)
     return BenchmarkResult(
         games_played=games,
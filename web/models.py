@@ -63,6 +63,7 @@ class BenchmarkPlayerConfig(BaseModel):
 class BenchmarkRequest(BaseModel):
     players: list[BenchmarkPlayerConfig] = Field(..., min_length=2, max_length=4)
     games: int = Field(20, ge=1)
+    seed: int | None = None
 
 
 # ── Responses ─────────────────────────────────────────────────────────────────
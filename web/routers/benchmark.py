@@ -23,13 +23,13 @@ _jobs: "OrderedDict[str, dict[str, Any]]" = OrderedDict()
 _jobs_lock = threading.Lock()
 
 
-def _run_job(job_id: str, player_specs: list[tuple[str, Difficulty]], games: int) -> None:
+def _run_job(job_id: str, player_specs: list[tuple[str, Difficulty]], games: int, seed: int | None) -> None:
     def on_game_done(done: int) -> None:
         with _jobs_lock:
             _jobs[job_id]["games_done"] = done
 
     try:
-        result = run_benchmark(player_specs, games, on_game_done=on_game_done)
+        result = run_benchmark(player_specs, games, on_game_done=on_game_done, seed=seed)
         with _jobs_lock:
             _jobs[job_id]["status"] = "done"
             _jobs[job_id]["result"] = result
@@ -55,7 +55,7 @@ async def start_benchmark(body: BenchmarkRequest) -> BenchmarkJobStartResponse:
             _jobs.popitem(last=False)
 
     threading.Thread(
-        target=_run_job, args=(job_id, player_specs, body.games), daemon=True
+        target=_run_job, args=(job_id, player_specs, body.games, body.seed), daemon=True
     ).start()
     return BenchmarkJobStartResponse(job_id=job_id)
 
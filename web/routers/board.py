@@ -5,6 +5,7 @@ import urllib.parse
 import urllib.request
 
 from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 
 from web.engine import Dawg, get_dawg
 from web.game import (GameMode, _check_game_over, _deduct_tiles, _refill_rack,
@@ -48,6 +49,14 @@ def _check_connectivity(session, word: str, row: int, col: int, horizontal: bool
     raise ValueError("Słowo musi być połączone z już istniejącym słowem na planszy.")
 
 
+# Engine calls (move generation, scoring, the SMART player's model) release
+# the GIL, so each handler below runs its game logic on Starlette's worker
+# thread pool instead of the event loop: one long computer move no longer
+# stalls every other request, and separate games generate moves in parallel.
+# The session's lock keeps two requests for the same game from interleaving --
+# a `Board` must not be used from two threads at once.
+
+
 @router.post("/human-move", response_model=BoardStateResponse)
 async def place_human_word(
     body: PlaceHumanWordRequest,
@@ -55,6 +64,11 @@ async def place_human_word(
     dawg: Dawg = Depends(get_dawg),
 ) -> BoardStateResponse:
     session = _require_session(request)
+    async with session.lock:
+        return await run_in_threadpool(_place_human_word, session, body, dawg)
+
+
+def _place_human_word(session, body: PlaceHumanWordRequest, dawg: Dawg) -> BoardStateResponse:
     word = body.word.lower()
 
     if not dawg.contains(word):
@@ -100,7 +114,10 @@ async def place_human_word(
 
     session.push_undo()
     session.record_placement(word, body.row, body.col, body.horizontal, session.current_player_idx)
-    session.board.place_word(word, body.row, body.col, body.horizontal)
+    # Tiles the rack can only cover with a blank stay blanks on the board,
+    # matching how they were just scored.
+    blanks = session.board.rack_blanks(word, body.row, body.col, body.horizontal, letters_for_scoring)
+    session.board.place_word(word, body.row, body.col, body.horizontal, blanks)
     session.current_player.score += score
     session.is_first_move = False
 
@@ -128,6 +145,11 @@ async def skip_turn(
     Scrabble "pass". The game only ends once nobody has played a word for
     CONSECUTIVE_NO_PLAY_LIMIT turns in a row, not after a single skip."""
     session = _require_session(request)
+    async with session.lock:
+        return await run_in_threadpool(_skip_turn, session, dawg)
+
+
+def _skip_turn(session, dawg: Dawg) -> BoardStateResponse:
     if session.game_over:
         raise HTTPException(status_code=400, detail="Gra już się zakończyła.")
     session.push_undo()
@@ -153,6 +175,11 @@ async def next_auto_move(
     is a computer, so this is the only kind of turn it has. The live
     auto-play UI calls this once per step, or repeatedly for autoplay."""
     session = _require_session(request)
+    async with session.lock:
+        return await run_in_threadpool(_next_auto_move, session, dawg)
+
+
+def _next_auto_move(session, dawg: Dawg) -> BoardStateResponse:
     if session.game_mode != GameMode.SANDBOX_AUTO:
         raise HTTPException(status_code=400, detail="Dostępne tylko w trybie automatycznym.")
     if session.game_over:
@@ -176,6 +203,11 @@ async def exchange_tiles(
     CONSECUTIVE_NO_PLAY_LIMIT, so a player can exchange as many turns in a
     row as they want without that alone ending the game."""
     session = _require_session(request)
+    async with session.lock:
+        return await run_in_threadpool(_exchange_tiles, session, body, dawg)
+
+
+def _exchange_tiles(session, body: ExchangeTilesRequest, dawg: Dawg) -> BoardStateResponse:
     if session.game_over:
         raise HTTPException(status_code=400, detail="Gra już się zakończyła.")
     if session.game_mode != GameMode.COMPETITIVE or not session.tile_bag:
@@ -214,26 +246,28 @@ async def pass_turn(request: Request) -> BoardStateResponse:
     all humans resign, the game ends. Not to be confused with a standard
     pass, which never ends the game after just one turn."""
     session = _require_session(request)
-    if session.game_over:
-        raise HTTPException(status_code=400, detail="Gra już się zakończyła.")
+    async with session.lock:
+        if session.game_over:
+            raise HTTPException(status_code=400, detail="Gra już się zakończyła.")
 
-    session.passed_players.add(session.current_player_idx)
-    human_idxs = {i for i, p in enumerate(session.players) if not p.is_computer}
+        session.passed_players.add(session.current_player_idx)
+        human_idxs = {i for i, p in enumerate(session.players) if not p.is_computer}
 
-    if human_idxs <= session.passed_players:
-        session.game_over = True
-    else:
-        session.advance_turn()
+        if human_idxs <= session.passed_players:
+            session.game_over = True
+        else:
+            session.advance_turn()
 
-    return _state_response(session)
+        return _state_response(session)
 
 
 @router.post("/undo", response_model=BoardStateResponse)
 async def undo_move(request: Request) -> BoardStateResponse:
     session = _require_session(request)
-    if not session.pop_undo():
-        raise HTTPException(status_code=400, detail="Brak ruchów do cofnięcia.")
-    return _state_response(session)
+    async with session.lock:
+        if not session.pop_undo():
+            raise HTTPException(status_code=400, detail="Brak ruchów do cofnięcia.")
+        return _state_response(session)
 
 
 # ── Sandbox-only endpoints ────────────────────────────────────────────────────
@@ -244,10 +278,11 @@ async def set_computer_letters(
     request: Request,
 ) -> BoardStateResponse:
     session = _require_session(request)
-    if session.game_mode != GameMode.SANDBOX:
-        raise HTTPException(status_code=400, detail=_SANDBOX_ONLY)
-    session.current_player.letters = body.letters.lower()
-    return _state_response(session)
+    async with session.lock:
+        if session.game_mode != GameMode.SANDBOX:
+            raise HTTPException(status_code=400, detail=_SANDBOX_ONLY)
+        session.current_player.letters = body.letters.lower()
+        return _state_response(session)
 
 
 @router.post("/suggest", response_model=SuggestionsResponse)
@@ -258,7 +293,8 @@ async def suggest_moves(
     session = _require_session(request)
     if session.game_mode != GameMode.SANDBOX:
         raise HTTPException(status_code=400, detail=_SANDBOX_ONLY)
-    raw = get_suggestions(session, dawg, n=10)
+    async with session.lock:
+        raw = await run_in_threadpool(get_suggestions, session, dawg, 10)
     suggestions = [Suggestion(**s) for s in raw]
     return SuggestionsResponse(suggestions=suggestions, letters=session.current_player.letters)
 
@@ -271,8 +307,9 @@ async def get_hints(
     session = _require_session(request)
     if session.game_mode != GameMode.COMPETITIVE:
         raise HTTPException(status_code=400, detail="Podpowiedzi dostępne tylko w trybie rywalizacji.")
-    letters = session.current_player.letters
-    raw = get_suggestions_for_letters(session, dawg, letters, n=20)
+    async with session.lock:
+        letters = session.current_player.letters
+        raw = await run_in_threadpool(get_suggestions_for_letters, session, dawg, letters, 20)
     suggestions = [Suggestion(**s) for s in raw]
     return SuggestionsResponse(suggestions=suggestions, letters=letters)
 
@@ -284,6 +321,11 @@ async def place_computer_word(
     dawg: Dawg = Depends(get_dawg),
 ) -> BoardStateResponse:
     session = _require_session(request)
+    async with session.lock:
+        return await run_in_threadpool(_place_computer_word, session, body, dawg)
+
+
+def _place_computer_word(session, body: PlaceComputerWordRequest, dawg: Dawg) -> BoardStateResponse:
     if session.game_mode != GameMode.SANDBOX:
         raise HTTPException(status_code=400, detail=_SANDBOX_ONLY)
 
@@ -304,7 +346,8 @@ async def place_computer_word(
     grid = session.board_grid()
     session.push_undo()
     session.record_placement(word, body.row, body.col, body.horizontal, session.current_player_idx)
-    session.board.place_word(word, body.row, body.col, body.horizontal)
+    blanks = session.board.rack_blanks(word, body.row, body.col, body.horizontal, session.current_player.letters)
+    session.board.place_word(word, body.row, body.col, body.horizontal, blanks)
     session.current_player.score += score
     session.is_first_move = False
 
@@ -330,6 +373,11 @@ async def preview_score(
     dawg: Dawg = Depends(get_dawg),
 ) -> PreviewScoreResponse:
     session = _require_session(request)
+    async with session.lock:
+        return await run_in_threadpool(_preview_score, session, body, dawg)
+
+
+def _preview_score(session, body: PlaceHumanWordRequest, dawg: Dawg) -> PreviewScoreResponse:
     word = body.word.lower()
 
     if not dawg.contains(word):
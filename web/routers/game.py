@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
 
 from web.engine import Dawg, get_dawg
 from web.game import Difficulty, GameMode, GameSession, Player, SessionStore, computer_auto_play
@@ -112,14 +113,17 @@ def _play_opening_computer_move(session: GameSession, dawg: Dawg) -> None:
 async def new_game(body: NewGameRequest, response: Response, dawg: Dawg = Depends(get_dawg)) -> BoardStateResponse:
     players = _players_from_request(body)
     session = SessionStore.create(players, game_mode=GameMode(body.game_mode))
-    _play_opening_computer_move(session, dawg)
-    _set_session_cookie(response, session.session_id)
-    return _state_response(session)
+    async with session.lock:
+        await run_in_threadpool(_play_opening_computer_move, session, dawg)
+        _set_session_cookie(response, session.session_id)
+        return _state_response(session)
 
 
 @router.get("/state", response_model=BoardStateResponse)
 async def get_state(request: Request) -> BoardStateResponse:
-    return _state_response(_require_session(request))
+    session = _require_session(request)
+    async with session.lock:
+        return _state_response(session)
 
 
 @router.post("/reset", response_model=BoardStateResponse)
@@ -131,9 +135,10 @@ async def reset_game(
         SessionStore.delete(sid)
     players = _players_from_request(body)
     session = SessionStore.create(players, game_mode=GameMode(body.game_mode))
-    _play_opening_computer_move(session, dawg)
-    _set_session_cookie(response, session.session_id)
-    return _state_response(session)
+    async with session.lock:
+        await run_in_threadpool(_play_opening_computer_move, session, dawg)
+        _set_session_cookie(response, session.session_id)
+        return _state_response(session)
 
 
 def _require_session(request: Request) -> GameSession:
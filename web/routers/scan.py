@@ -5,9 +5,10 @@ import tempfile
 from pathlib import Path
 
 from fastapi import APIRouter, Depends, File, Form, HTTPException, Request, Response, UploadFile
+from fastapi.concurrency import run_in_threadpool
 
 from web.engine import Board, Dawg, get_dawg
-from web.game import _first_move_suggestions, _subsequent_suggestions
+from web.game import suggest_moves
 from web.models import (
     SaveTrainingResponse,
     ScanBoardResponse,
@@ -170,8 +171,8 @@ async def suggest_for_scan(
 
     letters = body.letters.lower()
     board = Board.from_grid(session.board)
-    fn = _first_move_suggestions if board_is_empty(session.board) else _subsequent_suggestions
-    raw = fn(board, dawg, letters, 10)
+    # Off the event loop: the engine releases the GIL while it searches.
+    raw = await run_in_threadpool(suggest_moves, board, dawg, letters, 10)
     suggestions = [Suggestion(**s) for s in raw]
     return SuggestionsResponse(suggestions=suggestions, letters=letters)
 